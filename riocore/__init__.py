@@ -4,15 +4,16 @@ import importlib
 import json
 import os
 import re
-import shutil
-from struct import pack, unpack
 import sys
+import time
 import traceback
 
-from .generator.Gateware import Gateware
-from .generator.Simulator import Simulator
-from .generator.Firmware import Firmware
-from .generator.LinuxCNC import LinuxCNC
+from . import interfaces
+from .capture import CaptureTransport
+from .codec import FrameCodec
+from .index import index as metadata_index
+from .layout import InterfaceLayout
+from .stats import LinkStats
 
 riocore_path = os.path.dirname(__file__)
 
@@ -29,6 +30,10 @@ class Plugins:
             plugins.append({"name": plugin_name, "path": plugin_path})
         return plugins
 
+    def metadata(self, plugin_name):
+        # NAME, TYPE, INFO, OPTIONS, PINDEFAULTS, ... of a plugin, from the metadata index
+        return metadata_index.plugin(plugin_name)
+
     def info(self, plugin_name):
         output = []
         self.load_plugins({"plugins": [{"type": plugin_name}]})
@@ -474,13 +479,14 @@ class Project:
         self.timestamp = 0
         self.timestamp_last = 0
         self.duration = 0
+        self.stats = None
         self.load_config(configuration, output_path)
         self.plugin_instances = plugins.load_plugins(self.config, system_setup=self.config)
         self.calc_buffersize()
-        self.generator_linuxcnc = LinuxCNC(self)
-        self.generator_gateware = Gateware(self)
-        self.generator_simulator = Simulator(self)
-        self.generator_firmware = Firmware(self)
+        self.calc_signal_index()
+        self.calc_conversion_plan()
+        # the generators are imported and created on first use, runtime-only tools never load them
+        self.generators = {}
 
         # check names
         varnames = {}
@@ -492,6 +498,28 @@ class Project:
                 else:
                     print(f"ERROR: varname allready exist: {varname} ({plugin_instance.instances_name} / {varnames[varname]})")
 
+    def generator_get(self, name):
+        if name not in self.generators:
+            module = importlib.import_module(f".generator.{name}", "riocore")
+            self.generators[name] = getattr(module, name)(self)
+        return self.generators[name]
+
+    @property
+    def generator_linuxcnc(self):
+        return self.generator_get("LinuxCNC")
+
+    @property
+    def generator_gateware(self):
+        return self.generator_get("Gateware")
+
+    @property
+    def generator_simulator(self):
+        return self.generator_get("Simulator")
+
+    @property
+    def generator_firmware(self):
+        return self.generator_get("Firmware")
+
     def get_path(self, path):
         if os.path.exists(path):
             return path
@@ -552,8 +580,7 @@ class Project:
         if board:
             print(f"loading board setup: {board}")
             board_file = self.get_boardpath(board)
-            bdata = open(board_file, "r").read()
-            project["board_data"] = json.loads(bdata)
+            project["board_data"] = metadata_index.json_file(board_file)
             if "name" in project["board_data"]:
                 project["board"] = project["board_data"]["name"]
             for key, value in project["board_data"].items():
@@ -563,13 +590,9 @@ class Project:
         if "flashcmd" in project["jdata"]:
             project["flashcmd"] = project["jdata"]["flashcmd"]
 
-        # loading modules
+        # modules are loaded when a slot uses them
         project["modules"] = {}
         modules_path = self.get_path("modules")
-        for path in sorted(glob.glob(os.path.join(modules_path, "*", "module.json"))):
-            module = path.split(os.sep)[-2]
-            mdata = open(path, "r").read()
-            project["modules"][module] = json.loads(mdata)
 
         # import module data
         for slot_n, slot in enumerate(project["jdata"].get("slots", [])):
@@ -598,6 +621,10 @@ class Project:
                     continue
                 module = modulesetup.get("module", [])
                 ssetup = modulesetup.get("setup", {})
+                if isinstance(module, str) and module not in project["modules"]:
+                    module_file = os.path.join(modules_path, module, "module.json")
+                    if os.path.isfile(module_file):
+                        project["modules"][module] = metadata_index.json_file(module_file)
                 if module in project["modules"]:
                     module_data = copy.deepcopy(project["modules"][module])
                     if "enable" in module_data:
@@ -629,7 +656,9 @@ class Project:
                     print(f"ERROR: module {module} not found")
                     exit(1)
 
+        metadata_index.save()
         self.config = project
+        self.config["riocore_path"] = riocore_path
         self.config["speed"] = int(project["jdata"]["clock"]["speed"])
         self.config["osc_clock"] = int(project["jdata"]["clock"].get("osc", 0))
         self.config["sysclk_pin"] = project["jdata"]["clock"]["pin"]
@@ -697,6 +726,8 @@ class Project:
         self.buffer_size = (max(self.input_size, self.output_size) + 7) // 8 * 8
         self.buffer_bytes = self.buffer_size // 8
         self.config["buffer_size"] = self.buffer_size
+        self.layout = InterfaceLayout(self.plugin_instances, self.interface_sizes)
+        self.codec = FrameCodec(self)
 
         # print("# PC->FPGA", self.output_size)
         # print("# FPGA->PC", self.input_size)
@@ -710,13 +741,15 @@ class Project:
         return (byte_start, byte_size, bit_offset)
 
     def get_interface_data(self):
-        interface_data = []
-        for size in sorted(self.interface_sizes, reverse=True):
-            for plugin_instance in self.plugin_instances:
-                for data_name, data_config in plugin_instance.interface_data().items():
-                    if data_config["size"] == size:
-                        interface_data.append([size, plugin_instance, data_name, data_config])
-        return interface_data
+        return self.layout.entries
+
+    def invalidate_layout(self):
+        # recalculate buffer, layout, codec and lookup tables after plugins or their setup changed
+        for plugin_instance in self.plugin_instances:
+            plugin_instance.invalidate()
+        self.calc_buffersize()
+        self.calc_signal_index()
+        self.calc_conversion_plan()
 
     def connect(self, cstr):
         connection = None
@@ -737,35 +770,143 @@ class Project:
     def transfare(self, data):
         return self.connection.transfare(data)
 
-    def signal_value_set(self, name, value):
+    def transfer_into(self, txdata, rxdata):
+        # exchange a frame using preallocated buffers, returns the number of received bytes
+        return interfaces.transfer_into(self.connection, txdata, rxdata)
+
+    def capture_start(self, path):
+        # write all transfers of the connection into a capture file (see capture.py)
+        self.connection = CaptureTransport(self.connection, path, self)
+        return self.connection
+
+    def capture_stop(self):
+        if isinstance(self.connection, CaptureTransport):
+            self.connection.close()
+            self.connection = self.connection.interface
+
+    def stats_enable(self, period=None, cpu=False):
+        # latency/jitter statistics of cycle() and cycle_async(), period: requested cycle time in seconds
+        # cpu: thread cpu time per stage of cycle()
+        self.stats = LinkStats(self, period, cpu)
+        return self.stats
+
+    def cycle(self):
+        # complete host cycle: signals -> txframe -> interface -> rxframe -> signals
+        cpu = self.stats is not None and self.stats.cpu is not None
+        start = time.perf_counter_ns()
+        cpu_start = time.thread_time_ns() if cpu else 0
+        self.convert2interface()
+        txdata = self.codec.encode()
+        encoded = time.perf_counter_ns()
+        cpu_encoded = time.thread_time_ns() if cpu else 0
+        length = self.transfer_into(memoryview(txdata), self.codec.rxbuffer)
+        transferred = time.perf_counter_ns()
+        cpu_transferred = time.thread_time_ns() if cpu else 0
+        if length:
+            self.rxdata_set(self.codec.rxbuffer)
+        if self.stats is not None:
+            decoded = time.perf_counter_ns()
+            if cpu:
+                self.stats.record_cpu(cpu_start, cpu_encoded, cpu_transferred, time.thread_time_ns())
+            self.stats.record(start, encoded, transferred, decoded, length, self.codec.rxbuffer, self.timestamp)
+        return length
+
+    async def connect_async(self, cstr):
+        # udp natively on the event loop, all other interfaces in a worker thread
+        from . import aio
+
+        if aio.UDPTransport.check(cstr):
+            connection = await aio.UDPTransport.create(cstr)
+        else:
+            connection = aio.ExecutorTransport(self.connect(cstr))
+        self.connection = connection
+        return connection
+
+    async def cycle_async(self):
+        # same as cycle(), the transfer is awaited, so one event loop can drive many projects
+        start = time.perf_counter_ns()
+        self.convert2interface()
+        txdata = self.codec.encode()
+        encoded = time.perf_counter_ns()
+        length = await self.connection.transfer_into(memoryview(txdata), self.codec.rxbuffer)
+        transferred = time.perf_counter_ns()
+        if length:
+            self.rxdata_set(self.codec.rxbuffer)
+        if self.stats is not None:
+            self.stats.record(start, encoded, transferred, time.perf_counter_ns(), length, self.codec.rxbuffer, self.timestamp)
+        return length
+
+    @staticmethod
+    def host_direction(config):
+        direction = config["direction"]
+        if config.get("virtual", False):
+            # swap direction for virt signals
+            if direction == "input":
+                direction = "output"
+            else:
+                direction = "input"
+        return direction
+
+    def calc_signal_index(self):
+        # halname / variable -> configs, that can be set from the host side
+        self.signal_index = {}
+        self.interface_index = {}
         for plugin_instance in self.plugin_instances:
             for signal_name, signal_config in plugin_instance.signals().items():
-                direction = signal_config["direction"]
-                virtual = signal_config.get("virtual", False)
-                if virtual:
-                    # swap direction vor virt signals
-                    if direction == "input":
-                        direction = "output"
-                    else:
-                        direction = "input"
-                halname = signal_config["halname"]
-                if direction in {"output", "inout"} and name == halname:
-                    signal_config["value"] = value
+                if self.host_direction(signal_config) in {"output", "inout"}:
+                    self.signal_index.setdefault(signal_config["halname"], []).append(signal_config)
+            for interface_name, interface_config in plugin_instance.interface_data().items():
+                if self.host_direction(interface_config) in {"output", "inout"}:
+                    self.interface_index.setdefault(interface_config["variable"], []).append(interface_config)
+
+    def calc_conversion_plan(self):
+        # all plugin conversions as one flat list, plugins with own conversion are called directly
+        self.convert_tx_plugins = []
+        self.convert_rx_plugins = []
+        self.convert_tx_plan = []
+        self.convert_rx_plan = []
+        for plugin_instance in self.plugin_instances:
+            tx_plan, rx_plan = plugin_instance.conversion_plan()
+            if tx_plan is None:
+                self.convert_tx_plugins.append(plugin_instance)
+            else:
+                self.convert_tx_plan += tx_plan
+            if rx_plan is None:
+                self.convert_rx_plugins.append(plugin_instance)
+            else:
+                self.convert_rx_plan += rx_plan
+
+    def convert2interface(self):
+        for plugin_instance in self.convert_tx_plugins:
+            plugin_instance.convert2interface()
+        for signal_name, signal_setup, interface_setup, convert in self.convert_tx_plan:
+            if convert is None:
+                interface_setup["value"] = signal_setup["value"]
+            else:
+                interface_setup["value"] = convert(signal_name, signal_setup, signal_setup["value"])
+
+    def convert2signals(self):
+        for plugin_instance in self.convert_rx_plugins:
+            plugin_instance.convert2signals()
+        for signal_name, signal_setup, interface_setup, convert in self.convert_rx_plan:
+            if convert is None:
+                signal_setup["value"] = interface_setup["value"]
+            else:
+                signal_setup["value"] = convert(signal_name, signal_setup, interface_setup["value"])
+
+    def signal_value_set(self, name, value):
+        for signal_config in self.signal_index.get(name, ()):
+            signal_config["value"] = value
+
+    def signal_values_set(self, values):
+        signal_index = self.signal_index
+        for name, value in values.items():
+            for signal_config in signal_index.get(name, ()):
+                signal_config["value"] = value
 
     def interface_value_set(self, name, value):
-        for plugin_instance in self.plugin_instances:
-            for interface_name, interface_config in plugin_instance.interface_data().items():
-                direction = interface_config["direction"]
-                virtual = interface_config.get("virtual", False)
-                if virtual:
-                    # swap direction vor virt signals
-                    if direction == "input":
-                        direction = "output"
-                    else:
-                        direction = "input"
-                variable = interface_config["variable"]
-                if direction in {"output", "inout"} and name == variable:
-                    interface_config["value"] = value
+        for interface_config in self.interface_index.get(name, ()):
+            interface_config["value"] = value
 
     def haldata(self):
         haldata = {}
@@ -776,14 +917,7 @@ class Project:
                 "inout": {},
             }
             for signal_name, signal_config in plugin_instance.signals().items():
-                direction = signal_config["direction"]
-                virtual = signal_config.get("virtual", False)
-                if virtual:
-                    # swap direction for virt signals
-                    if direction == "input":
-                        direction = "output"
-                    else:
-                        direction = "input"
+                direction = self.host_direction(signal_config)
                 halname = signal_config["halname"]
                 haldata[plugin_instance][direction][halname] = signal_config
 
@@ -791,169 +925,48 @@ class Project:
 
     def txdata_get(self):
         # send from pc to fpga
-        txdata = [0] * self.buffer_bytes
-        txdata[0] = 0x74
-        txdata[1] = 0x69
-        txdata[2] = 0x72
-        txdata[3] = 0x77
-        output_pos = self.buffer_size - self.header_size
         # convert signals to interface variables
-        for plugin_instance in self.plugin_instances:
-            plugin_instance.convert2interface()
-
-        if self.multiplexed_output:
-            mpx_value = 0
-            mpxid = 0
-            for size, plugin_instance, data_name, data_config in self.get_interface_data():
-                expansion = data_config.get("expansion", False)
-                if expansion:
-                    continue
-                multiplexed = data_config.get("multiplexed", False)
-                if not multiplexed:
-                    continue
-                variable_size = data_config["size"]
-                value = data_config["value"]
-                if data_config["direction"] in {"output"}:
-                    if self.multiplexed_output_id == mpxid:
-                        mpx_value = value
-                    mpxid += 1
-
-            variable_size = self.multiplexed_output_size
-            value = mpx_value
-            byte_start, byte_size, bit_offset = self.get_bype_pos(output_pos, variable_size)
-            byte_start = self.buffer_bytes - 1 - byte_start
-            txdata[byte_start - (byte_size - 1) : byte_start + 1] = list(pack("<i", int(value)))[0:byte_size]
-            output_pos -= variable_size
-            variable_size = 8
-            value = self.multiplexed_output_id
-            byte_start, byte_size, bit_offset = self.get_bype_pos(output_pos, variable_size)
-            byte_start = self.buffer_bytes - 1 - byte_start
-            txdata[byte_start - (byte_size - 1) : byte_start + 1] = list(pack("<i", int(value)))[0:byte_size]
-            output_pos -= variable_size
-            if self.multiplexed_output_id < self.multiplexed_output - 1:
-                self.multiplexed_output_id += 1
-            else:
-                self.multiplexed_output_id = 0
-
-        for size, plugin_instance, data_name, data_config in self.get_interface_data():
-            expansion = data_config.get("expansion", False)
-            if expansion:
-                continue
-            multiplexed = data_config.get("multiplexed", False)
-            if multiplexed:
-                continue
-            variable_size = data_config["size"]
-            value = data_config["value"]
-            if data_config["direction"] == "output" or data_config["direction"] == "inout":
-                byte_start, byte_size, bit_offset = self.get_bype_pos(output_pos, variable_size)
-                byte_start = self.buffer_bytes - 1 - byte_start
-                if plugin_instance.TYPE == "frameio":
-                    if not value:
-                        value = [0] * byte_size
-                    txdata[byte_start - (byte_size - 1) : byte_start + 1] = value[0:byte_size]
-                elif variable_size > 1:
-                    txdata[byte_start - (byte_size - 1) : byte_start + 1] = list(pack("<i", int(value)))[0:byte_size]
-                else:
-                    if value == 1:
-                        txdata[byte_start] |= 1 << bit_offset
-                output_pos -= variable_size
-        return txdata
+        self.convert2interface()
+        return list(self.codec.encode())
 
     def rxdata_set(self, rxdata):
         if not rxdata:
             return
-        input_pos = self.buffer_size - self.header_size
 
         # get timestamp from FPGA
-        variable_size = self.timestamp_size
-        byte_start, byte_size, bit_offset = self.get_bype_pos(input_pos, variable_size)
-        byte_start = self.buffer_bytes - 1 - byte_start
-        byte_pack = rxdata[byte_start - (byte_size - 1) : byte_start + 1]
+        timestamp = self.codec.decode(rxdata)
         self.timestamp_last = self.timestamp
-        self.timestamp = unpack("<I", bytes(byte_pack))[0] / self.config["speed"]
+        self.timestamp = timestamp / self.config["speed"]
         self.duration = self.timestamp - self.timestamp_last
-        input_pos -= variable_size
 
-        if self.multiplexed_input:
-            variable_size = self.multiplexed_input_size
-            byte_start, byte_size, bit_offset = self.get_bype_pos(input_pos, variable_size)
-            byte_start = self.buffer_bytes - 1 - byte_start
-            byte_pack = rxdata[byte_start - (byte_size - 1) : byte_start + 1]
-            if len(byte_pack) < 4:
-                byte_pack += [0] * (4 - len(byte_pack))
-            if byte_size == 8:
-                self.multiplexed_input_value = unpack("<d", bytes(byte_pack))[0]
-            else:
-                self.multiplexed_input_value = unpack("<i", bytes(byte_pack))[0]
-
-            input_pos -= variable_size
-            variable_size = 8
-            byte_start, byte_size, bit_offset = self.get_bype_pos(input_pos, variable_size)
-            byte_start = self.buffer_bytes - 1 - byte_start
-            byte_pack = rxdata[byte_start - (byte_size - 1) : byte_start + 1]
-            if len(byte_pack) < 4:
-                byte_pack += [0] * (4 - len(byte_pack))
-            self.multiplexed_input_id = unpack("<i", bytes(byte_pack))[0]
-            input_pos -= variable_size
-
-            # set mpx value
-            mpxid = 0
-            for size, plugin_instance, data_name, data_config in self.get_interface_data():
-                multiplexed = data_config.get("multiplexed", False)
-                if not multiplexed:
-                    continue
-                variable_size = data_config["size"]
-                if data_config["direction"] == "input":
-                    if self.multiplexed_input_id == mpxid:
-                        data_config["value"] = self.multiplexed_input_value
-                    mpxid += 1
-
-        for size, plugin_instance, data_name, data_config in self.get_interface_data():
-            expansion = data_config.get("expansion", False)
-            if expansion:
-                continue
-            multiplexed = data_config.get("multiplexed", False)
-            if multiplexed:
-                continue
-            variable_size = data_config["size"]
-
-            if data_config["direction"] == "input":
-                byte_start, byte_size, bit_offset = self.get_bype_pos(input_pos, variable_size)
-                byte_start = self.buffer_bytes - 1 - byte_start
-
-                if plugin_instance.TYPE == "frameio":
-                    value = rxdata[byte_start - (byte_size - 1) : byte_start + 1][0:byte_size]
-                    # print(value)
-                elif variable_size > 1:
-                    byte_pack = rxdata[byte_start - (byte_size - 1) : byte_start + 1]
-                    if len(byte_pack) < 4:
-                        byte_pack += [0] * (4 - len(byte_pack))
-                    value = unpack("<i", bytes(byte_pack))[0]
-                else:
-                    value = 1 if rxdata[byte_start] & (1 << bit_offset) else 0
-                data_config["value"] = value
-                input_pos -= variable_size
-
-        for size, plugin_instance, data_name, data_config in self.get_interface_data():
+        for plugin_instance in self.codec.plugin_instances:
             plugin_instance.timestamp = self.timestamp
             plugin_instance.duration = self.duration
 
         # convert interface variables to signals
-        for plugin_instance in self.plugin_instances:
-            plugin_instance.convert2signals()
+        self.convert2signals()
 
     def generator(self, preview=False):
+        from .generator.output import copy_file, output_files
+
+        # files with unchanged content are not rewritten, returns the changed ones
+        output_files.reset()
         protocol = self.config["jdata"].get("protocol", "SPI")
         toolchain = self.config.get("toolchain")
-        generate_pll = True
         if toolchain == "platformio":
             self.generator_firmware.generator()
         else:
-            if preview:
-                generate_pll = False
-            self.generator_gateware.generator(generate_pll=generate_pll)
+            if self.config["osc_clock"]:
+                from .generator import pll
+
+                # the pll is solved once before the generators run, all of them use the achieved system clock
+                self.config["speed"] = pll.system_clock(self.config)
+            # preview: no pll.v
+            self.generator_gateware.generator(generate_pll=not preview)
         if protocol == "UDP":
             self.generator_simulator.generator()
         self.generator_linuxcnc.generator()
         target = os.path.join(self.config["output_path"], ".config.json")
-        shutil.copy(self.config["json_file"], target)
+        copy_file(self.config["json_file"], target)
+        output_files.report(self.config["output_path"])
+        return sorted(output_files.changed)
@@ -0,0 +1,125 @@
+import asyncio
+import concurrent.futures
+import time
+
+from . import interfaces
+from .interfaces.UDP.interface import Interface as UDPInterface
+from .interfaces.UDP.interface import next_seq, parse_cstr
+
+
+class UDPTransport(asyncio.DatagramProtocol):
+    """asyncio version of interfaces/UDP
+
+    same connection-string (ip:port[:deadline_us][:seq]) and counters,
+    replies without a waiting request are counted as late (or duplicate) and dropped
+    """
+
+    def __init__(self, cstr):
+        (self.NET_IP, self.NET_PORT, self.deadline_us, self.sequence) = parse_cstr(cstr)
+        self.address = (self.NET_IP, int(self.NET_PORT))
+        self.transport = None
+        self.waiter = None
+        self.rxdata = None
+        self.pkg_out = 0
+        self.pkg_in = 0
+        self.lost = 0
+        self.late = 0
+        self.duplicate = 0
+        self.seq = 0
+        self.answered = None
+
+    @classmethod
+    async def create(cls, cstr):
+        protocol = cls(cstr)
+        loop = asyncio.get_running_loop()
+        await loop.create_datagram_endpoint(lambda: protocol, local_addr=("0.0.0.0", int(protocol.NET_PORT) + 1))
+        return protocol
+
+    @classmethod
+    def check(cls, cstr):
+        return UDPInterface.check(cstr)
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        waiter = self.waiter
+        if waiter is not None and waiter.done():
+            # timed out, but not yet cleaned up
+            waiter = None
+        if self.sequence:
+            seq = data[2] | data[3] << 8 if len(data) >= 4 else None
+            if waiter is None or seq != self.seq:
+                if seq is not None and seq == self.answered:
+                    self.duplicate += 1
+                else:
+                    self.late += 1
+                return
+        elif waiter is None:
+            self.late += 1
+            return
+
+        length = min(len(data), len(self.rxdata))
+        self.rxdata[0:length] = data[0:length]
+        if self.sequence:
+            self.answered = self.seq
+            self.rxdata[2:4] = b"ad" if data[0] == 0x61 else b"se"
+        self.waiter = None
+        self.rxdata = None
+        self.pkg_in += 1
+        waiter.set_result(len(data))
+
+    async def transfer_into(self, txdata, rxdata):
+        self.pkg_out += 1
+        if self.sequence:
+            self.seq = next_seq(self.seq)
+            self.transport.sendto(bytes([txdata[0], txdata[1], self.seq & 0xFF, self.seq >> 8]) + bytes(txdata[4:]), self.address)
+        else:
+            self.transport.sendto(bytes(txdata), self.address)
+
+        self.rxdata = rxdata
+        self.waiter = asyncio.get_running_loop().create_future()
+        try:
+            length = await asyncio.wait_for(self.waiter, self.deadline_us / 1000000)
+        except asyncio.TimeoutError:
+            self.waiter = None
+            self.rxdata = None
+            self.lost += 1
+            print("Network TimeoutError")
+            return 0
+        if length != len(txdata):
+            print(f"{self.pkg_out}/{self.pkg_in} WRONG DATASIZE: {length} / {len(txdata)}")
+        return length
+
+    def close(self):
+        if self.transport is not None:
+            self.transport.close()
+
+
+class ExecutorTransport:
+    """runs a blocking interface (SPI, UART, FTDI, ...) in its own worker thread
+
+    one worker per interface, so the transfers of one device stay in order,
+    while the transfers of different devices overlap
+    """
+
+    def __init__(self, interface):
+        self.interface = interface
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+    async def transfer_into(self, txdata, rxdata):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, interfaces.transfer_into, self.interface, txdata, rxdata)
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+
+
+async def run(projects, cycles=None, interval=0.0):
+    # drives the cycles of several projects on one event loop, the transfers of all boards overlap
+    cycle_n = 0
+    while cycles is None or cycle_n < cycles:
+        start = time.perf_counter()
+        await asyncio.gather(*[project.cycle_async() for project in projects])
+        cycle_n += 1
+        if interval:
+            await asyncio.sleep(max(0.0, interval - (time.perf_counter() - start)))
@@ -0,0 +1,192 @@
+import json
+import mmap
+import struct
+import time
+
+from . import interfaces
+
+# capture file
+#
+#   header (64 bytes, little endian):
+#     0   magic "RIOC"
+#     4   version
+#     8   frame size (buffer bytes)
+#     12  record size
+#     16  data offset (first record, multiple of 64)
+#     20  fpga clock (config speed)
+#     24  capture start (unix time, double)
+#     32  length of the json setup
+#   json setup: config and interface layout of the project
+#   records (fixed size, so the file can be mmapped and indexed):
+#     0   time since capture start in ns
+#     8   transfer duration in ns
+#     12  received bytes
+#     14  flags (reserved)
+#     16  tx frame, rx frame (frame size each, rx zero padded)
+#
+# the records are flushed to the os every FLUSH_INTERVAL seconds, a crash or kill of the process
+# loses at most the records of this interval (no fsync: a power loss can lose more).
+# a partly written record at the end is ignored by the reader.
+
+MAGIC = b"RIOC"
+VERSION = 1
+HEADER = struct.Struct("<4sIIIIIdI")
+HEADER_SIZE = 64
+RECORD = struct.Struct("<QIHH")
+FLUSH_INTERVAL = 1.0
+
+
+def capture_setup(project):
+    layout = []
+    for size, plugin_instance, data_name, data_config in project.get_interface_data():
+        layout.append(
+            {
+                "variable": data_config["variable"],
+                "instance": plugin_instance.instances_name,
+                "name": data_name,
+                "size": size,
+                "direction": data_config["direction"],
+                "multiplexed": data_config.get("multiplexed", False),
+                "expansion": data_config.get("expansion", False),
+            }
+        )
+    return {
+        "config": project.config["jdata"],
+        "buffer_size": project.buffer_size,
+        "header_size": project.header_size,
+        "timestamp_size": project.timestamp_size,
+        "multiplexed_input_size": project.multiplexed_input_size if project.multiplexed_input else 0,
+        "multiplexed_output_size": project.multiplexed_output_size if project.multiplexed_output else 0,
+        "layout": layout,
+    }
+
+
+class CaptureWriter:
+    def __init__(self, path, project, flush_interval=FLUSH_INTERVAL):
+        self.frame_size = project.buffer_bytes
+        self.record_size = RECORD.size + 2 * self.frame_size
+        setup = json.dumps(capture_setup(project)).encode()
+        data_offset = (HEADER_SIZE + len(setup) + 63) // 64 * 64
+        self.file = open(path, "wb")
+        header = bytearray(data_offset)
+        HEADER.pack_into(header, 0, MAGIC, VERSION, self.frame_size, self.record_size, data_offset, project.config["speed"], time.time(), len(setup))
+        header[HEADER_SIZE : HEADER_SIZE + len(setup)] = setup
+        self.file.write(header)
+        self.record = bytearray(self.record_size)
+        self.start = time.perf_counter_ns()
+        self.records = 0
+        self.flush_ns = int(flush_interval * 1000000000)
+        self.flushed = self.start
+
+    def write(self, txdata, rxdata, length, transfer_ns):
+        record = self.record
+        frame_size = self.frame_size
+        now = time.perf_counter_ns()
+        RECORD.pack_into(record, 0, now - self.start, min(transfer_ns, 0xFFFFFFFF), min(length, 0xFFFF), 0)
+        tx_length = min(len(txdata), frame_size)
+        record[RECORD.size : RECORD.size + tx_length] = txdata[0:tx_length]
+        rx_start = RECORD.size + frame_size
+        length = min(length, frame_size, len(rxdata))
+        record[rx_start : rx_start + length] = rxdata[0:length]
+        record[rx_start + length : rx_start + frame_size] = bytes(frame_size - length)
+        self.file.write(record)
+        self.records += 1
+        if now - self.flushed >= self.flush_ns:
+            self.file.flush()
+            self.flushed = now
+
+    def close(self):
+        self.file.close()
+
+
+class CaptureTransport:
+    """wraps an interface and writes every transfer into a capture file
+
+    the records go through the buffered file object, so a frame costs one memcpy and no syscall,
+    the buffer is flushed every FLUSH_INTERVAL seconds
+    """
+
+    def __init__(self, interface, path, project):
+        self.interface = interface
+        self.writer = CaptureWriter(path, project)
+
+    def transfer_into(self, txdata, rxdata):
+        start = time.perf_counter_ns()
+        length = interfaces.transfer_into(self.interface, txdata, rxdata)
+        self.writer.write(txdata, rxdata, length, time.perf_counter_ns() - start)
+        return length
+
+    def transfare(self, data):
+        return interfaces.transfare(self, data)
+
+    def close(self):
+        self.writer.close()
+
+
+class CaptureFile:
+    """read access to a capture file, the records are memory mapped"""
+
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.frame_size, self.record_size, self.data_offset, self.speed, self.start_time, setup_size = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path}: not a capture file (version {VERSION})")
+        self.setup = json.loads(bytes(self.mm[HEADER_SIZE : HEADER_SIZE + setup_size]))
+        self.view = memoryview(self.mm)
+
+    def __len__(self):
+        return (len(self.mm) - self.data_offset) // self.record_size
+
+    def __getitem__(self, index):
+        # (time_ns, transfer_ns, length, flags, txdata, rxdata), frames are memoryviews into the file
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("capture record out of range")
+        offset = self.data_offset + index * self.record_size
+        time_ns, transfer_ns, length, flags = RECORD.unpack_from(self.mm, offset)
+        tx_start = offset + RECORD.size
+        rx_start = tx_start + self.frame_size
+        return (time_ns, transfer_ns, length, flags, self.view[tx_start:rx_start], self.view[rx_start : rx_start + self.frame_size])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def close(self):
+        self.view.release()
+        self.mm.close()
+        self.file.close()
+
+
+class ReplayTransport:
+    """answers the transfers with the recorded rx frames
+
+    speed: 1.0 recorded timing, 2.0 twice as fast, 0 as fast as possible
+    returns 0 (like a timeout) after the last record
+    """
+
+    def __init__(self, path, speed=1.0):
+        self.capture = CaptureFile(path)
+        self.speed = speed
+        self.index = 0
+        self.start = None
+
+    def transfer_into(self, txdata, rxdata):
+        if self.index >= len(self.capture):
+            return 0
+        time_ns, transfer_ns, length, flags, tx_frame, rx_frame = self.capture[self.index]
+        self.index += 1
+        if self.speed:
+            if self.start is None:
+                self.start = time.perf_counter_ns() - time_ns / self.speed
+            delay = (self.start + time_ns / self.speed - time.perf_counter_ns()) / 1000000000
+            if delay > 0:
+                time.sleep(delay)
+        length = min(length, len(rxdata), len(rx_frame))
+        rxdata[0:length] = rx_frame[0:length]
+        return length
+
+    def transfare(self, data):
+        return interfaces.transfare(self, data)
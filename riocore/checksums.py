@@ -1,25 +1,73 @@
+import struct
+
+
+def crc16_table(poly=0xA001):
+    table = []
+    for byte in range(256):
+        crc = byte
+        for bit in range(8):
+            if crc & 0x1:
+                crc = (crc >> 1) ^ poly
+            else:
+                crc = crc >> 1
+        table.append(crc)
+    return table
+
+
+CRC16_TABLE = crc16_table()
+# slice-by-2: one lookup per 16bit word, built on first use (64k entries)
+CRC16_WORD_TABLE = []
+CRC16_WORD_MIN = 64
+
+
+def crc16_word_table():
+    if not CRC16_WORD_TABLE:
+        table = CRC16_TABLE
+        table2 = [(table[n] >> 8) ^ table[table[n] & 0xFF] for n in range(256)]
+        CRC16_WORD_TABLE.extend(table2[word & 0xFF] ^ table[word >> 8] for word in range(65536))
+    return CRC16_WORD_TABLE
+
+
+def crc16_calc(crc, data):
+    # CRC16/Modbus over bytes, bytearray, memoryview or any sequence of ints (list, tuple, ...)
+    table = CRC16_TABLE
+    if len(data) >= CRC16_WORD_MIN and isinstance(data, (bytes, bytearray, memoryview)):
+        view = memoryview(data).cast("B")
+        words = len(view) // 2
+        word_table = crc16_word_table()
+        for word in struct.unpack_from(f"<{words}H", view):
+            crc = word_table[crc ^ word]
+        data = view[words * 2 :]
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def crc16_bulk(frames):
+    # checksums of many frames (e.g. from a capture) in one call
+    calc = crc16_calc
+    return [calc(0xFFFF, frame) for frame in frames]
+
+
+def crc8_bulk(frames, initial_start=0x00):
+    table = crc8._table
+    result = []
+    for frame in frames:
+        _sum = initial_start
+        for byte in frame:
+            _sum = table[_sum ^ byte]
+        result.append(_sum)
+    return result
+
+
 class crc16(object):
     def __init__(self):
         self.crc = 0xFFFF
 
     def update(self, data):
-        offset = 0
-
-        if isinstance(data, (list)):
-            data = bytearray(data)
-        elif isinstance(data, (int)):
-            data = bytearray([data])
-
-        length = len(data) - offset
-        if data is None or offset < 0 or offset > len(data) - 1 and offset + length > len(data):
-            return 0
-        for i in range(length):
-            self.crc ^= data[offset + i]
-            for j in range(8):
-                if (self.crc & 0x1) == 1:
-                    self.crc = int((self.crc / 2)) ^ 40961
-                else:
-                    self.crc = int(self.crc / 2)
+        if isinstance(data, (int)):
+            data = (data,)
+        self.crc = crc16_calc(self.crc, data)
 
     def digest(self):
         csum = self.crc & 0xFFFF
@@ -34,15 +82,9 @@ class crc16(object):
             length = len(data) - offset
         if data is None or offset < 0 or offset > len(data) - 1 and offset + length > len(data):
             return 0
-        crc = 0xFFFF
-        for i in range(length):
-            crc ^= data[offset + i]
-            for j in range(8):
-                if (crc & 0x1) == 1:
-                    crc = int((crc / 2)) ^ 40961
-                else:
-                    crc = int(crc / 2)
-        return crc & 0xFFFF
+        if offset or length != len(data):
+            data = data[offset : offset + length]
+        return crc16_calc(0xFFFF, data) & 0xFFFF
 
 
 class crc8(object):
@@ -335,7 +377,7 @@ class crc8(object):
     def update(self, bytes_):
         if isinstance(bytes_, str):
             raise TypeError("Unicode-objects must be encoded before" " hashing")
-        elif not isinstance(bytes_, (bytes, bytearray)):
+        elif not isinstance(bytes_, (bytes, bytearray, memoryview)):
             if isinstance(bytes_, (list)):
                 bytes_ = bytearray(bytes_)
             elif isinstance(bytes_, (int)):
@@ -0,0 +1,267 @@
+import struct
+
+TX_HEADER = b"tirw"
+RX_HEADER = b"atad"
+
+WORD_CODES = {1: "B", 2: "H", 4: "I"}
+
+
+class FrameCodec:
+    """precompiled encoder/decoder for the host <-> fpga frame
+
+    the layout (offsets, bit positions, struct formats) is calculated once
+    from the project buffer setup, so encoding and decoding a frame only needs
+    a few bulk struct operations on a preallocated buffer.
+    """
+
+    def __init__(self, project):
+        self.project = project
+        self.buffer_bytes = project.buffer_bytes
+        self.txbuffer = bytearray(self.buffer_bytes)
+        self.rxbuffer = bytearray(self.buffer_bytes)
+        self.plugin_instances = project.layout.plugin_instances
+        self.compile_tx()
+        self.compile_rx()
+
+    def byte_range(self, bitpos, variable_size):
+        byte_start, byte_size, bit_offset = self.project.get_bype_pos(bitpos, variable_size)
+        byte_start = self.buffer_bytes - 1 - byte_start
+        return (byte_start - (byte_size - 1), byte_size, byte_start, bit_offset)
+
+    @staticmethod
+    def overlapping(ranges):
+        last_end = 0
+        for start, size in sorted(ranges):
+            if start < last_end:
+                return True
+            last_end = start + size
+        return False
+
+    def build_struct(self, fields):
+        # fields: (offset, size, code) sorted by offset, non overlapping
+        fmt = ["<"]
+        pos = 0
+        for offset, size, code in fields:
+            if offset > pos:
+                fmt.append(f"{offset - pos}x")
+            fmt.append(code)
+            pos = offset + size
+        if self.buffer_bytes > pos:
+            fmt.append(f"{self.buffer_bytes - pos}x")
+        return struct.Struct("".join(fmt))
+
+    def compile_tx(self):
+        project = self.project
+        output_pos = project.buffer_size - project.header_size
+
+        # (offset, size, kind, config) in the same order the old loop wrote them
+        self.tx_ops = []
+        self.tx_bits = []
+        self.tx_mpx = []
+        self.tx_mpx_value = None
+        self.tx_mpx_id = None
+
+        if project.multiplexed_output:
+            for size, plugin_instance, data_name, data_config in project.layout.multiplexed_outputs:
+                self.tx_mpx.append(data_config)
+            offset, byte_size, byte_start, bit_offset = self.byte_range(output_pos, project.multiplexed_output_size)
+            self.tx_mpx_value = (offset, byte_size)
+            output_pos -= project.multiplexed_output_size
+            offset, byte_size, byte_start, bit_offset = self.byte_range(output_pos, 8)
+            self.tx_mpx_id = (offset, byte_size)
+            output_pos -= 8
+
+        for size, plugin_instance, data_name, data_config in project.layout.outputs:
+            offset, byte_size, byte_start, bit_offset = self.byte_range(output_pos, size)
+            if plugin_instance.TYPE == "frameio":
+                self.tx_ops.append((offset, byte_size, "frame", data_config))
+            elif size > 1:
+                self.tx_ops.append((offset, byte_size, "int", data_config))
+            else:
+                self.tx_bits.append((byte_start, 1 << bit_offset, data_config))
+            output_pos -= size
+
+        ranges = [(0, len(TX_HEADER))] + [(offset, size) for offset, size, kind, data_config in self.tx_ops]
+        if self.tx_mpx_value:
+            ranges += [self.tx_mpx_value, self.tx_mpx_id]
+        self.tx_sequential = self.overlapping(ranges)
+
+        # fast path: header and all plain words in one struct, the rest as slices
+        words = []
+        self.tx_slices = []
+        if not self.tx_sequential:
+            for offset, size, kind, data_config in self.tx_ops:
+                if kind == "int" and size in WORD_CODES:
+                    words.append((offset, size, WORD_CODES[size], data_config))
+                else:
+                    self.tx_slices.append((offset, size, kind, data_config))
+            words.sort(key=lambda word: word[0])
+        self.tx_words = [(data_config, (1 << (size * 8)) - 1) for offset, size, code, data_config in words]
+        self.tx_struct = self.build_struct([(0, len(TX_HEADER), f"{len(TX_HEADER)}s")] + [(offset, size, code) for offset, size, code, data_config in words])
+
+    def compile_rx(self):
+        project = self.project
+        input_pos = project.buffer_size - project.header_size
+
+        # (offset, size, code, target) in frame order, targets are data_configs or the holders below
+        self.rx_timestamp = {"value": 0}
+        self.rx_mpx_value = {"value": 0}
+        self.rx_mpx_id = {"value": 0}
+        fields = []
+        self.rx_frames = []
+        self.rx_specials = []
+        self.rx_bits = []
+        self.rx_mpx = []
+        # (name, offset, byte_size, code) in frame order for batch decoders,
+        # code: struct code, "special" (int.from_bytes), "frame" or the mask of a bit (offset is the byte)
+        self.rx_columns = []
+
+        offset, byte_size, byte_start, bit_offset = self.byte_range(input_pos, project.timestamp_size)
+        fields.append((offset, byte_size, "I", self.rx_timestamp))
+        self.rx_columns.append(("timestamp", offset, byte_size, "I"))
+        input_pos -= project.timestamp_size
+
+        if project.multiplexed_input:
+            for size, plugin_instance, data_name, data_config in project.layout.multiplexed_inputs:
+                self.rx_mpx.append(data_config)
+            offset, byte_size, byte_start, bit_offset = self.byte_range(input_pos, project.multiplexed_input_size)
+            if byte_size == 8:
+                code = "d"
+            elif byte_size == 4:
+                code = "i"
+            elif byte_size in WORD_CODES:
+                code = WORD_CODES[byte_size]
+            else:
+                code = "special"
+            if code == "special":
+                self.rx_specials.append((offset, byte_size, self.rx_mpx_value))
+            else:
+                fields.append((offset, byte_size, code, self.rx_mpx_value))
+            self.rx_columns.append(("multiplexed_value", offset, byte_size, code))
+            input_pos -= project.multiplexed_input_size
+            offset, byte_size, byte_start, bit_offset = self.byte_range(input_pos, 8)
+            fields.append((offset, byte_size, "B", self.rx_mpx_id))
+            self.rx_columns.append(("multiplexed_id", offset, byte_size, "B"))
+            input_pos -= 8
+
+        for size, plugin_instance, data_name, data_config in project.layout.inputs:
+            offset, byte_size, byte_start, bit_offset = self.byte_range(input_pos, size)
+            if plugin_instance.TYPE == "frameio":
+                self.rx_frames.append((offset, offset + byte_size, data_config))
+                code = "frame"
+            elif size > 1:
+                if byte_size == 4:
+                    code = "i"
+                elif byte_size in WORD_CODES:
+                    code = WORD_CODES[byte_size]
+                else:
+                    code = "special"
+                if code == "special":
+                    self.rx_specials.append((offset, byte_size, data_config))
+                else:
+                    fields.append((offset, byte_size, code, data_config))
+            else:
+                self.rx_bits.append((byte_start, 1 << bit_offset, data_config))
+                offset = byte_start
+                code = 1 << bit_offset
+            self.rx_columns.append((data_config["variable"], offset, byte_size, code))
+            input_pos -= size
+
+        fields.sort(key=lambda field: field[0])
+        self.rx_sequential = self.overlapping([(offset, size) for offset, size, code, target in fields])
+        if self.rx_sequential:
+            self.rx_struct = None
+            self.rx_fields = [(offset, struct.Struct(f"<{code}"), target) for offset, size, code, target in fields]
+        else:
+            self.rx_struct = self.build_struct([(offset, size, code) for offset, size, code, target in fields])
+            self.rx_fields = [target for offset, size, code, target in fields]
+
+    @staticmethod
+    def int_bytes(value, size):
+        data = (int(value) & 0xFFFFFFFF).to_bytes(4, "little")
+        if size > 4:
+            return data + bytes(size - 4)
+        return data[0:size]
+
+    @staticmethod
+    def frame_bytes(value, size):
+        if not value:
+            return bytes(size)
+        return bytes(value[0:size]).ljust(size, b"\x00")
+
+    def mpx_output_value(self):
+        project = self.project
+        mpx_id = project.multiplexed_output_id
+        value = 0
+        if mpx_id < len(self.tx_mpx):
+            value = self.tx_mpx[mpx_id]["value"]
+        if project.multiplexed_output_id < project.multiplexed_output - 1:
+            project.multiplexed_output_id += 1
+        else:
+            project.multiplexed_output_id = 0
+        return (mpx_id, value)
+
+    def encode(self):
+        buffer = self.txbuffer
+        if self.tx_mpx_value:
+            mpx_id, mpx_value = self.mpx_output_value()
+
+        if self.tx_sequential:
+            buffer[:] = bytes(self.buffer_bytes)
+            buffer[0 : len(TX_HEADER)] = TX_HEADER
+            if self.tx_mpx_value:
+                offset, size = self.tx_mpx_value
+                buffer[offset : offset + size] = self.int_bytes(mpx_value, size)
+                offset, size = self.tx_mpx_id
+                buffer[offset : offset + size] = self.int_bytes(mpx_id, size)
+            for offset, size, kind, data_config in self.tx_ops:
+                if kind == "frame":
+                    buffer[offset : offset + size] = self.frame_bytes(data_config["value"], size)
+                else:
+                    buffer[offset : offset + size] = self.int_bytes(data_config["value"], size)
+        else:
+            self.tx_struct.pack_into(buffer, 0, TX_HEADER, *[int(data_config["value"]) & mask for data_config, mask in self.tx_words])
+            if self.tx_mpx_value:
+                offset, size = self.tx_mpx_value
+                buffer[offset : offset + size] = self.int_bytes(mpx_value, size)
+                offset, size = self.tx_mpx_id
+                buffer[offset : offset + size] = self.int_bytes(mpx_id, size)
+            for offset, size, kind, data_config in self.tx_slices:
+                if kind == "frame":
+                    buffer[offset : offset + size] = self.frame_bytes(data_config["value"], size)
+                else:
+                    buffer[offset : offset + size] = self.int_bytes(data_config["value"], size)
+
+        for byte_pos, mask, data_config in self.tx_bits:
+            if data_config["value"] == 1:
+                buffer[byte_pos] |= mask
+        return buffer
+
+    def decode(self, rxdata):
+        if isinstance(rxdata, list):
+            rxdata = bytes(rxdata)
+
+        if self.rx_struct is not None:
+            for target, value in zip(self.rx_fields, self.rx_struct.unpack_from(rxdata, 0)):
+                target["value"] = value
+        else:
+            for offset, field_struct, target in self.rx_fields:
+                target["value"] = field_struct.unpack_from(rxdata, offset)[0]
+
+        for offset, size, target in self.rx_specials:
+            target["value"] = int.from_bytes(rxdata[offset : offset + min(size, 4)], "little", signed=size >= 4)
+
+        for start, end, data_config in self.rx_frames:
+            data_config["value"] = list(rxdata[start:end])
+
+        for byte_pos, mask, data_config in self.rx_bits:
+            data_config["value"] = 1 if rxdata[byte_pos] & mask else 0
+
+        if self.rx_mpx:
+            project = self.project
+            project.multiplexed_input_value = self.rx_mpx_value["value"]
+            project.multiplexed_input_id = self.rx_mpx_id["value"]
+            if project.multiplexed_input_id < len(self.rx_mpx):
+                self.rx_mpx[project.multiplexed_input_id]["value"] = project.multiplexed_input_value
+
+        return self.rx_timestamp["value"]
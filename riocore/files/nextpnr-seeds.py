@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+#
+# picks the best place and route result of a nextpnr seed sweep (make sweep)
+#
+# nextpnr-seeds.py rio.asc seeds/*/nextpnr.log
+#
+# the best run has the highest worst-case ratio of achieved to requested frequency over all clocks,
+# its result and log are copied into the gateware folder
+#
+
+import os
+import re
+import shutil
+import sys
+
+
+def fmax(log_path):
+    # {clock: (achieved MHz, requested MHz)} of the last timing report (after routing)
+    clocks = {}
+    for line in open(log_path, "r", errors="replace"):
+        match = re.search(r"Max frequency for clock\s+'([^']+)':\s*([\d.]+) MHz \((?:PASS|FAIL) at ([\d.]+) MHz\)", line)
+        if match:
+            clocks[match.group(1)] = (float(match.group(2)), float(match.group(3)))
+    return clocks
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(f"usage: {sys.argv[0]} RESULT LOGS...")
+        sys.exit(1)
+    result_name = sys.argv[1]
+
+    best = None
+    print("")
+    print(f"{'seed':>6s} {'worst':>8s}  clocks (achieved/requested MHz)")
+    for log_path in sys.argv[2:]:
+        seed_path = os.path.dirname(log_path)
+        if not os.path.isfile(os.path.join(seed_path, result_name)):
+            print(f"{os.path.basename(seed_path):>6s} {'-':>8s}  failed")
+            continue
+        clocks = fmax(log_path)
+        ratio = min((achieved / requested for achieved, requested in clocks.values()), default=0.0)
+        info = "  ".join(f"{clock}: {achieved:.2f}/{requested:.2f}" for clock, (achieved, requested) in sorted(clocks.items()))
+        print(f"{os.path.basename(seed_path):>6s} {ratio:8.3f}  {info}")
+        if best is None or ratio > best[0]:
+            best = (ratio, seed_path)
+    print("")
+
+    if best is None:
+        print("ERROR: no seed was successful")
+        sys.exit(1)
+    ratio, seed_path = best
+    print(f"best seed: {os.path.basename(seed_path)}")
+    if ratio < 1.0:
+        print("WARNING: timing failed for all seeds")
+    print("")
+    shutil.copy(os.path.join(seed_path, result_name), result_name)
+    shutil.copy(os.path.join(seed_path, "nextpnr.log"), "nextpnr.log")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 import os
 from riocore.generator import cclient
+from riocore.generator.output import write_file
 
 riocore_path = os.path.dirname(os.path.dirname(__file__))
 
@@ -146,7 +147,7 @@ void loop() {
 }
 """)
 
-        open(os.path.join(self.pio_src_path, "main.ino"), "w").write("\n".join(output))
+        write_file(os.path.join(self.pio_src_path, "main.ino"), "\n".join(output))
 
         output = []
         output.append("")
@@ -155,6 +156,6 @@ void loop() {
         output.append("board = esp32-poe-iso")
         output.append("framework = arduino")
         output.append("")
-        open(os.path.join(self.pio_path, "platformio.ini"), "w").write("\n".join(output))
+        write_file(os.path.join(self.pio_path, "platformio.ini"), "\n".join(output))
 
         print(f"writing firmware to: {self.pio_path}")
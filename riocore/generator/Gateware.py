@@ -1,10 +1,11 @@
 import hashlib
 import importlib
 import os
-import shutil
 import stat
 import json
 
+from riocore.generator.output import copy_file, write_file
+
 riocore_path = os.path.dirname(os.path.dirname(__file__))
 
 
@@ -29,7 +30,7 @@ class Gateware:
         globals_data.append("  end")
         globals_data.append("endfunction")
         globals_data.append("")
-        open(os.path.join(self.gateware_path, "globals.v"), "w").write("\n".join(globals_data))
+        write_file(os.path.join(self.gateware_path, "globals.v"), "\n".join(globals_data))
         self.verilogs.append("globals.v")
 
     def generator(self, generate_pll=True):
@@ -111,7 +112,7 @@ class Gateware:
         output.append("</td></tr>")
         output.append("</table>")
 
-        open(os.path.join(self.gateware_path, "interface.html"), "w").write("\n".join(output))
+        write_file(os.path.join(self.gateware_path, "interface.html"), "\n".join(output))
 
     def makefile(self):
         flashcmd = self.config.get("flashcmd")
@@ -123,7 +124,7 @@ class Gateware:
                 print(flashcmd_script_path)
                 if os.path.isfile(flashcmd_script_path):
                     target = os.path.join(self.gateware_path, flashcmd_script)
-                    shutil.copy(flashcmd_script_path, target)
+                    copy_file(flashcmd_script_path, target)
                     os.chmod(target, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
 
         for plugin_instance in self.project.plugin_instances:
@@ -133,20 +134,20 @@ class Gateware:
                 self.verilogs.append(verilog)
                 ipv_path = os.path.join(riocore_path, "plugins", plugin_instance.NAME, verilog)
                 target = os.path.join(self.gateware_path, verilog)
-                shutil.copy(ipv_path, target)
+                copy_file(ipv_path, target)
 
             for verilog, data in plugin_instance.gateware_virtual_files().items():
                 if verilog in self.verilogs:
                     continue
                 self.verilogs.append(verilog)
                 target = os.path.join(self.gateware_path, verilog)
-                open(target, "w").write(data)
+                write_file(target, data)
 
         for extrafile in ("debouncer.v", "toggle.v", "pwmmod.v", "oneshot.v"):
             self.verilogs.append(extrafile)
             source = os.path.join(riocore_path, "files", extrafile)
             target = os.path.join(self.gateware_path, extrafile)
-            shutil.copy(source, target)
+            copy_file(source, target)
         self.verilogs.append("rio.v")
         self.config["verilog_files"] = self.verilogs
         self.config["pinlists"] = {}
@@ -191,6 +192,12 @@ class Gateware:
 
         self.toolchain_generator.generate(self.gateware_path)
 
+        # requirements of the build report
+        timing = {"sysclk": self.config["speed"], "constraints": {}}
+        for key, value in list(self.config["timing_constraints"].items()) + list(self.config["timing_constraints_instance"].items()):
+            timing["constraints"][key] = int(value)
+        write_file(os.path.join(self.gateware_path, "timing.json"), json.dumps(timing, indent=4))
+
     def top(self):
         output = []
         input_variables_list = ["header_tx[7:0], header_tx[15:8], header_tx[23:16], header_tx[31:24]"]
@@ -618,7 +625,7 @@ class Gateware:
         output.append("endmodule")
         output.append("")
         print(f"writing gateware to: {self.gateware_path}")
-        open(os.path.join(self.gateware_path, "rio.v"), "w").write("\n".join(output))
+        write_file(os.path.join(self.gateware_path, "rio.v"), "\n".join(output))
 
         # write hash of rio.v to filesystem
         hash_file_compiled = os.path.join(self.gateware_path, "hash_compiled.txt")
@@ -642,4 +649,4 @@ class Gateware:
         elif hash_flashed != hash_new:
             print("!!! gateware changed: needs to flash |||")
         hash_file_new = os.path.join(self.gateware_path, "hash_new.txt")
-        open(hash_file_new, "w").write(hash_new)
+        write_file(hash_file_new, hash_new)
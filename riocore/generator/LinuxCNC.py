@@ -8,11 +8,7 @@ import stat
 from riocore import halpins
 from riocore.generator.hal import hal_generator
 from riocore.generator.component import component
-from riocore.generator.pyvcp import pyvcp
-from riocore.generator.qtvcp import qtvcp
-from riocore.generator.qtpyvcp import qtpyvcp
-from riocore.generator.gladevcp import gladevcp
-from riocore.generator.flexvcp import flexvcp
+from riocore.generator.output import copy_file, write_file
 
 riocore_path = os.path.dirname(os.path.dirname(__file__))
 
@@ -194,7 +190,7 @@ class LinuxCNC:
         output.append("")
         os.makedirs(self.component_path, exist_ok=True)
         target = os.path.join(self.component_path, "start.sh")
-        open(target, "w").write("\n".join(output))
+        write_file(target, "\n".join(output))
         os.chmod(target, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
 
     def generator(self):
@@ -261,8 +257,8 @@ class LinuxCNC:
         output_hal += self.halextras
 
         output_hal.append("")
-        open(os.path.join(self.configuration_path, "rio.hal"), "w").write("\n".join(output_hal))
-        open(os.path.join(self.configuration_path, "custom_postgui.hal"), "w").write("\n".join(output_postgui))
+        write_file(os.path.join(self.configuration_path, "rio.hal"), "\n".join(output_hal))
+        write_file(os.path.join(self.configuration_path, "custom_postgui.hal"), "\n".join(output_postgui))
 
         if (gui == "gmoccapy" or gui == "gscreen") and self.gui_type == "gladevcp":
             print("## INFO: custom_postgui.hal will be load by gladevcp")
@@ -285,7 +281,7 @@ class LinuxCNC:
 
         for halfile in self.postgui_call_list:
             list_data.append(f"source {halfile}")
-        open(os.path.join(self.configuration_path, "postgui_call_list.hal"), "w").write("\n".join(list_data))
+        write_file(os.path.join(self.configuration_path, "postgui_call_list.hal"), "\n".join(list_data))
 
         extra_data = []
         if os.path.isfile(os.path.join(self.configuration_path, "pregui_call_list.hal")):
@@ -302,7 +298,7 @@ class LinuxCNC:
             cl_output.append(f"source {halfile}")
         for line in extra_data:
             cl_output.append(line)
-        open(os.path.join(self.configuration_path, "pregui_call_list.hal"), "w").write("\n".join(cl_output))
+        write_file(os.path.join(self.configuration_path, "pregui_call_list.hal"), "\n".join(cl_output))
 
         print(f"writing linuxcnc files to: {self.base_path}")
 
@@ -641,7 +637,7 @@ class LinuxCNC:
             for subroutine in glob.glob(os.path.join(json_path, "subroutines", "*")):
                 target_path = os.path.join(self.configuration_path, path_subroutines, os.path.basename(subroutine))
                 if not os.path.isfile(target_path):
-                    shutil.copy(subroutine, target_path)
+                    copy_file(subroutine, target_path)
 
         path_mcodes = ini_setup.get("RS274NGC", {}).get("USER_M_PATH")
         if path_mcodes and path_mcodes.startswith("./"):
@@ -649,10 +645,10 @@ class LinuxCNC:
             for mcode in glob.glob(os.path.join(json_path, "mcodes", "*")):
                 target_path = os.path.join(self.configuration_path, path_mcodes, os.path.basename(mcode))
                 if not os.path.isfile(target_path):
-                    shutil.copy(mcode, target_path)
+                    copy_file(mcode, target_path)
 
         os.makedirs(self.configuration_path, exist_ok=True)
-        open(os.path.join(self.configuration_path, "rio.ini"), "w").write("\n".join(output))
+        write_file(os.path.join(self.configuration_path, "rio.ini"), "\n".join(output))
 
     def misc(self):
         if not os.path.isfile(os.path.join(self.configuration_path, "tool.tbl")):
@@ -661,7 +657,7 @@ class LinuxCNC:
             tooltbl.append("T2 P2 D0.062500 Z+0.100000 ;1/16 end mill")
             tooltbl.append("T3 P3 D0.201000 Z+1.273000 ;#7 tap drill")
             os.makedirs(self.configuration_path, exist_ok=True)
-            open(os.path.join(self.configuration_path, "tool.tbl"), "w").write("\n".join(tooltbl))
+            write_file(os.path.join(self.configuration_path, "tool.tbl"), "\n".join(tooltbl))
 
     def riof(self):
         linuxcnc_config = self.project.config["jdata"].get("linuxcnc", {})
@@ -1012,33 +1008,42 @@ class LinuxCNC:
                 target_path = os.path.join(self.configuration_path, os.path.basename(uifile))
                 ini_setup["DISPLAY"]["GUI"] = "flexgui.ui"
                 if not os.path.isfile(target_path):
-                    shutil.copy(uifile, target_path)
+                    copy_file(uifile, target_path)
             for qssfile in glob.glob(os.path.join(json_path, "flexgui.qss")):
                 target_path = os.path.join(self.configuration_path, os.path.basename(qssfile))
                 ini_setup["DISPLAY"]["QSS"] = "flexgui.qss"
                 if not os.path.isfile(target_path):
-                    shutil.copy(qssfile, target_path)
+                    copy_file(qssfile, target_path)
             for pyfile in glob.glob(os.path.join(json_path, "flexgui.py")):
                 target_path = os.path.join(self.configuration_path, os.path.basename(pyfile))
                 ini_setup["DISPLAY"]["RESOURCES"] = "flexgui.py"
                 if not os.path.isfile(target_path):
-                    shutil.copy(pyfile, target_path)
+                    copy_file(pyfile, target_path)
 
+        # only the selected vcp generator is imported
         gui_gen = None
         if vcp_mode != "NONE":
             if self.gui_type == "gladevcp":
+                from riocore.generator.gladevcp import gladevcp
+
                 gui_gen = gladevcp(self.gui_prefix, vcp_pos=vcp_pos)
             elif self.gui_type == "pyvcp":
+                from riocore.generator.pyvcp import pyvcp
+
                 gui_gen = pyvcp(self.gui_prefix, vcp_pos=vcp_pos)
-            elif self.gui_type == "gladevcp":
-                gui_gen = gladevcp(self.gui_prefix, vcp_pos=vcp_pos)
             elif self.gui_type == "qtvcp":
+                from riocore.generator.qtvcp import qtvcp
+
                 if gui in {"woodpecker"}:
                     vcp_pos = "TAB"
                 gui_gen = qtvcp(self.gui_prefix, vcp_pos=vcp_pos)
             elif self.gui_type == "qtpyvcp":
+                from riocore.generator.qtpyvcp import qtpyvcp
+
                 gui_gen = qtpyvcp(self.gui_prefix, vcp_pos=vcp_pos)
             elif self.gui_type == "flexvcp":
+                from riocore.generator.flexvcp import flexvcp
+
                 gui_gen = flexvcp(self.gui_prefix, vcp_pos=vcp_pos)
 
         if not gui_gen:
@@ -1379,7 +1384,7 @@ class LinuxCNC:
                 basename = os.path.basename(source)
                 target = os.path.join(self.configuration_path, basename)
                 if os.path.isfile(source):
-                    shutil.copy(source, target)
+                    copy_file(source, target)
                 elif not os.path.isdir(target):
                     shutil.copytree(source, target)
 
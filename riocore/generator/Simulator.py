@@ -4,6 +4,7 @@ import os
 import stat
 
 from riocore.generator import cclient
+from riocore.generator.output import write_file
 
 riocore_path = os.path.dirname(os.path.dirname(__file__))
 
@@ -55,7 +56,7 @@ class Simulator:
         output.append("")
         os.makedirs(self.simulator_path, exist_ok=True)
         target = os.path.join(self.simulator_path, "start.sh")
-        open(target, "w").write("\n".join(output))
+        write_file(target, "\n".join(output))
         os.chmod(target, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
 
     def interface_c(self):
@@ -84,7 +85,7 @@ class Simulator:
                     idata += "}\n"
                     idata += "\n"
                     idata += rdata
-                    open(os.path.join(self.simulator_path, "interface.c"), "w").write(idata)
+                    write_file(os.path.join(self.simulator_path, "interface.c"), idata)
 
     def simulation_c(self):
         output = []
@@ -216,7 +217,7 @@ class Simulator:
         output.append("    return 0;")
         output.append("}")
         output.append("")
-        open(os.path.join(self.simulator_path, "main.c"), "w").write("\n".join(output))
+        write_file(os.path.join(self.simulator_path, "main.c"), "\n".join(output))
 
     def makefile(self):
         output = []
@@ -232,4 +233,4 @@ class Simulator:
         output.append("simulator_run: simulator")
         output.append("	./simulator")
         output.append("")
-        open(os.path.join(self.simulator_path, "Makefile"), "w").write("\n".join(output))
+        write_file(os.path.join(self.simulator_path, "Makefile"), "\n".join(output))
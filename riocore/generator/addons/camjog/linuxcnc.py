@@ -1,7 +1,8 @@
 import os
-import shutil
 import stat
 
+from riocore.generator.output import copy_file
+
 addon_path = os.path.dirname(__file__)
 
 
@@ -12,7 +13,7 @@ def ini(parent, ini_setup):
         if camjog and camjog.get("enable"):
             source = f"{addon_path}/camjog.py"
             target = f"{parent.component_path}/camjog.py"
-            shutil.copy(source, target)
+            copy_file(source, target)
             os.chmod(target, stat.S_IRUSR | stat.S_IWUSR | stat.S_IXUSR | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
             break
 
@@ -0,0 +1,157 @@
+import concurrent.futures
+import contextlib
+import glob
+import io
+import json
+import os
+import tempfile
+import time
+
+from riocore.generator import buildcache
+
+# generates (and builds) many configs in one run:
+#
+#   rio-generator --batch "configs/*.json" -b -w 4 -m 2
+#
+# the generators run in worker processes, the builds in threads (make is a subprocess)
+# with a global job limit. configs with identical gateware (same build cache key)
+# are only built once, the others get the products from the build cache.
+
+
+def config_files(pattern):
+    # glob pattern or a text file with one config (or pattern) per line
+    patterns = [pattern]
+    if pattern.endswith(".txt") and os.path.isfile(pattern):
+        patterns = []
+        for line in open(pattern, "r").read().split("\n"):
+            line = line.strip()
+            if line and not line.startswith("#"):
+                patterns.append(line)
+    files = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern, recursive=True)):
+            if path not in files:
+                files.append(path)
+    return files
+
+
+def generate(config_file, output_path=None, preview=False):
+    import riocore
+
+    result = {
+        "config": config_file,
+        "name": config_file,
+        "output_path": None,
+        "gateware_path": None,
+        "generate": None,
+        "build": None,
+        "status": "ok",
+        "log": "",
+    }
+    start = time.perf_counter()
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            project = riocore.Project(config_file, output_path)
+            project.generator(preview=preview)
+        result["name"] = project.config.get("name", result["name"])
+        result["output_path"] = project.config["output_path"]
+        gateware_path = os.path.join(project.config["output_path"], "Gateware")
+        if os.path.isfile(os.path.join(gateware_path, "Makefile")):
+            result["gateware_path"] = gateware_path
+    except (Exception, SystemExit) as error:
+        # errors of the config are printed before exit()
+        lines = [line for line in log.getvalue().split("\n") if line.strip()]
+        result["status"] = f"failed: {lines[-1].strip() if isinstance(error, SystemExit) and lines else error}"
+    result["generate"] = time.perf_counter() - start
+    result["log"] = log.getvalue()
+    return result
+
+
+def generate_all(config_files, output_path=None, preview=False, workers=None):
+    # configs with the same name would write into the same folder, the others get a subfolder named by the config file
+    names = set()
+    folders = set()
+    output_paths = []
+    for config_file in config_files:
+        try:
+            name = json.loads(open(config_file, "r").read())["name"]
+        except (OSError, ValueError, KeyError, TypeError):
+            # reported by the generator
+            name = None
+        if name is None or name not in names:
+            names.add(name)
+            output_paths.append(output_path)
+            continue
+        stem = os.path.splitext(os.path.basename(config_file))[0]
+        folder = stem
+        while folder in folders:
+            folder = f"{stem}-{len(folders) + 1}"
+        folders.add(folder)
+        output_paths.append(os.path.join(output_path or "Output", folder))
+
+    if workers == 1:
+        return [generate(config_file, config_output_path, preview) for config_file, config_output_path in zip(config_files, output_paths)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate, config_files, output_paths, [preview] * len(config_files)))
+
+
+def build_all(results, cache, make_jobs=1):
+    # one build per gateware key, in parallel up to make_jobs, the others are restored from the cache
+    groups = {}
+    for result in results:
+        if result["status"] != "ok" or not result["gateware_path"]:
+            continue
+        # the key is taken from the cleaned folder
+        with open(os.devnull, "w") as devnull:
+            if buildcache.make(result["gateware_path"], "clean", devnull) != 0:
+                result["status"] = "failed: make clean"
+                continue
+        groups.setdefault(cache.key(result["gateware_path"]), []).append(result)
+
+    def build_group(key, group):
+        for result in group:
+            cached = cache.has(key)
+            start = time.perf_counter()
+            with open(os.path.join(result["gateware_path"], "compile.log"), "w") as log:
+                ret = buildcache.build(result["gateware_path"], cache, log, key=key)
+            result["build"] = time.perf_counter() - start
+            if ret != 0:
+                # same gateware, same error
+                for failed in group[group.index(result) :]:
+                    failed["status"] = f"failed: build ({os.path.join(result['gateware_path'], 'compile.log')})"
+                break
+            result["status"] = "cached" if cached else "built"
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=make_jobs) as executor:
+        for future in [executor.submit(build_group, key, group) for key, group in groups.items()]:
+            future.result()
+    return results
+
+
+def batch(pattern, output_path=None, preview=False, workers=None, build=False, make_jobs=1, use_cache=True):
+    results = generate_all(config_files(pattern), output_path, preview, workers)
+    if build:
+        if use_cache:
+            build_all(results, buildcache.BuildCache(), make_jobs)
+        else:
+            # no persistent cache, but identical gateware is still only built once
+            with tempfile.TemporaryDirectory() as cache_path:
+                build_all(results, buildcache.BuildCache(cache_path), make_jobs)
+    return results
+
+
+def report(results):
+    def seconds(value):
+        return "-" if value is None else f"{value:.2f}s"
+
+    width = max([len(result["name"]) for result in results] + [6])
+    print("")
+    print(f"{'config':{width}s} {'generate':>10s} {'build':>10s}  status")
+    for result in results:
+        print(f"{result['name']:{width}s} {seconds(result['generate']):>10s} {seconds(result['build']):>10s}  {result['status']}")
+    failed = [result for result in results if result["status"].startswith("failed")]
+    print("")
+    print(f"{len(results)} configs, {len(failed)} failed")
+    print("")
+    return not failed
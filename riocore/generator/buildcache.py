@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+
+from riocore.generator import reports
+
+# content addressed store of gateware builds
+#
+#   <cache>/<key>/files.json   build products (bitstream, reports, logs) of the build
+#   <cache>/<key>/files/...    copies of the build products
+#
+# the key is a sha256 over the source files of the gateware folder after 'make clean'
+# (verilog, pins/constraints, the Makefile with the toolchain options) and the toolchain
+# binaries used by the Makefile (path, size and mtime of the installation),
+# so the same gateware of different machines (same board type) is only synthesized once.
+
+VERSION = 1
+# not part of the key: status and documentation files
+IGNORE = {"hash_new.txt", "hash_compiled.txt", "hash_flashed.txt", "interface.html", "compile.log", "flash.log"}
+# shell commands of the Makefile recipes, they are not part of the toolchain
+SHELL_COMMANDS = {"cat", "cd", "cp", "copy", "del", "do", "done", "echo", "for", "grep", "mkdir", "mv", "rm", "type"}
+
+
+def default_path():
+    cache_path = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_path, "riocore", "gateware")
+
+
+def snapshot(path):
+    # {relative path: (mtime_ns, size)} of all files in the folder
+    files = {}
+    for root, dirs, filenames in os.walk(path):
+        dirs.sort()
+        for filename in sorted(filenames):
+            file_path = os.path.join(root, filename)
+            stat = os.stat(file_path)
+            files[os.path.relpath(file_path, path)] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def makefile_tools(makefile_path):
+    # the commands of the Makefile recipes and the search path of the Makefile
+    variables = {}
+
+    def expand(value):
+        return re.sub(r"\$[({](\w+)[)}]", lambda match: variables.get(match.group(1), os.environ.get(match.group(1), "")), value)
+
+    tools = set()
+    for line in open(makefile_path, "r").read().split("\n"):
+        if line.startswith("\t"):
+            for command in re.split(r"&&|\|\||;|\|", line.strip()):
+                words = command.strip().lstrip("@-").split()
+                if words and re.match(r"^[\w+-][\w.+/-]*$", expand(words[0])):
+                    tools.add(expand(words[0]))
+            continue
+        match = re.match(r"^(\w+)\s*:?=\s*(.*)$", line)
+        if match:
+            variables[match.group(1)] = expand(match.group(2).strip())
+    return sorted(tools - SHELL_COMMANDS), variables.get("PATH", os.environ.get("PATH", ""))
+
+
+class BuildCache:
+    def __init__(self, path=None):
+        self.path = path or default_path()
+
+    def sources(self, gateware_path):
+        return sorted(name for name in snapshot(gateware_path) if os.path.basename(name) not in IGNORE)
+
+    def toolchain(self, gateware_path):
+        # identity of the installed toolchain, changes with every update of the binaries
+        toolchain = []
+        tools, search_path = makefile_tools(os.path.join(gateware_path, "Makefile"))
+        for tool in tools:
+            tool_path = shutil.which(tool, path=search_path)
+            if tool_path is None:
+                toolchain.append([tool, None])
+                continue
+            tool_path = os.path.realpath(tool_path)
+            stat = os.stat(tool_path)
+            toolchain.append([tool, tool_path, stat.st_size, stat.st_mtime_ns])
+        return toolchain
+
+    def key(self, gateware_path, target="all"):
+        digest = hashlib.sha256()
+        digest.update(json.dumps({"version": VERSION, "target": target, "toolchain": self.toolchain(gateware_path)}).encode())
+        for name in self.sources(gateware_path):
+            digest.update(f"\0{name}\0".encode())
+            with open(os.path.join(gateware_path, name), "rb") as file:
+                for chunk in iter(lambda: file.read(65536), b""):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def has(self, key):
+        return os.path.isfile(os.path.join(self.path, key, "files.json"))
+
+    def restore(self, key, gateware_path):
+        entry_path = os.path.join(self.path, key)
+        try:
+            files = json.loads(open(os.path.join(entry_path, "files.json"), "r").read())
+        except (OSError, ValueError):
+            return None
+        for name in files:
+            target = os.path.join(gateware_path, name)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            # new mtimes, the products are newer than the sources for make
+            shutil.copy(os.path.join(entry_path, "files", name), target)
+        return files
+
+    def store(self, key, gateware_path, files):
+        entry_path = os.path.join(self.path, key)
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        # the cache is optional, a failed store is not a failed build
+        try:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            for name in files:
+                target = os.path.join(tmp_path, "files", name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.copy2(os.path.join(gateware_path, name), target)
+            open(os.path.join(tmp_path, "files.json"), "w").write(json.dumps(sorted(files), indent=4))
+            if os.path.isdir(entry_path):
+                shutil.rmtree(entry_path)
+            os.replace(tmp_path, entry_path)
+        except OSError as error:
+            print(f"WARNING: can not write build cache: {error}")
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+def make(gateware_path, target, log=None):
+    try:
+        return subprocess.call(["make", target], cwd=gateware_path, stdout=log, stderr=subprocess.STDOUT if log else None)
+    except OSError as error:
+        print(f"ERROR: can not run make: {error}", file=log, flush=True)
+        return 1
+
+
+def build(gateware_path, cache=None, log=None, target="all", key=None):
+    # make clean all, the products come from the cache if the same gateware was already build
+    # key: cache key of the already cleaned folder (batch builds)
+    if key is None:
+        ret = make(gateware_path, "clean", log)
+        if ret != 0:
+            return ret
+
+    if cache is not None:
+        if key is None:
+            key = cache.key(gateware_path, target)
+        files = cache.restore(key, gateware_path)
+        if files is not None:
+            print(f"gateware restored from build cache ({key[:12]}): {len(files)} files", file=log, flush=True)
+            hash_new = os.path.join(gateware_path, "hash_new.txt")
+            if os.path.isfile(hash_new):
+                shutil.copy(hash_new, os.path.join(gateware_path, "hash_compiled.txt"))
+            return reports.result(gateware_path, log)
+
+    before = snapshot(gateware_path)
+    ret = make(gateware_path, target, log)
+    if ret != 0:
+        return ret
+    reports.build_report(gateware_path)
+    if cache is not None:
+        files = [name for name, stat in snapshot(gateware_path).items() if before.get(name) != stat and os.path.basename(name) not in IGNORE]
+        cache.store(key, gateware_path, files)
+    return reports.result(gateware_path, log)
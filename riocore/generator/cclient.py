@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 def riocore_h(project, folder):
     sysclk_speed = project.config["speed"]
@@ -64,7 +66,7 @@ def riocore_h(project, folder):
                     output.append(f"extern uint8_t {variable_name};")
     output.append("")
 
-    open(os.path.join(folder, "riocore.h"), "w").write("\n".join(output))
+    write_file(os.path.join(folder, "riocore.h"), "\n".join(output))
 
 
 def riocore_c(project, folder):
@@ -207,4 +209,4 @@ def riocore_c(project, folder):
     output.append("")
     output.append("}")
     output.append("")
-    open(os.path.join(folder, "riocore.c"), "w").write("\n".join(output))
+    write_file(os.path.join(folder, "riocore.c"), "\n".join(output))
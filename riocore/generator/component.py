@@ -2,6 +2,8 @@ import glob
 import os
 import sys
 
+from riocore.generator.output import write_file
+
 riocore_path = os.path.dirname(os.path.dirname(__file__))
 
 
@@ -242,7 +244,7 @@ class component:
         output.append("")
 
         os.makedirs(self.component_path, exist_ok=True)
-        open(os.path.join(self.component_path, "riocomp.c"), "w").write("\n".join(output))
+        write_file(os.path.join(self.component_path, "riocomp.c"), "\n".join(output))
 
     def component_variables(self):
         output = []
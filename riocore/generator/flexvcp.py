@@ -1,6 +1,8 @@
 from lxml import etree
 import os
 
+from riocore.generator.output import write_file
+
 
 class flexvcp:
     def __init__(self, prefix="rio-gui", vcp_pos=None):
@@ -35,7 +37,7 @@ class flexvcp:
             for child in rio_items:
                 element.append(child)
         self.formated = etree.tostring(root, pretty_print=True).decode()
-        open(ui_filename, "w").write(self.formated)
+        write_file(ui_filename, self.formated)
 
     def add_property(self, name, value, ptype="number"):
         self.cfgxml_data.append(f'      <property name="{name}">')
@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class gladevcp:
     def __init__(self, prefix="gladevcp", vcp_pos=None):
@@ -60,8 +62,8 @@ def get_handlers(halcomp,builder,useropts):
     return [HandlerClass(halcomp,builder,useropts)]
 
 """)
-        open(gvcp_filename, "w").write("\n".join(handler_py))
-        open(ui_filename, "w").write("\n".join(self.cfgxml_data))
+        write_file(gvcp_filename, "\n".join(handler_py))
+        write_file(ui_filename, "\n".join(self.cfgxml_data))
 
     def draw_tabs_begin(self, names):
         self.cfgxml_data.append("""
@@ -0,0 +1,60 @@
+import os
+import shutil
+
+# the generators write through these helpers: files with unchanged content are not touched,
+# so make and the toolchains see them as up to date (no resynthesis after a hal-only change)
+
+
+class OutputFiles:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.changed = []
+        self.unchanged = 0
+
+    def same(self, path, data):
+        try:
+            if os.path.getsize(path) < len(data):
+                return False
+            with open(path, "r") as file:
+                return file.read() == data
+        except (OSError, ValueError):
+            return False
+
+    def write(self, path, data):
+        if self.same(path, data):
+            self.unchanged += 1
+            return False
+        open(path, "w").write(data)
+        self.changed.append(path)
+        return True
+
+    def copy(self, source, target):
+        if os.path.isdir(target):
+            target = os.path.join(target, os.path.basename(source))
+        try:
+            if os.path.getsize(source) == os.path.getsize(target) and open(source, "rb").read() == open(target, "rb").read():
+                self.unchanged += 1
+                return False
+        except OSError:
+            pass
+        shutil.copy(source, target)
+        self.changed.append(target)
+        return True
+
+    def report(self, base_path):
+        print(f"output: {len(self.changed)} files changed, {self.unchanged} unchanged")
+        for path in sorted(self.changed):
+            print(f"    {os.path.relpath(path, base_path)}")
+
+
+output_files = OutputFiles()
+
+
+def write_file(path, data):
+    return output_files.write(path, data)
+
+
+def copy_file(source, target):
+    return output_files.copy(source, target)
@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -28,4 +30,4 @@ class Pins:
 
             data.append("")
         data.append("")
-        open(os.path.join(path, "pins.ccf"), "w").write("\n".join(data))
+        write_file(os.path.join(path, "pins.ccf"), "\n".join(data))
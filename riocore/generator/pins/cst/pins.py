@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -29,4 +31,4 @@ class Pins:
 
             data.append("")
         data.append("")
-        open(os.path.join(path, "pins.cst"), "w").write("\n".join(data))
+        write_file(os.path.join(path, "pins.cst"), "\n".join(data))
@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -48,4 +50,4 @@ class Pins:
 
             data.append("")
         data.append("")
-        open(os.path.join(path, "pins.lpf"), "w").write("\n".join(data))
+        write_file(os.path.join(path, "pins.lpf"), "\n".join(data))
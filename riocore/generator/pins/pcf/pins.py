@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -25,4 +27,4 @@ class Pins:
 
                 data.append(f"set_io {' '.join(options)}")
             data.append("")
-        open(os.path.join(path, "pins.pcf"), "w").write("\n".join(data))
+        write_file(os.path.join(path, "pins.pcf"), "\n".join(data))
@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -78,5 +80,5 @@ class Pins:
         interface.append("design.save()")
         interface.append("")
 
-        open(os.path.join(path, "pins.py"), "w").write("\n".join(interface))
-        open(os.path.join(path, "rio.sdc"), "w").write("")
+        write_file(os.path.join(path, "pins.py"), "\n".join(interface))
+        write_file(os.path.join(path, "rio.sdc"), "")
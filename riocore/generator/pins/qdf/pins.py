@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -30,4 +32,4 @@ class Pins:
                     data.append(f"set_instance_assignment -name IO_STANDARD \"{iostandard}\" -to {pin_config['varname']}")
 
             data.append("")
-        open(os.path.join(path, "pins.qdf"), "w").write("\n".join(data))
+        write_file(os.path.join(path, "pins.qdf"), "\n".join(data))
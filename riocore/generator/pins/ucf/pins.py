@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -27,4 +29,4 @@ class Pins:
                 else:
                     data.append(f"NET \"{pin_config['varname']}\"       LOC = \"{pin_config['pin']}\" | IOSTANDARD = {iostandard} | DRIVE = {drive} | SLEW = {slew} ;")
             data.append("")
-        open(os.path.join(path, "pins.ucf"), "w").write("\n".join(data))
+        write_file(os.path.join(path, "pins.ucf"), "\n".join(data))
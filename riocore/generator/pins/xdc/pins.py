@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class Pins:
     def __init__(self, config):
@@ -19,4 +21,4 @@ class Pins:
                     print('WARNING: please change your pin-config to : "pull": "up"')
                     data.append(f"set_property PULLUP TRUE [get_ports {pin_config['varname']}]")
             data.append("")
-        open(os.path.join(path, "pins.xdc"), "w").write("\n".join(data))
+        write_file(os.path.join(path, "pins.xdc"), "\n".join(data))
@@ -0,0 +1,602 @@
+import math
+import os
+import re
+from fractions import Fraction
+
+from riocore.generator.output import write_file
+from riocore.index import index as metadata_index
+
+# pll parameter solvers, in-process replacements of the vendor tools (icepll, ecppll, qmegawiz) and the former files/gowin-pll.py
+#
+#   setup = solve("ice40", "up5k", 12000000, 30000000)
+#   setup["fout"]   achieved output frequency in Hz
+#   verilog(setup)  the pll module (pll.v)
+#
+# the searches use the limits and the tie breaking of the tools they replace, the last divider of a
+# chain is calculated from the target instead of searched, so the search is only over the first two stages.
+# results are cached in the metadata index by (family, device, fin, fout).
+
+# gowin devices (speed grade), limits from DS117E / DS861E (device_limits of the former files/gowin-pll.py)
+GOWIN_LIMITS = {
+    "GW1NR-1 C6/I5": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 900, "clkout_min": 3.125, "clkout_max": 450},
+    "GW1NR-1 C5/I4": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 320, "vco_min": 320, "vco_max": 720, "clkout_min": 2.5, "clkout_max": 360},
+    "GW1NR-2 C7/I6": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 800, "clkout_min": 3.125, "clkout_max": 750},
+    "GW1NR-2 C6/I5": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 800, "clkout_min": 3.125, "clkout_max": 750},
+    "GW1NR-2 C5/I4": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 320, "vco_min": 320, "vco_max": 640, "clkout_min": 2.5, "clkout_max": 640},
+    "GW1NR-4 C6/I5": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 1000, "clkout_min": 3.125, "clkout_max": 500},
+    "GW1NR-4 C5/I4": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 320, "vco_min": 320, "vco_max": 800, "clkout_min": 2.5, "clkout_max": 400},
+    "GW1NSR-4(C) C7/I6": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 1200, "clkout_min": 3.125, "clkout_max": 600},
+    "GW1NSR-4(C) C6/I5": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 1200, "clkout_min": 3.125, "clkout_max": 600},
+    "GW1NSR-4(C) C5/I4": {"pll_name": "PLLVR", "pfd_min": 3, "pfd_max": 320, "vco_min": 320, "vco_max": 960, "clkout_min": 2.5, "clkout_max": 480},
+    "GW1NR-9 C7/I6": {"pll_name": "rPLL", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 1200, "clkout_min": 3.125, "clkout_max": 600},
+    "GW1NR-9 C6/I5": {"pll_name": "rPLL", "pfd_min": 3, "pfd_max": 400, "vco_min": 400, "vco_max": 1200, "clkout_min": 3.125, "clkout_max": 600},
+    # vco_min is 3200 in gowin-pll.py (typo, no setup possible)
+    "GW1NR-9 C6/I4": {"pll_name": "rPLL", "pfd_min": 3, "pfd_max": 320, "vco_min": 320, "vco_max": 960, "clkout_min": 2.5, "clkout_max": 480},
+}
+GOWIN_ODIV = (2, 4, 8, 16, 32, 48, 64, 80, 96, 112, 128)
+
+# toolchains with pll support, the pll.v is written by generate()
+TOOLCHAINS = {"icestorm", "gowin", "vivado", "quartus", "efinity"}
+# pll setups of the toolchain projects (efinity interface designer)
+FIXED = {("efinity", 33330000, 100000000)}
+
+
+def gowin_device(device):
+    # part number to the limits entry: GW1NR-LV9QN88PC6/I5 -> GW1NR-9 C6/I5, GW1NSR-LV4CQN48PC7/I6 -> GW1NSR-4(C) C7/I6
+    match = re.match(r"^(GW1NR|GW1NSR)-[A-Z]{2}(\d+)C?[A-Z0-9]*?(C\d/I\d)$", device or "")
+    if not match:
+        return None
+    name, density, grade = match.groups()
+    if name == "GW1NSR":
+        density = f"{density}(C)"
+    gowin_device = f"{name}-{density} {grade}"
+    if gowin_device not in GOWIN_LIMITS:
+        return None
+    return gowin_device
+
+
+def pll_type(family, device=None):
+    if family == "ice40":
+        return "ice40"
+    if family == "ecp5":
+        return "ecp5"
+    if gowin_device(device):
+        return "gowin"
+    if family == "xc7":
+        return "mmcm"
+    if family in {"MAX 10", "Cyclone 10 LP"}:
+        return "altpll"
+    return None
+
+
+def new_setup(pll, family, device, clock_in, clock_out, fout, params):
+    return {
+        "pll": pll,
+        "family": family,
+        "device": device,
+        "fin": int(clock_in),
+        "fout_requested": int(clock_out),
+        "fout": round(fout * 1000000),
+        "params": params,
+    }
+
+
+def ice40(family, device, clock_in, clock_out):
+    # icepll, SIMPLE feedback: fout = fin * (DIVF + 1) / ((DIVR + 1) * 2^DIVQ)
+    f_pllin = clock_in / 1000000
+    f_pllout = clock_out / 1000000
+    if not 10 <= f_pllin <= 133 or not 16 <= f_pllout <= 275:
+        return None
+    best = None
+    for divr in range(16):
+        f_pfd = f_pllin / (divr + 1)
+        if f_pfd < 10 or f_pfd > 133:
+            continue
+        # VCO range 533-1066 MHz
+        for divf in range(max(0, math.ceil(533 / f_pfd) - 2), min(127, math.floor(1066 / f_pfd)) + 1):
+            f_vco = f_pfd * (divf + 1)
+            if f_vco < 533 or f_vco > 1066:
+                continue
+            for divq in range(1, 7):
+                fout = f_vco * 2**-divq
+                if best is None or abs(fout - f_pllout) < abs(best[0] - f_pllout):
+                    best = (fout, divr, divf, divq)
+    if best is None:
+        return None
+    fout, divr, divf, divq = best
+    f_pfd = f_pllin / (divr + 1)
+    filter_range = 1 if f_pfd < 17 else 2 if f_pfd < 26 else 3 if f_pfd < 44 else 4 if f_pfd < 66 else 5 if f_pfd < 101 else 6
+    params = {"DIVR": divr, "DIVF": divf, "DIVQ": divq, "FILTER_RANGE": filter_range, "pad": device == "up5k"}
+    return new_setup("ice40", family, device, clock_in, clock_out, fout, params)
+
+
+def ecp5(family, device, clock_in, clock_out):
+    # ecppll, feedback from CLKOP: fout = fin / CLKI_DIV * CLKFB_DIV, the VCO (fout * CLKOP_DIV) nearest to 600 MHz
+    fin = Fraction(int(clock_in), 1000000)
+    target = Fraction(int(clock_out), 1000000)
+    if not 8 <= fin <= 400 or not 10 <= target <= 400:
+        return None
+    best = None
+    for refclk_div in range(1, 129):
+        fpfd = fin / refclk_div
+        if fpfd < Fraction(3125, 1000) or fpfd > 400:
+            continue
+        for feedback_div in range(1, 81):
+            fout = fpfd * feedback_div
+            # VCO range 400-800 MHz
+            low = max(1, math.ceil(400 / fout))
+            high = min(128, math.floor(800 / fout))
+            if low > high:
+                continue
+            # the lower divider on a tie, like the ascending search of ecppll
+            candidates = sorted({min(max(math.floor(600 / fout), low), high), min(max(math.ceil(600 / fout), low), high)})
+            output_div = min(candidates, key=lambda div: abs(fout * div - 600))
+            error = abs(fout - target)
+            fvco = fout * output_div
+            if best is None or error < best[0] or (error == best[0] and abs(fvco - 600) < abs(best[1] - 600)):
+                best = (error, fvco, refclk_div, feedback_div, output_div)
+    if best is None:
+        return None
+    error, fvco, refclk_div, feedback_div, output_div = best
+    fout = fvco / output_div
+    params = {"CLKI_DIV": refclk_div, "CLKFB_DIV": feedback_div, "CLKOP_DIV": output_div, "CLKOP_CPHASE": output_div // 2, "fvco": float(fvco)}
+    return new_setup("ecp5", family, device, clock_in, clock_out, float(fout), params)
+
+
+def gowin(family, device, clock_in, clock_out):
+    # gowin-pll.py: CLKOUT = fin * (FBDIV_SEL + 1) / (IDIV_SEL + 1), VCO = CLKOUT * ODIV_SEL
+    limits = GOWIN_LIMITS[gowin_device(device)]
+    fclkin = clock_in / 1000000
+    fclkout = clock_out / 1000000
+    setup = None
+    min_diff = fclkin
+    for idiv_sel in range(64):
+        pfd = fclkin / (idiv_sel + 1)
+        if not (limits["pfd_min"] < pfd < limits["pfd_max"]):
+            continue
+        for fbdiv_sel in range(64):
+            clkout = fclkin * (fbdiv_sel + 1) / (idiv_sel + 1)
+            if not (limits["clkout_min"] < clkout < limits["clkout_max"]):
+                continue
+            diff = abs(fclkout - clkout)
+            if diff >= min_diff:
+                continue
+            for odiv_sel in GOWIN_ODIV:
+                vco = (fclkin * (fbdiv_sel + 1) * odiv_sel) / (idiv_sel + 1)
+                if limits["vco_min"] < vco < limits["vco_max"]:
+                    min_diff = diff
+                    setup = {"IDIV_SEL": idiv_sel, "FBDIV_SEL": fbdiv_sel, "ODIV_SEL": odiv_sel, "PFD": pfd, "CLKOUT": clkout, "VCO": vco}
+                    break
+    if setup is None:
+        return None
+    setup["gowin_device"] = gowin_device(device)
+    return new_setup("gowin", family, device, clock_in, clock_out, setup["CLKOUT"], setup)
+
+
+def mmcm(family, device, clock_in, clock_out):
+    # 7-series MMCME2_BASE: VCO = fin * CLKFBOUT_MULT_F / DIVCLK_DIVIDE, CLKOUT0 = VCO / CLKOUT0_DIVIDE_F, CLKOUT1 = 25 MHz
+    # the multiplier and CLKOUT0 divider in 1/8 steps, integer values (less jitter), a high PFD and a high VCO are preferred
+    fin = Fraction(int(clock_in), 1000000)
+    target = Fraction(int(clock_out), 1000000)
+    if not 10 <= fin <= 800 or not 5 <= target <= 800:
+        return None
+    best = None
+    for divclk in range(1, 107):
+        fpfd = fin / divclk
+        if fpfd < 10:
+            break
+        if fpfd > 450:
+            continue
+        # VCO range 600-1200 MHz
+        for mult8 in range(max(16, math.ceil(600 * 8 / fpfd)), min(512, math.floor(1200 * 8 / fpfd)) + 1):
+            fvco = fpfd * mult8 / 8
+            ideal = fvco * 8 / target
+            for div8 in {math.floor(ideal), math.ceil(ideal)}:
+                if div8 < 16:
+                    div8 = 8 if div8 < 12 else 16
+                div8 = min(div8, 1024)
+                div25 = min(max(round(fvco / 25), 1), 128)
+                key = (
+                    abs(fvco * 8 / div8 - target),
+                    abs(fvco / div25 - 25),
+                    (mult8 % 8 != 0) + (div8 % 8 != 0),
+                    divclk,
+                    -fvco,
+                )
+                if best is None or key < best[0]:
+                    best = (key, divclk, mult8, div8, div25, fvco)
+    if best is None:
+        return None
+    key, divclk, mult8, div8, div25, fvco = best
+    params = {
+        "DIVCLK_DIVIDE": divclk,
+        "CLKFBOUT_MULT_F": mult8 / 8,
+        "CLKOUT0_DIVIDE_F": div8 / 8,
+        "CLKOUT1_DIVIDE": div25,
+        "CLKIN1_PERIOD": round(1000 / float(fin), 3),
+        "fvco": float(fvco),
+        "fout25": float(fvco / div25),
+    }
+    return new_setup("mmcm", family, device, clock_in, clock_out, float(fvco * 8 / div8), params)
+
+
+def altpll(family, device, clock_in, clock_out):
+    # MAX 10 / Cyclone 10 LP altpll: fout = fin * M / (N * C), quartus places the counters from the clk0 ratio
+    fin = Fraction(int(clock_in), 1000000)
+    target = Fraction(int(clock_out), 1000000)
+    if not 5 <= fin <= 472 or not target <= 472:
+        return None
+    best = None
+    for n in range(1, 513):
+        fpfd = fin / n
+        if fpfd < 5:
+            break
+        if fpfd > 325:
+            continue
+        # VCO range 600-1300 MHz
+        for m in range(max(1, math.ceil(600 / fpfd)), min(512, math.floor(1300 / fpfd)) + 1):
+            fvco = fpfd * m
+            ideal = fvco / target
+            for c in {math.floor(ideal), math.ceil(ideal)}:
+                c = min(max(c, 1), 512)
+                ratio = Fraction(m, n * c)
+                key = (abs(fin * ratio - target), ratio.denominator, -fvco)
+                if best is None or key < best[0]:
+                    best = (key, ratio)
+    if best is None:
+        return None
+    ratio = best[1]
+    params = {"multiply_by": ratio.numerator, "divide_by": ratio.denominator, "period_ps": round(1000000 / float(fin))}
+    return new_setup("altpll", family, device, clock_in, clock_out, float(fin * ratio), params)
+
+
+SOLVERS = {"ice40": ice40, "ecp5": ecp5, "gowin": gowin, "mmcm": mmcm, "altpll": altpll}
+
+
+def solve(family, device, clock_in, clock_out):
+    # pll setup for the frequencies (Hz), None if the family or the frequencies are not supported
+    solver = pll_type(family, device)
+    if solver is None:
+        return None
+    name = f"pll:{family}:{device}:{int(clock_in)}:{int(clock_out)}"
+    return metadata_index.entry(name, [__file__], lambda: SOLVERS[solver](family, device, clock_in, clock_out))
+
+
+def ice40_verilog(setup):
+    params = setup["params"]
+    if params["pad"]:
+        primitive, clock_in, clock_out = ("SB_PLL40_PAD", "PACKAGEPIN", "PLLOUTGLOBAL")
+    else:
+        primitive, clock_in, clock_out = ("SB_PLL40_CORE", "REFERENCECLK", "PLLOUTCORE")
+    output = []
+    output.append("/**")
+    output.append(" * PLL configuration")
+    output.append(" *")
+    output.append(" * This Verilog module was generated automatically")
+    output.append(" * using the icepll tool from the IceStorm project.")
+    output.append(" * Use at your own risk.")
+    output.append(" *")
+    output.append(f" * Given input frequency:        {setup['fin'] / 1000000:8.3f} MHz")
+    output.append(f" * Requested output frequency:   {setup['fout_requested'] / 1000000:8.3f} MHz")
+    output.append(f" * Achieved output frequency:    {setup['fout'] / 1000000:8.3f} MHz")
+    output.append(" */")
+    output.append("")
+    output.append("module pll(")
+    output.append("\tinput  clock_in,")
+    output.append("\toutput clock_out,")
+    output.append("\toutput locked")
+    output.append("\t);")
+    output.append("")
+    output.append(f"{primitive} #(")
+    output.append('\t\t.FEEDBACK_PATH("SIMPLE"),')
+    output.append(f"\t\t.DIVR(4'b{params['DIVR']:04b}),\t\t// DIVR = {params['DIVR']:2d}")
+    output.append(f"\t\t.DIVF(7'b{params['DIVF']:07b}),\t// DIVF = {params['DIVF']:2d}")
+    output.append(f"\t\t.DIVQ(3'b{params['DIVQ']:03b}),\t\t// DIVQ = {params['DIVQ']:2d}")
+    output.append(f"\t\t.FILTER_RANGE(3'b{params['FILTER_RANGE']:03b})\t// FILTER_RANGE = {params['FILTER_RANGE']}")
+    output.append("\t) uut (")
+    output.append("\t\t.LOCK(locked),")
+    output.append("\t\t.RESETB(1'b1),")
+    output.append("\t\t.BYPASS(1'b0),")
+    output.append(f"\t\t.{clock_in}(clock_in),")
+    output.append(f"\t\t.{clock_out}(clock_out)")
+    output.append("\t\t);")
+    output.append("")
+    output.append("endmodule")
+    output.append("")
+    return "\n".join(output)
+
+
+def ecp5_verilog(setup):
+    params = setup["params"]
+    fin = setup["fin"] / 1000000
+    fout = setup["fout"] / 1000000
+    output = []
+    output.append("// diamond 3.7 accepts this PLL")
+    output.append("// diamond 3.8-3.9 is untested")
+    output.append("// diamond 3.10 or higher is likely to abort with error about unable to use feedback signal")
+    output.append("// cause of this could be from wrong CPHASE/FPHASE parameters")
+    output.append("module pll")
+    output.append("(")
+    output.append(f"    input clkin, // {fin:g} MHz, 0 deg")
+    output.append(f"    output clkout0, // {fout:g} MHz, 0 deg")
+    output.append("    output locked")
+    output.append(");")
+    output.append(f'(* FREQUENCY_PIN_CLKI="{fin:g}" *)')
+    output.append(f'(* FREQUENCY_PIN_CLKOP="{fout:g}" *)')
+    output.append('(* ICP_CURRENT="12" *) (* LPF_RESISTOR="8" *) (* MFG_ENABLE_FILTEROPAMP="1" *) (* MFG_GMCREF_SEL="2" *)')
+    output.append("EHXPLLL #(")
+    output.append('        .PLLRST_ENA("DISABLED"),')
+    output.append('        .INTFB_WAKE("DISABLED"),')
+    output.append('        .STDBY_ENABLE("DISABLED"),')
+    output.append('        .DPHASE_SOURCE("DISABLED"),')
+    output.append('        .OUTDIVIDER_MUXA("DIVA"),')
+    output.append('        .OUTDIVIDER_MUXB("DIVB"),')
+    output.append('        .OUTDIVIDER_MUXC("DIVC"),')
+    output.append('        .OUTDIVIDER_MUXD("DIVD"),')
+    output.append(f"        .CLKI_DIV({params['CLKI_DIV']}),")
+    output.append('        .CLKOP_ENABLE("ENABLED"),')
+    output.append(f"        .CLKOP_DIV({params['CLKOP_DIV']}),")
+    output.append(f"        .CLKOP_CPHASE({params['CLKOP_CPHASE']}),")
+    output.append("        .CLKOP_FPHASE(0),")
+    output.append('        .FEEDBK_PATH("CLKOP"),')
+    output.append(f"        .CLKFB_DIV({params['CLKFB_DIV']})")
+    output.append("    ) pll_i (")
+    output.append("        .RST(1'b0),")
+    output.append("        .STDBY(1'b0),")
+    output.append("        .CLKI(clkin),")
+    output.append("        .CLKOP(clkout0),")
+    output.append("        .CLKFB(clkout0),")
+    output.append("        .CLKINTFB(),")
+    output.append("        .PHASESEL0(1'b0),")
+    output.append("        .PHASESEL1(1'b0),")
+    output.append("        .PHASEDIR(1'b1),")
+    output.append("        .PHASESTEP(1'b1),")
+    output.append("        .PHASELOADREG(1'b1),")
+    output.append("        .PLLWAKESYNC(1'b0),")
+    output.append("        .ENCLKOP(1'b0),")
+    output.append("        .LOCK(locked)")
+    output.append("\t);")
+    output.append("endmodule")
+    output.append("")
+    return "\n".join(output)
+
+
+def gowin_verilog(setup):
+    params = setup["params"]
+    limits = GOWIN_LIMITS[params["gowin_device"]]
+    fin = setup["fin"] / 1000000
+    extra_options = ".VREN(1'b1)," if limits["pll_name"] == "PLLVR" else ""
+    return f"""/**
+ * PLL configuration
+ *
+ * This Verilog module was generated automatically
+ * using the gowin-pll tool.
+ * Use at your own risk.
+ *
+ * Target-Device:                {params["gowin_device"]}
+ * Given input frequency:        {fin:0.3f} MHz
+ * Requested output frequency:   {setup["fout_requested"] / 1000000:0.3f} MHz
+ * Achieved output frequency:    {params["CLKOUT"]:0.3f} MHz
+ */
+
+module pll(
+        input  clock_in,
+        output clock_out,
+        output locked
+    );
+
+    {limits["pll_name"]} #(
+        .FCLKIN("{fin}"),
+        .IDIV_SEL({params["IDIV_SEL"]}), // -> PFD = {params["PFD"]} MHz (range: {limits["pfd_min"]}-{limits["pfd_max"]} MHz)
+        .FBDIV_SEL({params["FBDIV_SEL"]}), // -> CLKOUT = {params["CLKOUT"]} MHz (range: {limits["vco_min"]}-{limits["clkout_max"]} MHz)
+        .ODIV_SEL({params["ODIV_SEL"]}) // -> VCO = {params["VCO"]} MHz (range: {limits["clkout_max"]}-{limits["vco_max"]} MHz)
+    ) pll (.CLKOUTP(), .CLKOUTD(), .CLKOUTD3(), .RESET(1'b0), .RESET_P(1'b0), .CLKFB(1'b0), .FBDSEL(6'b0), .IDSEL(6'b0), .ODSEL(6'b0), .PSDA(4'b0), .DUTYDA(4'b0), .FDLY(4'b0), {extra_options}
+        .CLKIN(clock_in), // {fin} MHz
+        .CLKOUT(clock_out), // {params["CLKOUT"]} MHz
+        .LOCK(locked)
+    );
+
+endmodule
+
+"""
+
+
+def mmcm_verilog(setup):
+    params = setup["params"]
+
+    def number(value):
+        return f"{value:g}"
+
+    return f"""
+module pll (
+        input  clock_in,
+        output clock_out,
+        output clock25_out,
+        output reset,
+        output locked
+    );
+
+    wire clk_ibufg;
+    wire clk_mmcm_out;
+    wire clk_int;
+    wire rst_int;
+
+    wire locked;
+    wire mmcm_clkfb;
+
+    IBUFG clk_ibufg_inst(
+        .I(clock_in),
+        .O(clk_ibufg)
+    );
+
+    wire clk_25mhz_mmcm_out;
+
+    MMCME2_BASE #(
+        .BANDWIDTH("OPTIMIZED"),
+        .CLKOUT0_DIVIDE_F({number(params["CLKOUT0_DIVIDE_F"])}),
+        .CLKOUT0_DUTY_CYCLE(0.5),
+        .CLKOUT0_PHASE(0),
+        .CLKOUT1_DIVIDE({params["CLKOUT1_DIVIDE"]}),
+        .CLKOUT1_DUTY_CYCLE(0.5),
+        .CLKOUT1_PHASE(0),
+        .CLKOUT2_DIVIDE(1),
+        .CLKOUT2_DUTY_CYCLE(0.5),
+        .CLKOUT2_PHASE(0),
+        .CLKOUT3_DIVIDE(1),
+        .CLKOUT3_DUTY_CYCLE(0.5),
+        .CLKOUT3_PHASE(0),
+        .CLKOUT4_DIVIDE(1),
+        .CLKOUT4_DUTY_CYCLE(0.5),
+        .CLKOUT4_PHASE(0),
+        .CLKOUT5_DIVIDE(1),
+        .CLKOUT5_DUTY_CYCLE(0.5),
+        .CLKOUT5_PHASE(0),
+        .CLKOUT6_DIVIDE(1),
+        .CLKOUT6_DUTY_CYCLE(0.5),
+        .CLKOUT6_PHASE(0),
+        .CLKFBOUT_MULT_F({number(params["CLKFBOUT_MULT_F"])}),
+        .CLKFBOUT_PHASE(0),
+        .DIVCLK_DIVIDE({params["DIVCLK_DIVIDE"]}),
+        .REF_JITTER1(0.010),
+        .CLKIN1_PERIOD({params["CLKIN1_PERIOD"]}),
+        .STARTUP_WAIT("FALSE"),
+        .CLKOUT4_CASCADE("FALSE")
+    ) clk_mmcm_inst (
+        .CLKIN1(clk_ibufg),
+        .CLKFBIN(mmcm_clkfb),
+        .RST(0),
+        .PWRDWN(1'b0),
+        .CLKOUT0(clk_mmcm_out),
+        .CLKOUT0B(),
+        .CLKOUT1(clk_25mhz_mmcm_out),
+        .CLKOUT1B(),
+        .CLKOUT2(),
+        .CLKOUT2B(),
+        .CLKOUT3(),
+        .CLKOUT3B(),
+        .CLKOUT4(),
+        .CLKOUT5(),
+        .CLKOUT6(),
+        .CLKFBOUT(mmcm_clkfb),
+        .CLKFBOUTB(),
+        .LOCKED(locked)
+    );
+
+    BUFG clk_bufg_inst (
+        .I(clk_mmcm_out),
+        .O(clock_out)
+    );
+
+    BUFG clk_25mhz_bufg_inst (
+        .I(clk_25mhz_mmcm_out),
+        .O(clock25_out)
+    );
+
+    sync_reset #(
+        .N(4)
+    ) sync_reset_inst (
+        .clk(clock_out),
+        .rst(~locked),
+        .out(reset)
+    );
+
+endmodule
+
+"""
+
+
+def altpll_verilog(setup):
+    params = setup["params"]
+    output = []
+    output.append("// altpll configuration")
+    output.append("//")
+    output.append(f"// Target-Device:                {setup['family']}")
+    output.append(f"// Given input frequency:        {setup['fin'] / 1000000:0.3f} MHz")
+    output.append(f"// Requested output frequency:   {setup['fout_requested'] / 1000000:0.3f} MHz")
+    output.append(f"// Achieved output frequency:    {setup['fout'] / 1000000:0.3f} MHz")
+    output.append("")
+    output.append("module pll (")
+    output.append("        inclk0,")
+    output.append("        c0,")
+    output.append("        locked")
+    output.append("    );")
+    output.append("")
+    output.append("    input inclk0;")
+    output.append("    output c0;")
+    output.append("    output locked;")
+    output.append("")
+    output.append("    wire [4:0] clk;")
+    output.append("")
+    output.append("    altpll #(")
+    output.append('        .bandwidth_type("AUTO"),')
+    output.append(f"        .clk0_divide_by({params['divide_by']}),")
+    output.append("        .clk0_duty_cycle(50),")
+    output.append(f"        .clk0_multiply_by({params['multiply_by']}),")
+    output.append('        .clk0_phase_shift("0"),')
+    output.append('        .compensate_clock("CLK0"),')
+    output.append(f"        .inclk0_input_frequency({params['period_ps']}),")
+    output.append(f'        .intended_device_family("{setup["family"]}"),')
+    output.append('        .lpm_hint("CBX_MODULE_PREFIX=pll"),')
+    output.append('        .lpm_type("altpll"),')
+    output.append('        .operation_mode("NORMAL"),')
+    output.append('        .pll_type("AUTO"),')
+    output.append('        .port_clk0("PORT_USED"),')
+    output.append('        .port_clk1("PORT_UNUSED"),')
+    output.append('        .port_clk2("PORT_UNUSED"),')
+    output.append('        .port_clk3("PORT_UNUSED"),')
+    output.append('        .port_clk4("PORT_UNUSED"),')
+    output.append('        .port_locked("PORT_USED"),')
+    output.append('        .self_reset_on_loss_lock("OFF"),')
+    output.append("        .width_clock(5)")
+    output.append("    ) altpll_component (")
+    output.append("        .inclk({1'b0, inclk0}),")
+    output.append("        .clk(clk),")
+    output.append("        .locked(locked)")
+    output.append("    );")
+    output.append("")
+    output.append("    assign c0 = clk[0];")
+    output.append("")
+    output.append("endmodule")
+    output.append("")
+    return "\n".join(output)
+
+
+TEMPLATES = {"ice40": ice40_verilog, "ecp5": ecp5_verilog, "gowin": gowin_verilog, "mmcm": mmcm_verilog, "altpll": altpll_verilog}
+
+
+def verilog(setup):
+    return TEMPLATES[setup["pll"]](setup)
+
+
+def system_clock(config):
+    # achieved system clock (Hz), solved once before the generators run, the setup is kept for generate()
+    clock_in = int(config["osc_clock"])
+    clock_out = int(config["speed"])
+    setup = config.get("pll_setup")
+    if setup is not None and setup["fin"] == clock_in and setup["fout"] == clock_out:
+        return clock_out
+    setup = solve(config["jdata"]["family"], config["jdata"].get("type"), clock_in, clock_out)
+    metadata_index.save()
+    config["pll_setup"] = setup
+    if setup is not None:
+        if setup["fout"] != clock_out:
+            print(f"WARNING: achieved PLL frequency is: {setup['fout']}")
+        return setup["fout"]
+    if (config["toolchain"], clock_in, clock_out) in FIXED:
+        return clock_out
+    if config["toolchain"] in TOOLCHAINS:
+        print(f"WARNING: can not generate pll for this platform: set speed to: {clock_in} Hz")
+        return clock_in
+    # no pll support of the toolchain (reported by the gateware generator)
+    return clock_out
+
+
+def generate(config, gateware_path, clock_in, clock_out):
+    # writes pll.v of the setup from system_clock()
+    if "pll_setup" in config:
+        setup = config["pll_setup"]
+    else:
+        setup = solve(config["jdata"]["family"], config["jdata"].get("type"), clock_in, clock_out)
+    if setup is not None:
+        write_file(os.path.join(gateware_path, "pll.v"), verilog(setup))
+    return setup
@@ -2,6 +2,8 @@ import os
 
 from lxml import etree
 
+from riocore.generator.output import write_file
+
 
 class pyvcp:
     def __init__(self, prefix="pyvcp", vcp_pos=None):
@@ -22,7 +24,7 @@ class pyvcp:
     def save(self, configuration_path):
         xml_filename = os.path.join(configuration_path, "rio-gui.xml")
         formated = etree.tostring(self.root, pretty_print=True).decode()
-        open(xml_filename, "w").write(formated)
+        write_file(xml_filename, formated)
 
     def draw_tabs_begin(self, names):
         e_tabs = etree.Element("tabs")
@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class qtpyvcp:
     def __init__(self, prefix="qtpyvcp.rio-gui", vcp_pos=None):
@@ -175,7 +177,7 @@ class qtpyvcp:
         custom_config.append("")
         os.makedirs(os.path.join(configuration_path, "user_tabs", "rio"), exist_ok=True)
         os.makedirs(os.path.join(configuration_path, "user_buttons"), exist_ok=True)
-        open(yml_filename, "w").write("\n".join(custom_config))
+        write_file(yml_filename, "\n".join(custom_config))
 
         handler_py = []
         handler_py.append("""
@@ -198,9 +200,9 @@ class UserTab(QWidget):
         ui_file = os.path.splitext(os.path.basename(__file__))[0] + ".ui"
         uic.loadUi(os.path.join(os.path.dirname(__file__), ui_file), self)
 """)
-        open(py_filename, "w").write("\n".join(handler_py))
+        write_file(py_filename, "\n".join(handler_py))
         print(ui_filename)
-        open(ui_filename, "w").write("\n".join(self.cfgxml_data))
+        write_file(ui_filename, "\n".join(self.cfgxml_data))
 
     def add_property(self, name, value, ptype="number"):
         self.cfgxml_data.append(f'      <property name="{name}">')
@@ -1,5 +1,7 @@
 import os
 
+from riocore.generator.output import write_file
+
 
 class qtvcp:
     #
@@ -132,8 +134,8 @@ class qtvcp:
         handler_py.append("def get_handlers(halcomp,widgets,paths):")
         handler_py.append("     return [HandlerClass(halcomp,widgets,paths)]")
         handler_py.append("")
-        open(py_filename, "w").write("\n".join(handler_py))
-        open(ui_filename, "w").write("\n".join(self.cfgxml_data))
+        write_file(py_filename, "\n".join(handler_py))
+        write_file(ui_filename, "\n".join(self.cfgxml_data))
 
     def add_property(self, name, value, ptype="number"):
         self.cfgxml_data.append(f'      <property name="{name}">')
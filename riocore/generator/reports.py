@@ -0,0 +1,293 @@
+import json
+import os
+import re
+
+# timing and utilization numbers of a gateware build (build_report.json)
+#
+#   {
+#       "tool": "nextpnr",
+#       "clocks": {"<clock>": {"fmax": MHz, "required": MHz or None}},
+#       "utilization": {"lut": {"used": 1234, "available": 5280}, "ff": ..., "bram": ..., "dsp": ..., "io": ...},
+#       "critical_paths": {"<clock>": {"from": "<cell>", "to": "<cell>", "delay_ns": 12.3}},
+#       "requirements": {"sysclk": MHz, "<constraint>": MHz},
+#       "errors": [...], "warnings": [...], "pass": true,
+#   }
+#
+# the parsers read the logs and reports of the toolchains after the build, the requirements
+# (system clock and plugin timing constraints) come from timing.json, written by the generator.
+# the build fails if a clock is slower than its requirement.
+
+REPORT = "build_report.json"
+TIMING = "timing.json"
+
+# cell types of the nextpnr utilization, first found per category
+NEXTPNR_CELLS = {
+    "lut": ("ICESTORM_LC", "TRELLIS_COMB", "TRELLIS_SLICE", "LUT4"),
+    "ff": ("TRELLIS_FF", "DFF"),
+    "bram": ("ICESTORM_RAM", "DP16KD", "BSRAM"),
+    "dsp": ("ICESTORM_DSP", "MULT18X18D", "DSP"),
+    "io": ("SB_IO", "TRELLIS_IO", "IOB"),
+}
+VIVADO_SITES = {
+    "lut": ("Slice LUTs", "CLB LUTs"),
+    "ff": ("Slice Registers", "CLB Registers"),
+    "bram": ("Block RAM Tile",),
+    "dsp": ("DSPs",),
+    "io": ("Bonded IOB",),
+}
+QUARTUS_RESOURCES = {
+    "lut": ("Total logic elements",),
+    "ff": ("Total registers",),
+    "bram": ("Total memory bits",),
+    "dsp": ("Embedded Multiplier 9-bit elements",),
+    "io": ("Total pins",),
+}
+GOWIN_RESOURCES = {
+    "lut": ("Logic",),
+    "ff": ("Register",),
+    "bram": ("BSRAM",),
+    "dsp": ("DSP",),
+    "io": ("I/O Port",),
+}
+
+
+def new_report(tool):
+    return {"tool": tool, "clocks": {}, "utilization": {}, "critical_paths": {}, "requirements": {}, "errors": [], "warnings": [], "pass": True}
+
+
+def utilization(resources, categories):
+    # {category: {"used": n, "available": n}} of the first resource found per category
+    result = {}
+    for category, names in categories.items():
+        for name in names:
+            if name in resources:
+                used, available = resources[name]
+                result[category] = {"used": used, "available": available}
+                break
+    return result
+
+
+def read(path):
+    return open(path, "r", errors="replace").read()
+
+
+def nextpnr(gateware_path):
+    log_path = os.path.join(gateware_path, "nextpnr.log")
+    if not os.path.isfile(log_path):
+        return None
+    report = new_report("nextpnr")
+    resources = {}
+    in_utilization = False
+    path = None
+    for line in read(log_path).split("\n"):
+        text = line[6:] if line.startswith("Info: ") else line
+        # the last reports (after routing) win
+        match = re.search(r"Max frequency for clock\s+'([^']+)':\s*([\d.]+) MHz \((?:PASS|FAIL) at ([\d.]+) MHz\)", text)
+        if match:
+            report["clocks"][match.group(1)] = {"fmax": float(match.group(2)), "required": float(match.group(3))}
+            continue
+        if "Device utilisation:" in text:
+            resources = {}
+            in_utilization = True
+            continue
+        if in_utilization:
+            match = re.search(r"^\s*(\w+):\s*(\d+)\s*/\s*(\d+)", text)
+            if match:
+                resources[match.group(1)] = (int(match.group(2)), int(match.group(3)))
+                continue
+            if text.strip() or resources:
+                in_utilization = False
+        match = re.search(r"Critical path report for clock '([^']+)'", text)
+        if match:
+            path = {"from": None, "to": None, "delay_ns": None}
+            report["critical_paths"][match.group(1)] = path
+            continue
+        if path is not None:
+            match = re.search(r"\b(Source|Sink|Setup)\s+(\S+)", text)
+            if match:
+                if match.group(1) == "Source":
+                    path["from"] = path["from"] or match.group(2)
+                else:
+                    path["to"] = match.group(2)
+            match = re.search(r"([\d.]+) ns logic, ([\d.]+) ns routing", text)
+            if match:
+                path["delay_ns"] = round(float(match.group(1)) + float(match.group(2)), 3)
+                path = None
+    report["utilization"] = utilization(resources, NEXTPNR_CELLS)
+    return report
+
+
+def vivado(gateware_path):
+    timing_path = os.path.join(gateware_path, "build", "post_route_timing_summary.rpt")
+    if not os.path.isfile(timing_path):
+        return None
+    report = new_report("vivado")
+    periods = {}
+    section = None
+    path = None
+    for line in read(timing_path).split("\n"):
+        if line.strip() in {"Clock Summary", "Intra Clock Table", "Max Delay Paths"}:
+            section = line.strip()
+            continue
+        if section == "Clock Summary":
+            match = re.search(r"^\s*(\S+)\s+\{[\d. ]+\}\s+([\d.]+)\s+([\d.]+)", line)
+            if match:
+                periods[match.group(1)] = float(match.group(2))
+                report["clocks"][match.group(1)] = {"fmax": None, "required": float(match.group(3))}
+        elif section == "Intra Clock Table":
+            match = re.search(r"^(\S+)\s+(-?[\d.]+)\s", line)
+            if match and match.group(1) in periods:
+                report["clocks"][match.group(1)]["fmax"] = round(1000.0 / (periods[match.group(1)] - float(match.group(2))), 3)
+        elif section == "Max Delay Paths":
+            if line.startswith("Slack"):
+                path = {"from": None, "to": None, "delay_ns": None}
+                continue
+            if path is None:
+                continue
+            match = re.search(r"^\s*(Source|Destination|Path Group|Data Path Delay):\s*(\S+)", line)
+            if match:
+                if match.group(1) == "Source":
+                    path["from"] = match.group(2)
+                elif match.group(1) == "Destination":
+                    path["to"] = match.group(2)
+                elif match.group(1) == "Data Path Delay":
+                    path["delay_ns"] = float(match.group(2).replace("ns", ""))
+                else:
+                    # the first path of a clock is the worst one
+                    report["critical_paths"].setdefault(match.group(2), path)
+
+    util_path = os.path.join(gateware_path, "build", "post_place_util.rpt")
+    if os.path.isfile(util_path):
+        resources = {}
+        for line in read(util_path).split("\n"):
+            cells = [cell.strip() for cell in line.split("|")]
+            if len(cells) >= 6 and cells[2].isdigit() and cells[-3].isdigit():
+                resources.setdefault(cells[1], (int(cells[2]), int(cells[-3])))
+        report["utilization"] = utilization(resources, VIVADO_SITES)
+    return report
+
+
+def quartus(gateware_path):
+    timing_path = os.path.join(gateware_path, "rio.sta.rpt")
+    if not os.path.isfile(timing_path):
+        return None
+    report = new_report("quartus")
+    for line in read(timing_path).split("\n"):
+        # Fmax summaries of all timing models, the slowest one wins
+        match = re.search(r"^;\s*([\d.]+) MHz\s*;\s*([\d.]+) MHz\s*;\s*([^;\s]+)", line)
+        if match:
+            fmax = float(match.group(2))
+            clock = report["clocks"].setdefault(match.group(3), {"fmax": fmax, "required": None})
+            clock["fmax"] = min(clock["fmax"], fmax)
+
+    summary_path = os.path.join(gateware_path, "rio.fit.summary")
+    if os.path.isfile(summary_path):
+        resources = {}
+        for line in read(summary_path).split("\n"):
+            match = re.search(r"^\s*(.+?)\s*:\s*([\d,]+)(?:\s*/\s*([\d,]+))?", line)
+            if match:
+                available = int(match.group(3).replace(",", "")) if match.group(3) else None
+                resources[match.group(1)] = (int(match.group(2).replace(",", "")), available)
+        report["utilization"] = utilization(resources, QUARTUS_RESOURCES)
+    return report
+
+
+def gowin(gateware_path):
+    util_path = os.path.join(gateware_path, "impl", "pnr", "project.rpt.txt")
+    if not os.path.isfile(util_path):
+        return None
+    report = new_report("gowin")
+    resources = {}
+    for line in read(util_path).split("\n"):
+        match = re.search(r"^\s*([\w/ ]+?)\s*\|\s*(\d+)(?:/(\d+))?", line)
+        if match:
+            resources.setdefault(match.group(1), (int(match.group(2)), int(match.group(3)) if match.group(3) else None))
+    report["utilization"] = utilization(resources, GOWIN_RESOURCES)
+
+    timing_path = os.path.join(gateware_path, "impl", "pnr", "project.tr.html")
+    if os.path.isfile(timing_path):
+        # Max Frequency Summary: clock, constraint, actual fmax
+        for match in re.finditer(r"<td>([^<]+)</td>\s*<td>([\d.]+)\(MHz\)</td>\s*<td>([\d.]+)\(MHz\)</td>", read(timing_path)):
+            report["clocks"][match.group(1)] = {"fmax": float(match.group(3)), "required": float(match.group(2))}
+    return report
+
+
+PARSERS = (nextpnr, vivado, quartus, gowin)
+
+
+def normalize(name):
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def match_clocks(clocks, name):
+    # clocks of the report for a requirement, the system clock is the one named sysclk (not the input)
+    if name == "sysclk":
+        matches = [clock for clock in clocks if "sysclk" in normalize(clock) and "sysclkin" not in normalize(clock)]
+        if not matches and len(clocks) == 1:
+            matches = list(clocks)
+        return matches
+    return [clock for clock in clocks if normalize(name) in normalize(clock)]
+
+
+def check(report, timing):
+    requirements = {}
+    if timing:
+        requirements["sysclk"] = timing["sysclk"] / 1000000
+        for name, value in timing.get("constraints", {}).items():
+            requirements[name] = int(value) / 1000000
+    report["requirements"] = requirements
+
+    failed = set()
+    for name, required in requirements.items():
+        clocks = match_clocks(report["clocks"], name)
+        if not clocks:
+            report["warnings"].append(f"clock not found in the timing report: {name}")
+        for clock in clocks:
+            fmax = report["clocks"][clock]["fmax"]
+            if fmax is not None and fmax < required and clock not in failed:
+                failed.add(clock)
+                report["errors"].append(f"{clock}: {fmax:.2f} MHz, required: {required:.2f} MHz ({name})")
+    # requirements known by the toolchain
+    for clock, values in report["clocks"].items():
+        if values["fmax"] is not None and values["required"] and values["fmax"] < values["required"] and clock not in failed:
+            failed.add(clock)
+            report["errors"].append(f"{clock}: {values['fmax']:.2f} MHz, required: {values['required']:.2f} MHz")
+    report["pass"] = not report["errors"]
+    return report
+
+
+def build_report(gateware_path):
+    for parser in PARSERS:
+        report = parser(gateware_path)
+        if report is not None:
+            break
+    else:
+        return None
+    timing = None
+    timing_path = os.path.join(gateware_path, TIMING)
+    if os.path.isfile(timing_path):
+        timing = json.loads(read(timing_path))
+    check(report, timing)
+    open(os.path.join(gateware_path, REPORT), "w").write(json.dumps(report, indent=4))
+    return report
+
+
+def result(gateware_path, log=None):
+    # prints the build report, 1 if the timing failed
+    report_path = os.path.join(gateware_path, REPORT)
+    if not os.path.isfile(report_path):
+        return 0
+    report = json.loads(read(report_path))
+    print("", file=log)
+    for clock, values in sorted(report["clocks"].items()):
+        fmax = "-" if values["fmax"] is None else f"{values['fmax']:.2f} MHz"
+        print(f"clock {clock}: {fmax}", file=log)
+    for category, values in report["utilization"].items():
+        available = f"/{values['available']}" if values["available"] else ""
+        print(f"{category}: {values['used']}{available}", file=log)
+    for warning in report["warnings"]:
+        print(f"WARNING: {warning}", file=log)
+    for error in report["errors"]:
+        print(f"ERROR: timing failed: {error}", file=log)
+    print("", file=log, flush=True)
+    return 0 if report["pass"] else 1
@@ -3,6 +3,8 @@ import sys
 import os
 import shutil
 
+from riocore.generator.output import write_file
+
 
 class Toolchain:
     def __init__(self, config):
@@ -22,9 +24,8 @@ class Toolchain:
         return info
 
     def pll(self, clock_in, clock_out):
-        if clock_in != 33330000 or clock_out != 100000000:
-            print(f"WARNING: can not generate pll for this platform: set speed to: {clock_in} Hz")
-            self.config["speed"] = clock_in
+        # the pll is part of the interface designer setup, the system clock is checked by pll.system_clock()
+        pass
 
     def generate(self, path):
         pins_generator = importlib.import_module(".pins", "riocore.generator.pins.peri")
@@ -80,7 +81,7 @@ class Toolchain:
         xml_data.append('        <efx:param name="oscillator_clock_divider" value="DIV8" value_type="e_option" />')
         xml_data.append("    </efx:bitstream_generation>")
         xml_data.append("</efx:project>")
-        open(os.path.join(path, "rio.xml"), "w").write("\n".join(xml_data))
+        write_file(os.path.join(path, "rio.xml"), "\n".join(xml_data))
 
         makefile_data = []
         makefile_data.append("")
@@ -117,4 +118,4 @@ class Toolchain:
         makefile_data.append("sload: $(PROJECT).svf")
         makefile_data.append("	openFPGALoader outflow/$(PROJECT).bit")
         makefile_data.append("")
-        open(os.path.join(path, "Makefile"), "w").write("\n".join(makefile_data))
+        write_file(os.path.join(path, "Makefile"), "\n".join(makefile_data))
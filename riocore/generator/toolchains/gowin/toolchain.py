@@ -1,9 +1,10 @@
 import importlib
-import re
 import sys
 import os
 import shutil
-import subprocess
+
+from riocore.generator import pll
+from riocore.generator.output import write_file
 
 
 class Toolchain:
@@ -39,20 +40,7 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
         return info
 
     def pll(self, clock_in, clock_out):
-        if self.config["jdata"]["family"] == "GW1N-9C":
-            result = subprocess.check_output(
-                f"python3 {os.path.join(self.riocore_path, 'files', 'gowin-pll.py')} -d 'GW1NR-9 C6/I5' -f \"{os.path.join(self.gateware_path, 'pll.v')}\" -i {float(clock_in) / 1000000} -o {float(clock_out) / 1000000}",
-                shell=True,
-            )
-            achieved = re.findall(r"Achieved output frequency:\s*(\d*\.\d*)\s*MHz", result.decode())
-            if achieved:
-                new_speed = int(float(achieved[0]) * 1000000)
-                if new_speed != self.config["speed"]:
-                    print(f"WARNING: achieved PLL frequency is: {new_speed}")
-                    self.config["speed"] = new_speed
-        else:
-            print(f"WARNING: can not generate pll for this platform: set speed to: {clock_in} Hz")
-            self.config["speed"] = clock_in
+        pll.generate(self.config, self.gateware_path, clock_in, clock_out)
 
     def generate(self, path):
         pins_generator = importlib.import_module(".pins", "riocore.generator.pins.cst")
@@ -181,7 +169,7 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
 
         makefile_data.append("")
         makefile_data.append("")
-        open(os.path.join(path, "Makefile"), "w").write("\n".join(makefile_data))
+        write_file(os.path.join(path, "Makefile"), "\n".join(makefile_data))
 
         if sys.platform.startswith("win"):
             tcl_data = []
@@ -211,7 +199,7 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
                 tcl_data.append(f"set_option -{set_option} 1")
             tcl_data.append("run all")
             tcl_data.append("")
-            open(os.path.join(path, "rio.tcl"), "w").write("\n".join(tcl_data))
+            write_file(os.path.join(path, "rio.tcl"), "\n".join(tcl_data))
 
             build_data = []
             build_data.append("")
@@ -223,7 +211,7 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
             build_data.append("copy hash_new.txt hash_compiled.txt")
             build_data.append("")
             build_data.append("")
-            open(os.path.join(path, "build.bat"), "w").write("\n".join(build_data))
+            write_file(os.path.join(path, "build.bat"), "\n".join(build_data))
 
             flash_data = []
             flash_data.append("")
@@ -231,7 +219,7 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
             flash_data.append("copy hash_new.txt hash_flashed.txt")
             flash_data.append("")
             flash_data.append("")
-            open(os.path.join(path, "flash.bat"), "w").write("\n".join(flash_data))
+            write_file(os.path.join(path, "flash.bat"), "\n".join(flash_data))
 
         # generating timing constraints (.sdc)
         speed_ns = 1000000000 / self.config["speed"]
@@ -241,7 +229,7 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
             speed_ns = 1000000000 / int(value)
             sdc_data.append(f"create_clock -period {speed_ns:0.3f} -waveform {{0.000 {speed_ns / 2:0.2f}}} -name {key} [get_ports {{{key}}}]")
         sdc_data.append("")
-        open(os.path.join(path, "rio.sdc"), "w").write("\n".join(sdc_data))
+        write_file(os.path.join(path, "rio.sdc"), "\n".join(sdc_data))
 
         # generating project file for the gowin toolchain
         prj_data = []
@@ -268,7 +256,7 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
         prj_data.append('    <File path="pins.cst" type="file.cst" enable="1"/>')
         prj_data.append("    </FileList>")
         prj_data.append("</Project>")
-        open(os.path.join(path, "rio.gprj"), "w").write("\n".join(prj_data))
+        write_file(os.path.join(path, "rio.gprj"), "\n".join(prj_data))
 
         os.makedirs(os.path.join(path, "impl"), exist_ok=True)
         pps_data = """{
@@ -355,4 +343,4 @@ rm -rf Gowin_V1.9.9.03_Education_linux.tar.gz
  "show_all_warnings" : false,
  "turn_off_bg" : false
 }"""
-        open(os.path.join(path, "impl", "project_process_config.json"), "w").write("\n".join(pps_data))
+        write_file(os.path.join(path, "impl", "project_process_config.json"), "\n".join(pps_data))
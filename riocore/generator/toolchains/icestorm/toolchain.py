@@ -1,9 +1,10 @@
 import importlib
 import sys
 import os
-import re
 import shutil
-import subprocess
+
+from riocore.generator import pll
+from riocore.generator.output import copy_file, write_file
 
 
 class Toolchain:
@@ -42,23 +43,7 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
         return info
 
     def pll(self, clock_in, clock_out):
-        prefix = ""
-        if self.toolchain_path:
-            prefix = self.toolchain_path[0] + os.sep
-
-        if self.config["jdata"]["family"] == "ecp5":
-            result = subprocess.check_output(f"{prefix}ecppll -f \"{os.path.join(self.gateware_path, 'pll.v')}\" -i {float(clock_in) / 1000000} -o {float(clock_out) / 1000000}", shell=True)
-        elif self.config["jdata"]["type"] == "up5k":
-            result = subprocess.check_output(f"{prefix}icepll -p -m -f \"{os.path.join(self.gateware_path, 'pll.v')}\" -i {float(clock_in) / 1000000} -o {float(clock_out) / 1000000}", shell=True)
-            achieved = re.findall(r"F_PLLOUT:\s*(\d*\.\d*)\s*MHz \(achieved\)", result.decode())
-            if achieved:
-                new_speed = int(float(achieved[0]) * 1000000)
-                if new_speed != self.config["speed"]:
-                    print(f"WARNING: achieved PLL frequency is: {new_speed}")
-                    self.config["speed"] = new_speed
-        else:
-            result = subprocess.check_output(f"{prefix}icepll -q -m -f \"{os.path.join(self.gateware_path, 'pll.v')}\" -i {float(clock_in) / 1000000} -o {float(clock_out) / 1000000}", shell=True)
-            # print(result.decode())
+        pll.generate(self.config, self.gateware_path, clock_in, clock_out)
 
     def generate(self, path):
         prefix = ""
@@ -105,7 +90,7 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
             prepack_data.append(f'ctx.addClock("{key}", {int(value)/1000000})')
 
         prepack_data.append("")
-        open(os.path.join(path, "prepack.py"), "w").write("\n".join(prepack_data))
+        write_file(os.path.join(path, "prepack.py"), "\n".join(prepack_data))
 
         if sys.platform.startswith("win"):
             cmd_cp = "copy"
@@ -116,6 +101,9 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
             cmd_del = "rm -rf"
             cmd_loggrep = 'grep -B 1 "%$$" nextpnr.log'
 
+        # place and route result and command, for the seed sweep
+        pnr = None
+
         verilogs = " ".join(self.config["verilog_files"])
         makefile_data = []
         makefile_data.append("")
@@ -151,10 +139,13 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
             makefile_data.append("	yosys -q -l yosys.log -p 'synth_$(FAMILY) -top $(TOP) -json $(PROJECT).json' $(VERILOGS)")
         makefile_data.append("")
         if family == "ecp5":
-            makefile_data.append("$(PROJECT).config: $(PROJECT).json pins.lpf")
-            makefile_data.append(
-                "	nextpnr-$(FAMILY) -q -l nextpnr.log --timing-allow-fail --pre-pack prepack.py --$(TYPE) --package $(PACKAGE) --json $(PROJECT).json --freq $(CLK_SPEED) --lpf pins.lpf --textcfg $(PROJECT).config"
+            pnr = (
+                "$(PROJECT).config",
+                "$(PROJECT).json pins.lpf",
+                "nextpnr-$(FAMILY) -q -l {log} --timing-allow-fail --pre-pack prepack.py --$(TYPE) --package $(PACKAGE) --json $(PROJECT).json --freq $(CLK_SPEED) --lpf pins.lpf --textcfg {output}",
             )
+            makefile_data.append(f"{pnr[0]}: {pnr[1]}")
+            makefile_data.append(f"	{pnr[2].format(log='nextpnr.log', output=pnr[0])}")
             makefile_data.append('	@echo ""')
             makefile_data.append(f"	@{cmd_loggrep}")
             makefile_data.append('	@echo ""')
@@ -166,7 +157,7 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
             makefile_data.append(f"$(PROJECT).svf: {bitfileName}")
             makefile_data.append("")
             makefile_data.append("clean:")
-            makefile_data.append(f"	{cmd_del} {bitfileName} $(PROJECT).svf $(PROJECT).config $(PROJECT).json yosys.log nextpnr.log")
+            makefile_data.append(f"	{cmd_del} {bitfileName} $(PROJECT).svf $(PROJECT).config $(PROJECT).json yosys.log nextpnr.log seeds")
             makefile_data.append("")
         elif family == "gatemate":
             makefile_data.append("$(PROJECT).bit: net/$(PROJECT).v pins.ccf")
@@ -179,15 +170,22 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
             makefile_data.append(f"	{cmd_del} {bitfileName} net/ $(PROJECT).config $(PROJECT).json yosys.log nextpnr.log")
             makefile_data.append("")
         elif family in {"gowin", "himbaechel"}:
-            makefile_data.append("$(PROJECT)_pnr.json: $(PROJECT).json pins.cst")
             if family == "himbaechel":
-                makefile_data.append(
-                    "	nextpnr-himbaechel -q -l nextpnr.log --timing-allow-fail --json $(PROJECT).json --write $(PROJECT)_pnr.json --freq $(CLK_SPEED) --device $(TYPE) --vopt cst=pins.cst --vopt family=${DEVICE_FAMILY}"
+                pnr = (
+                    "$(PROJECT)_pnr.json",
+                    "$(PROJECT).json pins.cst",
+                    "nextpnr-himbaechel -q -l {log} --timing-allow-fail --json $(PROJECT).json --write {output} --freq $(CLK_SPEED) --device $(TYPE) --vopt cst=pins.cst --vopt family=${{DEVICE_FAMILY}}",
                 )
+                makefile_data.append(f"{pnr[0]}: {pnr[1]}")
+                makefile_data.append(f"	{pnr[2].format(log='nextpnr.log', output=pnr[0])}")
             else:
-                makefile_data.append(
-                    "	nextpnr-gowin -q -l nextpnr.log --seed 0 --json $(PROJECT).json --write $(PROJECT)_pnr.json --freq $(CLK_SPEED) --enable-globals --enable-auto-longwires --device $(TYPE) --cst pins.cst"
+                pnr = (
+                    "$(PROJECT)_pnr.json",
+                    "$(PROJECT).json pins.cst",
+                    "nextpnr-gowin -q -l {log} --json $(PROJECT).json --write {output} --freq $(CLK_SPEED) --enable-globals --enable-auto-longwires --device $(TYPE) --cst pins.cst",
                 )
+                makefile_data.append(f"{pnr[0]}: {pnr[1]}")
+                makefile_data.append(f"	{pnr[2].format(log='nextpnr.log --seed 0', output=pnr[0])}")
             makefile_data.append('	@echo ""')
             makefile_data.append(f"	@{cmd_loggrep}")
             makefile_data.append('	@echo ""')
@@ -197,13 +195,16 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
             makefile_data.append(f"	{cmd_cp} hash_new.txt hash_compiled.txt")
             makefile_data.append("")
             makefile_data.append("clean:")
-            makefile_data.append(f"	{cmd_del} $(PROJECT).fs $(PROJECT).json $(PROJECT)_pnr.json $(PROJECT).tcl abc.history impl yosys.log nextpnr.log")
+            makefile_data.append(f"	{cmd_del} $(PROJECT).fs $(PROJECT).json $(PROJECT)_pnr.json $(PROJECT).tcl abc.history impl yosys.log nextpnr.log seeds")
             makefile_data.append("")
         else:
-            makefile_data.append("$(PROJECT).asc: $(PROJECT).json pins.pcf")
-            makefile_data.append(
-                "	nextpnr-$(FAMILY) -q -l nextpnr.log --timing-allow-fail --pre-pack prepack.py --$(TYPE) --package $(PACKAGE) --json $(PROJECT).json --freq $(CLK_SPEED) --pcf pins.pcf --asc $(PROJECT).asc"
+            pnr = (
+                "$(PROJECT).asc",
+                "$(PROJECT).json pins.pcf",
+                "nextpnr-$(FAMILY) -q -l {log} --timing-allow-fail --pre-pack prepack.py --$(TYPE) --package $(PACKAGE) --json $(PROJECT).json --freq $(CLK_SPEED) --pcf pins.pcf --asc {output}",
             )
+            makefile_data.append(f"{pnr[0]}: {pnr[1]}")
+            makefile_data.append(f"	{pnr[2].format(log='nextpnr.log', output=pnr[0])}")
             makefile_data.append('	@echo ""')
             makefile_data.append(f"	@{cmd_loggrep}")
             makefile_data.append('	@echo ""')
@@ -213,7 +214,22 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
             makefile_data.append(f"	{cmd_cp} hash_new.txt hash_compiled.txt")
             makefile_data.append("")
             makefile_data.append("clean:")
-            makefile_data.append(f"	{cmd_del} {bitfileName} $(PROJECT).asc $(PROJECT).json yosys.log nextpnr.log")
+            makefile_data.append(f"	{cmd_del} {bitfileName} $(PROJECT).asc $(PROJECT).json yosys.log nextpnr.log seeds")
+            makefile_data.append("")
+        if pnr and not sys.platform.startswith("win"):
+            # make sweep [SEEDS=8] [SWEEP_JOBS=4]: place and route with different seeds in parallel, keeps the best result
+            copy_file(os.path.join(self.riocore_path, "files", "nextpnr-seeds.py"), os.path.join(path, "nextpnr-seeds.py"))
+            makefile_data.append("SEEDS      ?= 8")
+            makefile_data.append("SWEEP_JOBS ?= $(shell nproc)")
+            makefile_data.append("")
+            makefile_data.append("sweep: $(PROJECT).json")
+            makefile_data.append(f"	$(MAKE) -j $(SWEEP_JOBS) $(foreach seed,$(shell seq 1 $(SEEDS)),seeds/$(seed)/{pnr[0]})")
+            makefile_data.append(f"	python3 nextpnr-seeds.py {pnr[0]} $(foreach seed,$(shell seq 1 $(SEEDS)),seeds/$(seed)/nextpnr.log)")
+            makefile_data.append(f"	$(MAKE) {bitfileName}")
+            makefile_data.append("")
+            makefile_data.append(f"seeds/%/{pnr[0]}: {pnr[1]}")
+            makefile_data.append("	@mkdir -p seeds/$*")
+            makefile_data.append(f"	-{pnr[2].format(log='seeds/$*/nextpnr.log --seed $*', output='$@')}")
             makefile_data.append("")
         makefile_data.append("check:")
         makefile_data.append("	verilator --top-module $(PROJECT) --lint-only -Wall *.v")
@@ -251,4 +267,4 @@ rm -rf oss-cad-suite-linux-arm64-20240910.tgz
 
         makefile_data.append("")
         makefile_data.append("")
-        open(os.path.join(path, "Makefile"), "w").write("\n".join(makefile_data))
+        write_file(os.path.join(path, "Makefile"), "\n".join(makefile_data))
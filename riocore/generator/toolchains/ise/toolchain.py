@@ -3,6 +3,8 @@ import sys
 import os
 import shutil
 
+from riocore.generator.output import write_file
+
 
 class Toolchain:
     def __init__(self, config):
@@ -91,4 +93,4 @@ class Toolchain:
         makefile_data.append("	cp -v hash_new.txt hash_flashed.txt")
         makefile_data.append("")
         makefile_data.append("")
-        open(os.path.join(path, "Makefile"), "w").write("\n".join(makefile_data))
+        write_file(os.path.join(path, "Makefile"), "\n".join(makefile_data))
@@ -2,8 +2,9 @@ import importlib
 import sys
 import os
 import shutil
-import re
-import subprocess
+
+from riocore.generator import pll
+from riocore.generator.output import write_file
 
 
 class Toolchain:
@@ -37,20 +38,7 @@ https://www.intel.com/content/www/us/en/programmable/quartushelp/17.0/reference/
         return info
 
     def pll(self, clock_in, clock_out):
-        if self.config["jdata"]["family"] in {"MAX 10", "Cyclone 10 LP"}:
-            result = subprocess.check_output(
-                f"{self.riocore_path}/files/quartus-pll.sh \"{self.config['jdata']['family']}\" {float(clock_in) / 1000000} {float(clock_out) / 1000000} '{self.gateware_path}/pll.v'",
-                shell=True,
-            )
-            achieved = re.findall(r"OUTPUT FREQ:\s*(\d*\.\d*)", result.decode())
-            if achieved:
-                new_speed = int(achieved[0].replace(".", ""))
-                if new_speed != self.config["speed"]:
-                    print(f"WARNING: achieved PLL frequency is: {new_speed}")
-                    self.config["speed"] = new_speed
-        else:
-            print(f"WARNING: can not generate pll for this platform: set speed to: {clock_in} Hz")
-            self.config["speed"] = clock_in
+        pll.generate(self.config, self.gateware_path, clock_in, clock_out)
 
     def generate(self, path):
         pins_generator = importlib.import_module(".pins", "riocore.generator.pins.qdf")
@@ -167,7 +155,7 @@ https://www.intel.com/content/www/us/en/programmable/quartushelp/17.0/reference/
         makefile_data.append("	cp -v hash_new.txt hash_flashed.txt")
         makefile_data.append("")
         makefile_data.append("")
-        open(os.path.join(path, "Makefile"), "w").write("\n".join(makefile_data))
+        write_file(os.path.join(path, "Makefile"), "\n".join(makefile_data))
 
         clock = self.config["speed"]
         sdc_data = []
@@ -176,4 +164,4 @@ https://www.intel.com/content/www/us/en/programmable/quartushelp/17.0/reference/
         sdc_data.append("derive_pll_clocks")
         sdc_data.append("derive_clock_uncertainty")
         sdc_data.append("")
-        open(os.path.join(path, "rio.sdc"), "w").write("\n".join(sdc_data))
+        write_file(os.path.join(path, "rio.sdc"), "\n".join(sdc_data))
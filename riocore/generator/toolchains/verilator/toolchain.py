@@ -3,6 +3,8 @@ import sys
 import os
 import shutil
 
+from riocore.generator.output import write_file
+
 
 class Toolchain:
     def __init__(self, config):
@@ -52,7 +54,7 @@ class Toolchain:
         makefile_data.append("	rm -rf obj_dir")
         makefile_data.append("")
         makefile_data.append("")
-        open(os.path.join(path, "Makefile"), "w").write("\n".join(makefile_data))
+        write_file(os.path.join(path, "Makefile"), "\n".join(makefile_data))
 
         top_arguments = []
         for pname in sorted(list(self.config["pinlists"])):
@@ -182,4 +184,4 @@ int main(int argc, char** argv) {
         """
         )
 
-        open(os.path.join(path, "main.cpp"), "w").write("\n".join(main_cpp))
+        write_file(os.path.join(path, "main.cpp"), "\n".join(main_cpp))
@@ -2,7 +2,9 @@ import importlib
 import sys
 import os
 import shutil
-import subprocess
+
+from riocore.generator import pll
+from riocore.generator.output import write_file
 
 
 class Toolchain:
@@ -23,19 +25,7 @@ class Toolchain:
         return info
 
     def pll(self, clock_in, clock_out):
-        if self.config["jdata"]["family"] == "xc7":
-            if float(clock_out) == 125000000.0 and float(clock_in) == 100000000.0:
-                result = subprocess.check_output(
-                    f"{self.riocore_path}/files/vivado-pll.sh \"{self.config['jdata']['family']}\" {float(clock_in) / 1000000} {float(clock_out) / 1000000} '{self.gateware_path}/pll.v'",
-                    shell=True,
-                )
-                print(result.decode())
-            else:
-                print(f"WARNING: can not generate pll for this platform: set speed to: {clock_in} Hz")
-                self.config["speed"] = clock_in
-        else:
-            print(f"WARNING: can not generate pll for this platform: set speed to: {clock_in} Hz")
-            self.config["speed"] = clock_in
+        pll.generate(self.config, self.gateware_path, clock_in, clock_out)
 
     def generate(self, path):
         pins_generator = importlib.import_module(".pins", "riocore.generator.pins.xdc")
@@ -111,4 +101,4 @@ class Toolchain:
         makefile_data.append("	cp -v hash_new.txt hash_flashed.txt")
         makefile_data.append("")
         makefile_data.append("")
-        open(os.path.join(path, "Makefile"), "w").write("\n".join(makefile_data))
+        write_file(os.path.join(path, "Makefile"), "\n".join(makefile_data))
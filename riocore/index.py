@@ -0,0 +1,141 @@
+import json
+import os
+
+# on-disk index of parsed json files (boards, modules) and plugin metadata
+#
+#   {"version": 1, "entries": {"<kind>:<name>": {"files": [...], "key": [[mtime_ns, size], ...], "data": "<json>"}}}
+#
+# the entries keep their data as json text, so loading the index is one read and
+# one (flat) parse, the data of an entry is only parsed when it is used.
+# an entry is valid as long as its source files and their mtimes and sizes are unchanged,
+# entries of removed source files are dropped when the index is saved.
+#
+# plugin metadata is cached on the first use, the plugin is only imported again if one of its files has changed.
+
+VERSION = 1
+TYPES = {"int": int, "str": str, "float": float, "bool": bool}
+PLUGIN_METADATA = ("NAME", "TYPE", "INFO", "DESCRIPTION", "KEYWORDS", "ORIGIN", "LIMITATIONS", "OPTIONS", "PINDEFAULTS", "SIGNALS", "INTERFACE", "GATEWARE_SUPPORT")
+
+riocore_path = os.path.dirname(__file__)
+
+
+def default_path():
+    cache_path = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache_path, "riocore", "index.json")
+
+
+def encode(value):
+    # the plugin OPTIONS use python types (int, str, ...)
+    for name, value_type in TYPES.items():
+        if value is value_type:
+            return {"__type__": name}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def decode(value):
+    if len(value) == 1 and "__type__" in value:
+        return TYPES[value["__type__"]]
+    return value
+
+
+def file_key(files):
+    key = []
+    for path in files:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key.append([stat.st_mtime_ns, stat.st_size])
+    return key
+
+
+def plugin_files(plugin_name):
+    # all files of the plugin folder (device tables, config modules, ...), the metadata can depend on any of them
+    plugin_path = os.path.join(riocore_path, "plugins", plugin_name)
+    files = []
+    for root, dirs, names in os.walk(plugin_path):
+        dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+        files += [os.path.join(root, name) for name in sorted(names) if not name.endswith(".pyc")]
+    if not files:
+        # not a plugin, an entry that is never valid
+        files.append(os.path.join(plugin_path, "plugin.py"))
+    files.append(os.path.join(riocore_path, "plugins", "__init__.py"))
+    return files
+
+
+class MetadataIndex:
+    def __init__(self, path=None):
+        self.index_path = path
+        self.entries = None
+        self.changed = False
+
+    @property
+    def path(self):
+        # the default location follows XDG_CACHE_HOME at the time of use
+        return self.index_path or default_path()
+
+    def load(self):
+        self.entries = {}
+        try:
+            index = json.loads(open(self.path, "r").read())
+            if index.get("version") == VERSION:
+                self.entries = index["entries"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    def save(self):
+        if not self.changed:
+            return
+        # entries of removed files (temporary configs, old installations)
+        for name, entry in list(self.entries.items()):
+            if "files" not in entry or file_key(entry["files"]) is None:
+                del self.entries[name]
+        # the index is only a cache, a read-only home is not an error
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            open(tmp_path, "w").write(json.dumps({"version": VERSION, "entries": self.entries}))
+            os.replace(tmp_path, self.path)
+            self.changed = False
+        except OSError as error:
+            print(f"WARNING: can not write metadata index: {error}")
+
+    def entry(self, name, files, build):
+        # parsed data of the entry, build() is called if the source files have changed
+        if self.entries is None:
+            self.load()
+        key = file_key(files)
+        entry = self.entries.get(name)
+        if key is not None and entry is not None and entry["key"] == key and entry.get("files") == list(files):
+            return json.loads(entry["data"], object_hook=decode)
+        data = build()
+        if key is not None:
+            try:
+                self.entries[name] = {"files": list(files), "key": key, "data": json.dumps(data, default=encode)}
+                self.changed = True
+            except (TypeError, ValueError):
+                # not cacheable, build it again next time
+                self.entries.pop(name, None)
+        return data
+
+    def json_file(self, path):
+        path = os.path.abspath(path)
+        return self.entry(f"json:{path}", [path], lambda: json.loads(open(path, "r").read()))
+
+    def plugin(self, plugin_name):
+        # metadata of a plugin (NAME, INFO, OPTIONS, PINDEFAULTS, ...), without importing it if cached
+        return self.entry(f"plugin:{plugin_name}", plugin_files(plugin_name), lambda: plugin_metadata(plugin_name))
+
+
+def plugin_metadata(plugin_name):
+    from riocore import Plugins
+
+    plugins = Plugins()
+    plugins.load_plugin(0, {"type": plugin_name})
+    if not plugins.plugin_instances:
+        return None
+    plugin_instance = plugins.plugin_instances[0]
+    return {attribute: getattr(plugin_instance, attribute) for attribute in PLUGIN_METADATA}
+
+
+index = MetadataIndex()
@@ -13,6 +13,12 @@ class Interface:
         rec = list(self.SPI_FTDI.exchange(data, duplex=True))
         return rec
 
+    def transfer_into(self, txdata, rxdata):
+        rec = self.SPI_FTDI.exchange(txdata, duplex=True)
+        length = len(rec)
+        rxdata[0:length] = rec
+        return length
+
     @classmethod
     def check(cls, cstr):
         if cstr.startswith("ftdi://"):
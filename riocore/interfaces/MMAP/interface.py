@@ -0,0 +1,151 @@
+import mmap
+import os
+import struct
+import time
+
+from riocore import interfaces
+
+# shared memory segment for simulator-in-the-loop tests (connection-string: mmap:/dev/shm/rio[:timeout_ms])
+#
+# layout (little endian):
+#   0   magic "RIOM"
+#   4   version
+#   8   frame size
+#   12  tx sequence, set by the host after writing a tx frame
+#   16  rx sequence, set by the peer after writing the answer to tx sequence
+#   64  tx frames [2][frame size]
+#       rx frames [2][frame size]
+#
+# frames are double buffered by (sequence & 1), so a late answer to a timed out
+# frame never overwrites the frame that the other side is working on.
+
+MAGIC = b"RIOM"
+VERSION = 1
+HEADER = struct.Struct("<4sII")
+HEADER_SIZE = 64
+SEQ = struct.Struct("<I")
+TX_SEQ = 12
+RX_SEQ = 16
+
+
+class Segment:
+    SPIN = 0.001
+    POLL = 0.00002
+
+    def __init__(self, path, frame_size):
+        self.path = path
+        self.frame_size = frame_size
+        size = HEADER_SIZE + 4 * frame_size
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self.mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+        magic, version, segment_frame_size = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC or version != VERSION or segment_frame_size != frame_size:
+            self.mm[0:size] = bytes(size)
+            HEADER.pack_into(self.mm, 0, MAGIC, VERSION, frame_size)
+        self.view = memoryview(self.mm)
+
+    def seq_get(self, offset):
+        return SEQ.unpack_from(self.mm, offset)[0]
+
+    def seq_set(self, offset, seq):
+        SEQ.pack_into(self.mm, offset, seq)
+
+    def tx_frame(self, seq):
+        start = HEADER_SIZE + (seq & 1) * self.frame_size
+        return self.view[start : start + self.frame_size]
+
+    def rx_frame(self, seq):
+        start = HEADER_SIZE + (2 + (seq & 1)) * self.frame_size
+        return self.view[start : start + self.frame_size]
+
+    def wait(self, offset, last, deadline):
+        # returns the sequence number at offset as soon as it differs from last, None on timeout
+        # polls for SPIN seconds (yielding the cpu to the peer), then sleeps POLL seconds between the checks
+        spin_end = time.perf_counter() + self.SPIN
+        while True:
+            seq = SEQ.unpack_from(self.mm, offset)[0]
+            if seq != last:
+                return seq
+            now = time.perf_counter()
+            if now > deadline:
+                return None
+            if now > spin_end:
+                time.sleep(self.POLL)
+            else:
+                os.sched_yield()
+
+    def close(self):
+        self.view.release()
+        self.mm.close()
+
+
+class Interface:
+    def __init__(self, cstr):
+        parts = cstr[5:].split(":")
+        self.path = parts[0]
+        self.timeout = 0.2
+        if len(parts) > 1:
+            self.timeout = float(parts[1]) / 1000.0
+        self.segment = None
+        self.timeouts = 0
+        print("SHM:", self.path)
+
+    def transfer_into(self, txdata, rxdata):
+        frame_size = len(txdata)
+        if self.segment is None or self.segment.frame_size != frame_size:
+            self.segment = Segment(self.path, frame_size)
+        segment = self.segment
+
+        seq = (segment.seq_get(TX_SEQ) + 1) & 0xFFFFFFFF
+        rx_seq = segment.seq_get(RX_SEQ)
+        segment.tx_frame(seq)[:] = txdata
+        segment.seq_set(TX_SEQ, seq)
+
+        deadline = time.perf_counter() + self.timeout
+        while rx_seq != seq:
+            rx_seq = segment.wait(RX_SEQ, rx_seq, deadline)
+            if rx_seq is None:
+                self.timeouts += 1
+                print("SHM TimeoutError")
+                return 0
+        rxdata[0:frame_size] = segment.rx_frame(seq)
+        return frame_size
+
+    def transfare(self, data):
+        return interfaces.transfare(self, data)
+
+    @classmethod
+    def check(cls, cstr):
+        if cstr.startswith("mmap:"):
+            return True
+        return False
+
+
+class Peer:
+    """simulator side of the mmap interface
+
+    waits for the frames of the host and answers them,
+    same receive()/transmit() calls as the network interface of rio-udpsim,
+    receive() returns None if the host sent no frame within the timeout (idle link)
+    """
+
+    def __init__(self, path, frame_size, timeout=1.2):
+        self.segment = Segment(path, frame_size)
+        self.timeout = timeout
+        self.seq = self.segment.seq_get(TX_SEQ)
+
+    def receive(self, data):
+        seq = self.segment.wait(TX_SEQ, self.seq, time.perf_counter() + self.timeout)
+        if seq is None:
+            return None
+        self.seq = seq
+        return list(self.segment.tx_frame(seq))
+
+    def transmit(self, data):
+        self.segment.rx_frame(self.seq)[:] = bytes(data)
+        self.segment.seq_set(RX_SEQ, self.seq)
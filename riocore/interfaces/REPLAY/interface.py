@@ -0,0 +1,18 @@
+from riocore.capture import ReplayTransport
+
+
+class Interface(ReplayTransport):
+    # connection-string: replay:<capture file>[:speed]
+    def __init__(self, cstr):
+        parts = cstr[7:].split(":")
+        speed = 1.0
+        if len(parts) > 1:
+            speed = float(parts[1])
+        print(f"REPLAY: {parts[0]} (speed: {speed})")
+        super().__init__(parts[0], speed)
+
+    @classmethod
+    def check(cls, cstr):
+        if cstr.startswith("replay:"):
+            return True
+        return False
@@ -12,6 +12,15 @@ class Interface:
         rec = list(msgFromServer)
         return rec
 
+    def transfer_into(self, txdata, rxdata):
+        fd = open(f"{self.shm}.tx", "wb")
+        fd.write(txdata)
+        fd.close()
+        fd = open(f"{self.shm}.rx", "rb")
+        length = fd.readinto(memoryview(rxdata)[0 : len(txdata)])
+        fd.close()
+        return length
+
     @classmethod
     def check(cls, cstr):
         if cstr.startswith("/dev/shm"):
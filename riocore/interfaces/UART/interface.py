@@ -24,6 +24,14 @@ class Interface:
 
         return rec
 
+    def transfer_into(self, txdata, rxdata):
+        dlen = len(txdata)
+        self.ser.write(txdata)
+        msgFromServer = self.ser.read(dlen * 2)[-dlen:]
+        length = len(msgFromServer)
+        rxdata[0:length] = msgFromServer
+        return length
+
     @classmethod
     def check(cls, cstr):
         if cstr.startswith(("/dev/tty", "/dev/serial")):
@@ -1,17 +1,57 @@
 import ipaddress
+import socket
+import time
+
+from riocore import interfaces
+
+# connection-string: ip:port[:deadline_us][:seq]
+#
+# seq: the fpga does not evaluate the header of the received frame, so bytes 2-3 ("rw" of "tirw")
+# can carry a 16bit frame sequence number (little endian, 0x7772 == "rw" is never used).
+# peers that support it (rio-udpsim) echo it into bytes 2-3 of the reply, byte 0 stays "a" or "p" (ESTOP).
+# after matching, the interface restores the normal header ("atad" / "ptse").
+
+HEADER_RW = 0x7772
+
+
+def parse_cstr(cstr):
+    # returns ip, port, deadline_us, sequence
+    parts = cstr.split(":")
+    deadline_us = 200000
+    sequence = False
+    for option in parts[2:]:
+        if option == "seq":
+            sequence = True
+        elif option:
+            deadline_us = int(option)
+    return (parts[0], parts[1], deadline_us, sequence)
+
+
+def next_seq(seq):
+    seq = (seq + 1) & 0xFFFF
+    if seq == HEADER_RW:
+        seq += 1
+    return seq
 
 
 class Interface:
     def __init__(self, cstr):
-        (self.NET_IP, self.NET_PORT) = cstr.split(":")
+        (self.NET_IP, self.NET_PORT, self.deadline_us, self.sequence) = parse_cstr(cstr)
+        self.address = (self.NET_IP, int(self.NET_PORT))
 
         self.pkg_out = 0
         self.pkg_in = 0
-
-        import socket
+        self.lost = 0
+        self.late = 0
+        self.duplicate = 0
+        self.seq = 0
+        self.answered = None
+        self.scratch = bytearray(4)
 
         print("IP:", self.NET_IP)
         print("PORT:", self.NET_PORT)
+        if self.sequence:
+            print("SEQUENCE: on")
 
         bind_port = int(self.NET_PORT) + 1
 
@@ -24,25 +64,63 @@ class Interface:
         except Exception as err:
             print(f"WARNING: can not set timeouts: {err}")
 
+    def stale(self, length):
+        if self.sequence and length >= 4 and self.scratch[2] | self.scratch[3] << 8 == self.answered:
+            self.duplicate += 1
+        else:
+            self.late += 1
+
+    def drain(self):
+        # drop all replies that arrived after the deadline of their request
+        self.socket.settimeout(0)
+        while True:
+            try:
+                length = self.socket.recv_into(self.scratch, 4)
+            except (BlockingIOError, TimeoutError):
+                return
+            self.stale(length)
+
+    def transfer_into(self, txdata, rxdata):
+        self.drain()
+        self.pkg_out += 1
+        if self.sequence:
+            self.seq = next_seq(self.seq)
+            header = bytes([txdata[0], txdata[1], self.seq & 0xFF, self.seq >> 8])
+            self.socket.sendmsg([header, memoryview(txdata)[4:]], [], 0, self.address)
+        else:
+            self.socket.sendto(txdata, self.address)
+
+        deadline = time.perf_counter() + self.deadline_us / 1000000
+        while True:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                self.lost += 1
+                print("Network TimeoutError")
+                return 0
+            self.socket.settimeout(timeout)
+            try:
+                length = self.socket.recv_into(rxdata, len(rxdata))
+            except TimeoutError:
+                continue
+            if self.sequence:
+                if length < 4 or rxdata[2] | rxdata[3] << 8 != self.seq:
+                    self.scratch[0:4] = bytes(rxdata[0:4])
+                    self.stale(length)
+                    continue
+                self.answered = self.seq
+                rxdata[2:4] = b"ad" if rxdata[0] == 0x61 else b"se"
+            self.pkg_in += 1
+            if length != len(txdata):
+                print(f"{self.pkg_out}/{self.pkg_in} WRONG DATASIZE: {length} / {len(txdata)}")
+            return length
+
     def transfare(self, data):
-        self.socket.sendto(bytes(data), (self.NET_IP, int(self.NET_PORT)))
-        self.socket.settimeout(0.2)
-        try:
-            msgFromServer = self.socket.recvfrom(len(data) * 4)
-            if len(msgFromServer[0]) == len(data):
-                rec = list(msgFromServer[0])
-            else:
-                print(f"{self.pkg_out}/{self.pkg_in} WRONG DATASIZE: {len(msgFromServer[0])} / {len(data)}")
-                rec = list(msgFromServer[0])
-        except TimeoutError:
-            print("Network TimeoutError")
-            rec = []
-        return rec
+        return interfaces.transfare(self, data, len(data) * 4)
 
     @classmethod
     def check(cls, cstr):
         try:
-            addr, port = cstr.split(":")
+            addr, port = cstr.split(":")[0:2]
             ipaddress.ip_address(addr)
             return True
         except ValueError:
@@ -0,0 +1,21 @@
+# frame exchange with the interfaces
+#
+# interfaces implement transfer_into(txdata, rxdata) (preallocated buffers, returns the received bytes)
+# and/or the list based transfare(data), these helpers map one to the other
+
+
+def transfer_into(interface, txdata, rxdata):
+    # interfaces without transfer_into() are using the list based transfare()
+    if hasattr(interface, "transfer_into"):
+        return interface.transfer_into(txdata, rxdata)
+    received = interface.transfare(list(txdata))
+    length = min(len(received), len(rxdata))
+    rxdata[0:length] = bytes(received[0:length])
+    return len(received)
+
+
+def transfare(interface, data, rx_size=None):
+    # list based transfare() of an interface with transfer_into()
+    rxdata = bytearray(rx_size or len(data))
+    length = interface.transfer_into(bytes(data), rxdata)
+    return list(rxdata[0:length])
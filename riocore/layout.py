@@ -0,0 +1,44 @@
+class InterfaceLayout:
+    """ordered index of all interface variables of a project
+
+    built once after the buffer size calculation, so the runtime and the
+    generators do not have to scan all sizes * plugins * variables on every call.
+    call Project.invalidate_layout() after plugins or their interface setup changed.
+    """
+
+    def __init__(self, plugin_instances, interface_sizes):
+        self.entries = []
+        for size in sorted(interface_sizes, reverse=True):
+            for plugin_instance in plugin_instances:
+                for data_name, data_config in plugin_instance.interface_data().items():
+                    if data_config["size"] == size:
+                        self.entries.append([size, plugin_instance, data_name, data_config])
+
+        self.inputs = []
+        self.outputs = []
+        self.multiplexed_inputs = []
+        self.multiplexed_outputs = []
+        self.expansions = []
+        self.plugin_instances = []
+        for entry in self.entries:
+            size, plugin_instance, data_name, data_config = entry
+            if plugin_instance not in self.plugin_instances:
+                self.plugin_instances.append(plugin_instance)
+            direction = data_config["direction"]
+            if data_config.get("expansion", False):
+                self.expansions.append(entry)
+            elif data_config.get("multiplexed", False):
+                if direction == "input":
+                    self.multiplexed_inputs.append(entry)
+                elif direction == "output":
+                    self.multiplexed_outputs.append(entry)
+            elif direction == "input":
+                self.inputs.append(entry)
+            elif direction in {"output", "inout"}:
+                self.outputs.append(entry)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def __len__(self):
+        return len(self.entries)
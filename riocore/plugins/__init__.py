@@ -7,6 +7,7 @@ class PluginBase:
     expansions = []
 
     def __init__(self, plugin_id, plugin_setup, system_setup=None):
+        self.cache = {}
         self.PINDEFAULTS = {}
         self.INTERFACE = {}
         self.SIGNALS = {}
@@ -85,6 +86,11 @@ class PluginBase:
     def update_title(self):
         self.title = self.plugin_setup.get("name") or self.instances_name
 
+    def invalidate(self):
+        # signals(), interface_data() and pins() are cached, call this after changing plugin_setup
+        self.cache = {}
+        self.update_title()
+
     def setup(self):
         pass
 
@@ -150,6 +156,28 @@ class PluginBase:
                 if signal_setup["direction"] == "input" and signal_name in interface_data:
                     signal_setup["value"] = self.convert(signal_name, signal_setup, interface_data[signal_name]["value"])
 
+    def conversion_plan(self):
+        # flat (signal_name, signal_setup, interface_setup, convert) steps for convert2interface and convert2signals
+        # convert is None for plain copies, a plan is None if the plugin has to run its own convert2interface/convert2signals
+        tx_plan = []
+        rx_plan = []
+        convert = None
+        if type(self).convert is not PluginBase.convert:
+            convert = self.convert
+        interface_data = self.interface_data()
+        for signal_name, signal_setup in self.signals().items():
+            if signal_name not in interface_data:
+                continue
+            if signal_setup["direction"] in {"output", "inout"}:
+                tx_plan.append((signal_name, signal_setup, interface_data[signal_name], convert))
+            elif signal_setup["direction"] == "input":
+                rx_plan.append((signal_name, signal_setup, interface_data[signal_name], convert))
+        if self.TYPE == "frameio" or type(self).convert2interface is not PluginBase.convert2interface:
+            tx_plan = None
+        if self.TYPE == "frameio" or type(self).convert2signals is not PluginBase.convert2signals:
+            rx_plan = None
+        return (tx_plan, rx_plan)
+
     def globals_c(self):
         return ""
 
@@ -163,6 +191,11 @@ class PluginBase:
         return self.TIMING_CONSTRAINTS
 
     def pins(self):
+        if "pins" not in self.cache:
+            self.cache["pins"] = self.calc_pins()
+        return {pin_name: pin_config.copy() for pin_name, pin_config in self.cache["pins"].items()}
+
+    def calc_pins(self):
         pins = {}
         for pin_name, pin_config in self.PINDEFAULTS.items():
             if "pin" in self.plugin_setup and "pins" not in self.plugin_setup:
@@ -197,6 +230,11 @@ class PluginBase:
         return pins
 
     def signals(self):
+        if "signals" not in self.cache:
+            self.cache["signals"] = self.calc_signals()
+        return self.cache["signals"]
+
+    def calc_signals(self):
         signals = {}
         for name, setup in self.SIGNALS.items():
             if "value" not in setup:
@@ -222,6 +260,11 @@ class PluginBase:
         return signals
 
     def interface_data(self):
+        if "interface_data" not in self.cache:
+            self.cache["interface_data"] = self.calc_interface_data()
+        return self.cache["interface_data"]
+
+    def calc_interface_data(self):
         data = {}
         for name, setup in self.INTERFACE.items():
             if "value" not in setup:
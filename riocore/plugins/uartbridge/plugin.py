@@ -1,6 +1,7 @@
 import os
 
 from riocore.checksums import crc8, crc16
+from riocore.generator.output import write_file
 from riocore.plugins import PluginBase
 
 
@@ -435,4 +436,4 @@ class Plugin(PluginBase):
 
         folder = f"{self.system_setup['output_path']}/arduino_example_{self.instances_name}"
         os.makedirs(f"{folder}/src/", exist_ok=True)
-        open(f"{folder}/src/main.ino", "w").write("\n".join(output))
+        write_file(f"{folder}/src/main.ino", "\n".join(output))
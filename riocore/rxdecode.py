@@ -0,0 +1,80 @@
+import numpy as np
+
+from .capture import RECORD
+
+# vectorized decoding of many rx frames at once, for the analysis of captures (needs numpy)
+
+DTYPES = {"B": "<u1", "H": "<u2", "I": "<u4", "i": "<i4", "d": "<f8"}
+
+
+def capture_frames(capture, rx=True):
+    # (records x frame_size) uint8 view of the rx (or tx) frames of a CaptureFile, without copying
+    offset = capture.data_offset + RECORD.size
+    if rx:
+        offset += capture.frame_size
+    return np.ndarray((len(capture), capture.frame_size), dtype=np.uint8, buffer=capture.mm, offset=offset, strides=(capture.record_size, 1))
+
+
+def capture_times(capture):
+    # host time of the records in seconds since capture start
+    times = np.ndarray((len(capture),), dtype="<u8", buffer=capture.mm, offset=capture.data_offset, strides=(capture.record_size,))
+    return times / 1000000000.0
+
+
+def column(frames, offset, byte_size, code):
+    if code == "frame":
+        return frames[:, offset : offset + byte_size].copy()
+    if isinstance(code, int):
+        return ((frames[:, offset] & code) != 0).astype(np.uint8)
+    if code == "special":
+        # same as FrameCodec: the first (max 4) bytes, signed from 4 bytes
+        size = min(byte_size, 4)
+        value = np.zeros(len(frames), dtype=np.uint32)
+        for byte_n in range(size):
+            value |= frames[:, offset + byte_n].astype(np.uint32) << (8 * byte_n)
+        if byte_size >= 4:
+            return value.view(np.int32)
+        return value
+    return np.ascontiguousarray(frames[:, offset : offset + byte_size]).view(DTYPES[code])[:, 0]
+
+
+def hold(values, mask, initial=0):
+    # value of the last frame where mask was set (sample and hold of multiplexed variables)
+    index = np.where(mask, np.arange(len(mask)), -1)
+    index = np.maximum.accumulate(index)
+    result = np.where(index >= 0, values[np.maximum(index, 0)], initial)
+    return result
+
+
+def decode_frames(project, frames, signals=False):
+    """decodes a (N x buffer_bytes) uint8 array of rx frames
+
+    returns a dict of columns: timestamp, one per input variable and with signals=True
+    one per input signal (by halname). Signals of plugins with their own convert()
+    are converted value by value (convert() may keep state), signals of frameio plugins are skipped.
+    """
+    frames = np.asarray(frames, dtype=np.uint8)
+    if frames.ndim != 2 or frames.shape[1] != project.buffer_bytes:
+        raise ValueError(f"frames must have the shape (N, {project.buffer_bytes})")
+
+    codec = project.codec
+    columns = {}
+    for name, offset, byte_size, code in codec.rx_columns:
+        columns[name] = column(frames, offset, byte_size, code)
+
+    if codec.rx_mpx:
+        mpx_value = columns.pop("multiplexed_value")
+        mpx_id = columns.pop("multiplexed_id")
+        for mpx_n, data_config in enumerate(codec.rx_mpx):
+            columns[data_config["variable"]] = hold(mpx_value, mpx_id == mpx_n)
+
+    if signals:
+        for signal_name, signal_setup, interface_setup, convert in project.convert_rx_plan:
+            values = columns.get(interface_setup["variable"])
+            if values is None:
+                continue
+            if convert is not None:
+                values = np.array([convert(signal_name, signal_setup, value) for value in values.tolist()])
+            columns[signal_setup["halname"]] = values
+
+    return columns
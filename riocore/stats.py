@@ -0,0 +1,173 @@
+import json
+
+HEADERS = {b"atad", b"ptse"}
+
+
+class Histogram:
+    """log-linear (HDR style) histogram for nanosecond values
+
+    values below 2**bits are counted exactly, above that every power of two
+    is split into 2**(bits-1) buckets, so the relative error stays below 2**(1-bits)
+    """
+
+    def __init__(self, bits=6):
+        self.bits = bits
+        self.sub = 1 << bits
+        self.half = 1 << (bits - 1)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def index(self, value):
+        if value < self.sub:
+            return value
+        shift = value.bit_length() - self.bits
+        return self.sub + (shift - 1) * self.half + (value >> shift) - self.half
+
+    def value(self, index):
+        # highest value of the bucket
+        if index < self.sub:
+            return index
+        shift = (index - self.sub) // self.half + 1
+        top = (index - self.sub) % self.half + self.half
+        return ((top + 1) << shift) - 1
+
+    def record(self, value):
+        value = max(0, int(value))
+        index = self.index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        if not self.count:
+            return None
+        limit = self.count * percent / 100.0
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= limit:
+                return min(self.value(index), self.max)
+        return self.max
+
+    def summary(self, scale=1000.0):
+        # default scale: ns -> us
+        if not self.count:
+            return {"count": 0}
+        result = {
+            "count": self.count,
+            "min": self.min / scale,
+            "mean": self.total / self.count / scale,
+            "max": self.max / scale,
+        }
+        for percent in (50, 90, 99, 99.9):
+            result[f"p{percent}"] = self.percentile(percent) / scale
+        return result
+
+
+class LinkStats:
+    """latency, jitter and error statistics of the host <-> fpga cycles
+
+    enabled with Project.stats_enable(), the timestamps are perf_counter_ns() values
+    """
+
+    def __init__(self, project, period=None, cpu=False):
+        self.buffer_bytes = project.buffer_bytes
+        self.speed = project.config["speed"]
+        self.period = period
+        self.encode = Histogram()
+        self.transfer = Histogram()
+        self.decode = Histogram()
+        self.cycle = Histogram()
+        self.jitter = Histogram()
+        # thread cpu time per stage in ns
+        self.cpu = {"encode": 0, "transfer": 0, "decode": 0} if cpu else None
+        self.cycles = 0
+        self.timeouts = 0
+        self.wrong_size = 0
+        self.bad_header = 0
+        self.last_start = None
+        # host time <-> fpga timestamp, linear regression over all valid frames
+        self.fpga_ticks = None
+        self.fpga_last = None
+        self.host_first = None
+        self.sums = [0, 0.0, 0.0, 0.0, 0.0]
+
+    def record(self, start, encoded, transferred, decoded, length, rxdata, timestamp):
+        self.cycles += 1
+        self.encode.record(encoded - start)
+        self.transfer.record(transferred - encoded)
+        self.decode.record(decoded - transferred)
+        self.cycle.record(decoded - start)
+        if self.period and self.last_start is not None:
+            self.jitter.record(abs((start - self.last_start) - self.period * 1000000000))
+        self.last_start = start
+
+        if not length:
+            self.timeouts += 1
+            return
+        if length != self.buffer_bytes:
+            self.wrong_size += 1
+            return
+        if bytes(rxdata[0:4]) not in HEADERS:
+            self.bad_header += 1
+            return
+        self.clock(transferred, timestamp)
+
+    def record_cpu(self, start, encoded, transferred, decoded):
+        self.cpu["encode"] += encoded - start
+        self.cpu["transfer"] += transferred - encoded
+        self.cpu["decode"] += decoded - transferred
+
+    def clock(self, host_ns, timestamp):
+        # the fpga timestamp is a 32bit counter of sysclk ticks
+        ticks = round(timestamp * self.speed)
+        if self.fpga_last is None:
+            self.fpga_ticks = 0
+            self.host_first = host_ns
+        else:
+            self.fpga_ticks += (ticks - self.fpga_last) & 0xFFFFFFFF
+        self.fpga_last = ticks
+        host = (host_ns - self.host_first) / 1000000000
+        fpga = self.fpga_ticks / self.speed
+        self.sums[0] += 1
+        self.sums[1] += host
+        self.sums[2] += fpga
+        self.sums[3] += host * host
+        self.sums[4] += host * fpga
+
+    def drift_ppm(self):
+        # fpga clock compared to the host clock, positive: fpga is faster
+        n, sum_x, sum_y, sum_xx, sum_xy = self.sums
+        denominator = n * sum_xx - sum_x * sum_x
+        if n < 2 or denominator <= 0 or not self.fpga_ticks:
+            # no timestamps from the fpga (simulators)
+            return None
+        slope = (n * sum_xy - sum_x * sum_y) / denominator
+        return (slope - 1.0) * 1000000.0
+
+    def to_dict(self):
+        return {
+            "cycles": self.cycles,
+            "period_us": self.period * 1000000 if self.period else None,
+            "timeouts": self.timeouts,
+            "wrong_size": self.wrong_size,
+            "bad_header": self.bad_header,
+            "drift_ppm": self.drift_ppm(),
+            "latency_us": {
+                "encode": self.encode.summary(),
+                "transfer": self.transfer.summary(),
+                "decode": self.decode.summary(),
+                "cycle": self.cycle.summary(),
+            },
+            "jitter_us": self.jitter.summary(),
+        }
+
+    def dump(self, path):
+        open(path, "w").write(json.dumps(self.to_dict(), indent=4))
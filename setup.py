@@ -45,5 +45,6 @@ setup(
     description="riocore",
     long_description=open("README.md").read(),
     install_requires=["PyQt5>=5.15", "graphviz>=0.20", "pyqtgraph>=0.13.3"],
+    extras_require={"analysis": ["numpy"]},
     include_package_data=True,
 )
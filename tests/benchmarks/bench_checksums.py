@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+#
+# time per frame of the old bit by bit crc16 against the table driven one
+#
+# usage: python3 tests/benchmarks/bench_checksums.py [frames]
+#
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "unit"))
+
+from riocore.checksums import crc8_bulk, crc16, crc16_bulk  # noqa: E402
+from test_checksums import reference_crc16  # noqa: E402
+
+
+def per_frame(function, frames):
+    start = time.perf_counter()
+    for frame in frames:
+        function(frame)
+    return (time.perf_counter() - start) / len(frames) * 1000000
+
+
+def update(frame):
+    csum = crc16()
+    csum.update(frame)
+    return csum.intdigest()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rand = random.Random(1)
+    # builds the word table
+    update(bytes(1024))
+
+    print("")
+    print(f"{'bytes':>6s} {'before':>10s} {'after':>10s} {'bulk':>10s} {'crc8 bulk':>10s} {'speedup':>8s}")
+    for size in (8, 16, 32, 64, 256, 1024):
+        frames = [bytes(rand.randint(0, 255) for n in range(size)) for frame_n in range(count)]
+        before = per_frame(reference_crc16, frames[0 : max(1, count // 20)])
+        after = per_frame(update, frames)
+        start = time.perf_counter()
+        crc16_bulk(frames)
+        bulk = (time.perf_counter() - start) / count * 1000000
+        start = time.perf_counter()
+        crc8_bulk(frames)
+        bulk8 = (time.perf_counter() - start) / count * 1000000
+        print(f"{size:6d} {before:8.2f}us {after:8.2f}us {bulk:8.2f}us {bulk8:8.2f}us {before / after:7.1f}x")
+    print("")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+#
+# frames/second of the old list/struct loop against the precompiled FrameCodec
+#
+# usage: python3 tests/benchmarks/bench_codec.py [config.json] [frames]
+#
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "unit"))
+
+import riocore  # noqa: E402
+from test_codec import randomize_outputs, reference_rxdata, reference_txdata  # noqa: E402
+
+
+def rate(function, frames):
+    start = time.perf_counter()
+    for frame_n in range(frames):
+        function()
+    return frames / (time.perf_counter() - start)
+
+
+def main():
+    config = sys.argv[1] if len(sys.argv) > 1 else "riocore/configs/Tangbob/config.json"
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    project = riocore.Project(config, "/tmp/rio-bench")
+    randomize_outputs(project, random.Random(1))
+    rxdata = [random.randint(0, 255) for n in range(project.buffer_bytes)]
+    variables = len(project.get_interface_data())
+
+    print("")
+    print(f"config:    {config}")
+    print(f"variables: {variables}")
+    print(f"buffer:    {project.buffer_bytes} bytes")
+    print("")
+    print(f"{'':10s} {'before':>14s} {'after':>14s} {'speedup':>8s}")
+    for title, before, after in (
+        ("encode", lambda: reference_txdata(project), project.codec.encode),
+        ("decode", lambda: reference_rxdata(project, rxdata), lambda: project.codec.decode(rxdata)),
+    ):
+        rate_before = rate(before, frames)
+        rate_after = rate(after, frames)
+        print(f"{title:10s} {rate_before:10.0f} f/s {rate_after:10.0f} f/s {rate_after / rate_before:7.1f}x")
+    print("")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+#
+# runtime and generator timings on synthetic configs of growing size,
+# compared against the stored baselines (exit code 1 on a regression)
+#
+# usage: python3 tests/benchmarks/bench_suite.py                   (compare)
+#        python3 tests/benchmarks/bench_suite.py --save            (store new baselines)
+#        python3 tests/benchmarks/bench_suite.py --sizes 10,100 --filter vcp
+#
+# the timings are stored relative to a small pure python calibration loop (run before
+# every benchmark), so the baselines survive changes of the machine and its load
+#
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.getcwd())
+
+import riocore  # noqa: E402
+from riocore.checksums import crc8, crc16  # noqa: E402
+from riocore.generator.component import component  # noqa: E402
+
+BASELINES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+BASE_CONFIG = "tests/unit/data/config1.json"
+SIZES = (10, 50, 100, 500)
+
+# plugin types of the synthetic configs, with their pins
+PLUGINS = (
+    ("bitout", ("bit",)),
+    ("bitin", ("bit",)),
+    ("pwmout", ("pwm", "dir")),
+    ("counter", ("up", "down", "reset")),
+    ("freqin", ("freq",)),
+    ("quadencoder", ("a", "b")),
+    ("rcservo", ("pwm",)),
+)
+
+VCPS = (
+    ("pyvcp", "pyvcp"),
+    ("gladevcp", "gladevcp"),
+    ("qtvcp", "qtdragon.rio-gui"),
+    ("qtpyvcp", "qtpyvcp.rio"),
+)
+
+
+def synthetic_config(instances):
+    # the interface of the base config and the given number of plugin instances
+    config = json.load(open(BASE_CONFIG))
+    plugins = [plugin for plugin in config["plugins"] if plugin["type"] == "spi"]
+    pin_n = 0
+    for instance_n in range(instances):
+        plugin_type, pin_names = PLUGINS[instance_n % len(PLUGINS)]
+        plugin = {"type": plugin_type, "name": f"{plugin_type}{instance_n}", "pins": {}}
+        for pin_name in pin_names:
+            plugin["pins"][pin_name] = {"pin": f"P{pin_n}"}
+            pin_n += 1
+        plugins.append(plugin)
+    config["name"] = f"Synthetic{instances}"
+    config["plugins"] = plugins
+    return config
+
+
+def calibration():
+    # fixed pure python workload (dicts, strings, ints), best of 5
+    best = None
+    for run in range(5):
+        start = time.perf_counter()
+        data = {}
+        for n in range(20000):
+            data[f"key{n % 1000}"] = data.get(f"key{n % 1000}", 0) + n
+        best = min(best or 1e9, time.perf_counter() - start)
+    return best
+
+
+def measure(function, setup=None, min_time=0.2, min_runs=5, max_runs=1000):
+    # fastest single call in seconds (least disturbed by the system), fast functions are timed in batches of >= 1ms
+    number = 1
+    if setup is None:
+        start = time.perf_counter()
+        function()
+        number = max(1, int(0.001 / max(time.perf_counter() - start, 1e-7)))
+    times = []
+    total = 0.0
+    while len(times) < max_runs and (len(times) < min_runs or total < min_time):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for call_n in range(number):
+            function()
+        duration = time.perf_counter() - start
+        times.append(duration / number)
+        total += duration
+    return min(times)
+
+
+def cases(config_path, output_path):
+    # (name, function, setup) per benchmark of one config
+    project = riocore.Project(config_path, output_path)
+    rand = random.Random(1)
+    rxdata = [rand.randint(0, 255) for n in range(project.buffer_bytes)]
+    rxdata[0:4] = list(b"atad")
+    linuxcnc = project.generator_linuxcnc
+
+    # process start of a runtime-only tool (import riocore, load the config)
+    startup = [sys.executable, "-c", f"import riocore; riocore.Project({config_path!r}, {output_path!r})"]
+    yield ("startup", lambda: subprocess.run(startup, stdout=subprocess.DEVNULL, check=True), None)
+    yield ("project_init", lambda: riocore.Project(config_path, output_path), None)
+    yield ("txdata_get", project.txdata_get, None)
+    yield ("rxdata_set", lambda: project.rxdata_set(rxdata), None)
+
+    # the conversion plans of the runtime (plugins without a plan are called directly)
+    yield ("convert2interface", project.convert2interface, None)
+    yield ("convert2signals", project.convert2signals, None)
+
+    frame = bytes(rxdata)
+    yield ("crc8", lambda: crc8().update(frame), None)
+    yield ("crc16", lambda: crc16().update(frame), None)
+
+    yield ("gateware", lambda: project.generator_gateware.generator(generate_pll=False), None)
+    yield ("linuxcnc", linuxcnc.generator, None)
+    # net_write() resolves the collected nets in place, so every run needs fresh ones
+    yield ("hal_net_write", lambda: linuxcnc.halg.net_write(), linuxcnc.hal)
+    yield ("component", lambda: component(project), None)
+    for gui_type, gui_prefix in VCPS:
+
+        def vcp_setup(gui_type=gui_type, gui_prefix=gui_prefix):
+            linuxcnc.hal()
+            linuxcnc.gui_type = gui_type
+            linuxcnc.gui_prefix = gui_prefix
+
+        yield (f"vcp.{gui_type}", linuxcnc.vcp_gui, vcp_setup)
+
+
+def run(sizes, name_filter, min_time, rounds):
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_path:
+        for size in sizes:
+            config_path = os.path.join(tmp_path, f"synthetic{size}.json")
+            open(config_path, "w").write(json.dumps(synthetic_config(size), indent=4))
+            output_path = os.path.join(tmp_path, "output")
+            # the generators are chatty
+            with contextlib.redirect_stdout(open(os.devnull, "w")):
+                for name, function, setup in cases(config_path, output_path):
+                    if name_filter and name_filter not in name:
+                        continue
+                    # warm up, the first run of the generators creates the output files
+                    if setup:
+                        setup()
+                    function()
+                    # best of some rounds, each against a fresh calibration
+                    best = None
+                    for round_n in range(rounds):
+                        reference = calibration()
+                        duration = measure(function, setup, min_time=min_time)
+                        if best is None or duration / reference < best[0] / best[1]:
+                            best = (duration, reference)
+                    results[f"{name}/{size}"] = best
+            print(".", end="", flush=True)
+    print("")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--save", help="store the results as new baselines", default=False, action="store_true")
+    parser.add_argument("--sizes", help="plugin instances of the synthetic configs", type=str, default=",".join(str(size) for size in SIZES))
+    parser.add_argument("--filter", help="only benchmarks containing this string", type=str, default="")
+    parser.add_argument("--tolerance", help="allowed slowdown against the baseline", type=float, default=2.0)
+    parser.add_argument("--min-time", help="minimum measuring time per benchmark and round in seconds", type=float, default=0.1)
+    parser.add_argument("--min-diff", help="ignore slowdowns below this time in us", type=float, default=2.0)
+    parser.add_argument("--rounds", help="measuring rounds per benchmark", type=int, default=3)
+    parser.add_argument("--baselines", help="baselines file", type=str, default=BASELINES)
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run(sizes, args.filter, args.min_time, args.rounds)
+
+    baselines = {}
+    if os.path.isfile(args.baselines):
+        baselines = json.loads(open(args.baselines, "r").read())
+
+    regressions = []
+    print("")
+    print(f"{'benchmark':28s} {'time':>12s} {'baseline':>12s} {'ratio':>7s}")
+    for name, (duration, reference) in results.items():
+        relative = duration / reference
+        baseline = baselines.get("results", {}).get(name)
+        if baseline is None:
+            print(f"{name:28s} {duration * 1000:10.3f}ms {'-':>12s} {'-':>7s}")
+            continue
+        ratio = relative / baseline
+        marker = ""
+        # differences of a few us are noise of the machine, not of the code
+        if ratio > args.tolerance and duration - baseline * reference > args.min_diff / 1000000:
+            marker = "  <-- REGRESSION"
+            regressions.append(name)
+        print(f"{name:28s} {duration * 1000:10.3f}ms {baseline * reference * 1000:10.3f}ms {ratio:6.2f}x{marker}")
+    print("")
+
+    if args.save:
+        baselines.setdefault("results", {})
+        for name, (duration, reference) in results.items():
+            baselines["results"][name] = duration / reference
+        baselines["results"] = dict(sorted(baselines["results"].items()))
+        open(args.baselines, "w").write(json.dumps(baselines, indent=4))
+        print(f"baselines written to: {args.baselines}")
+        print("")
+    elif regressions:
+        print(f"ERROR: {len(regressions)} benchmarks slower than {args.tolerance}x the baseline:")
+        for name in regressions:
+            print(f"    {name}")
+        print("")
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import copy
+import glob
+import json
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_path(tmp_path_factory):
+    # metadata index and build cache of the tests (also of the called scripts), not the ones of the user
+    old_path = os.environ.get("XDG_CACHE_HOME")
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path_factory.mktemp("cache"))
+    yield os.environ["XDG_CACHE_HOME"]
+    if old_path is None:
+        del os.environ["XDG_CACHE_HOME"]
+    else:
+        os.environ["XDG_CACHE_HOME"] = old_path
+
+
+def project_configs():
+    # all shipped configs and some special setups (json text)
+    configs = sorted(glob.glob("riocore/configs/*/config.json")) + ["tests/unit/data/config1.json"]
+    for config in configs:
+        yield config
+
+    # same setup, but with multiplexed variables
+    jdata = json.loads(open("tests/unit/data/config1.json", "r").read())
+    mpx = copy.deepcopy(jdata)
+    mpx["plugins"].append({"type": "pwmout", "multiplexed": True, "pins": {"pwm": {"pin": "1"}}})
+    mpx["plugins"].append({"type": "counter", "multiplexed": True, "pins": {"up": {"pin": "2"}, "down": {"pin": "3"}, "reset": {"pin": "4"}}})
+    mpx["plugins"].append({"type": "freqin", "multiplexed": True, "pins": {"freq": {"pin": "5"}}})
+    yield json.dumps(mpx)
+
+    # unaligned variables (overlapping byte ranges)
+    unaligned = copy.deepcopy(jdata)
+    unaligned["plugins"].append({"type": "icewerxadc", "multiplexed": False, "pins": {"tx": {"pin": "1"}, "rx": {"pin": "2"}}})
+    unaligned["plugins"].append({"type": "pdmout", "resolution": 10, "pins": {"pdm": {"pin": "3"}}})
+    unaligned["plugins"].append({"type": "pdmout", "resolution": 12, "pins": {"pdm": {"pin": "5"}}})
+    unaligned["plugins"].append({"type": "pdmout", "resolution": 24, "pins": {"pdm": {"pin": "4"}}})
+    yield json.dumps(unaligned)
+
+
+@pytest.fixture(params=list(project_configs()))
+def project_config(request):
+    return request.param
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+#
+#
+
+import asyncio
+import socket
+import time
+
+import riocore
+from riocore import aio
+
+
+class DelayedPeer(asyncio.DatagramProtocol):
+    # answers every frame after a delay, like a board on a slow network
+    def __init__(self, delay):
+        self.delay = delay
+        self.frames = 0
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        self.frames += 1
+        reply = b"at" + data[2:4] + bytes(len(data) - 4)
+        asyncio.get_running_loop().call_later(self.delay, self.transport.sendto, reply, addr)
+
+
+def free_ports():
+    # two free ports in a row (board port and the local port + 1)
+    while True:
+        sock = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+        sock.close()
+        try:
+            sock = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+            sock.bind(("127.0.0.1", port + 1))
+            sock.close()
+            return port
+        except OSError:
+            pass
+
+
+def test_cycle_async_overlap():
+    async def main():
+        loop = asyncio.get_running_loop()
+        projects = []
+        peers = []
+        for board_n in range(2):
+            port = free_ports()
+            transport, peer = await loop.create_datagram_endpoint(lambda: DelayedPeer(0.1), local_addr=("127.0.0.1", port))
+            peers.append(peer)
+            project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+            await project.connect_async(f"127.0.0.1:{port}:1000000:seq")
+            projects.append(project)
+
+        start = time.perf_counter()
+        await aio.run(projects, cycles=4)
+        duration = time.perf_counter() - start
+
+        for project in projects:
+            assert project.connection.pkg_in == 4
+            assert project.connection.lost == 0
+            assert bytes(project.codec.rxbuffer[0:4]) == b"atad"
+            project.connection.close()
+        for peer in peers:
+            assert peer.frames == 4
+            peer.transport.close()
+        return duration
+
+    # 2 boards * 4 cycles * 100ms serialized
+    assert asyncio.run(main()) < 0.7
+
+
+class BlockingList:
+    def __init__(self):
+        self.frames = 0
+
+    def transfare(self, data):
+        self.frames += 1
+        return [0x61, 0x74, 0x61, 0x64] + [0] * (len(data) - 4)
+
+
+def test_executor_transport():
+    async def main():
+        project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+        interface = BlockingList()
+        project.connection = aio.ExecutorTransport(interface)
+        assert await project.cycle_async() == project.buffer_bytes
+        assert await project.cycle_async() == project.buffer_bytes
+        project.connection.close()
+        return interface.frames
+
+    assert asyncio.run(main()) == 2
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import subprocess
+import sys
+
+import riocore
+from test_capture import Loopback
+
+
+def test_rio_bench(tmp_path):
+    path = str(tmp_path / "frames.riocap")
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    project.connection = Loopback(project.buffer_bytes)
+    project.capture_start(path)
+    for cycle_n in range(100):
+        project.cycle()
+    project.capture_stop()
+
+    output = subprocess.check_output([sys.executable, "bin/rio-bench", "tests/unit/data/config1.json", f"replay:{path}:0", "--duration", "0.5", "--json", "-"])
+    result = json.loads(output)
+    assert result["cycles"] >= 100
+    assert result["timeouts"] == result["cycles"] - 100
+    assert result["latency_us"]["cycle"]["count"] == result["cycles"]
+    assert set(result["cpu_percent"]) == {"encode", "transfer", "decode", "user", "system"}
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+#
+#
+
+import os
+from riocore.generator import buildcache
+
+MAKEFILE = """
+PATH     := {tool_path}:$(PATH)
+
+all: rio.bin
+
+rio.bin: rio.v pins.pcf
+	fakesynth rio.v rio.bin
+	cp hash_new.txt hash_compiled.txt
+
+clean:
+	rm -rf rio.bin report
+"""
+
+FAKESYNTH = """#!/bin/sh
+echo run >> {runs}
+mkdir -p report
+echo ok > report/timing.rpt
+cat $1 > $2
+"""
+
+
+def gateware(path, tool_path, verilog="module rio();\\nendmodule\\n"):
+    os.makedirs(path)
+    open(os.path.join(path, "Makefile"), "w").write(MAKEFILE.format(tool_path=tool_path))
+    open(os.path.join(path, "rio.v"), "w").write(verilog)
+    open(os.path.join(path, "pins.pcf"), "w").write("set_io sysclk_in 35\n")
+    open(os.path.join(path, "hash_new.txt"), "w").write("1234")
+    open(os.path.join(path, "interface.html"), "w").write(f"<h1>{os.path.basename(path)}</h1>")
+    return path
+
+
+def test_build_cache(tmp_path):
+    tool_path = str(tmp_path / "bin")
+    os.makedirs(tool_path)
+    runs = str(tmp_path / "runs")
+    fakesynth = os.path.join(tool_path, "fakesynth")
+    open(fakesynth, "w").write(FAKESYNTH.format(runs=runs))
+    os.chmod(fakesynth, 0o755)
+    cache = buildcache.BuildCache(str(tmp_path / "cache"))
+
+    def build_runs(path):
+        assert buildcache.build(path, cache) == 0
+        assert open(os.path.join(path, "rio.bin"), "r").read() == open(os.path.join(path, "rio.v"), "r").read()
+        assert open(os.path.join(path, "report", "timing.rpt"), "r").read() == "ok\n"
+        assert open(os.path.join(path, "hash_compiled.txt"), "r").read() == "1234"
+        return len(open(runs, "r").readlines())
+
+    # same gateware of two machines: built once
+    assert build_runs(gateware(str(tmp_path / "machine1"), tool_path)) == 1
+    assert build_runs(gateware(str(tmp_path / "machine2"), tool_path)) == 1
+    assert build_runs(str(tmp_path / "machine1")) == 1
+
+    # other verilog
+    assert build_runs(gateware(str(tmp_path / "machine3"), tool_path, verilog="module rio(input a);\nendmodule\n")) == 2
+
+    # updated toolchain
+    open(fakesynth, "a").write("\n")
+    assert build_runs(str(tmp_path / "machine2")) == 3
+
+    # without cache
+    assert buildcache.build(str(tmp_path / "machine2")) == 0
+    assert len(open(runs, "r").readlines()) == 4
+
+
+def test_makefile_tools(tmp_path):
+    makefile = str(tmp_path / "Makefile")
+    open(makefile, "w").write("FAMILY := ecp5\n\nall:\n\tyosys -q rio.v && nextpnr-$(FAMILY) --json rio.json\n\t@echo done\n\tcp -v hash_new.txt hash_compiled.txt\n")
+    tools, search_path = buildcache.makefile_tools(makefile)
+    assert tools == ["nextpnr-ecp5", "yosys"]
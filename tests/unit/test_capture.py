@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import random
+
+import riocore
+from riocore.capture import CaptureFile, CaptureWriter
+
+
+class Loopback:
+    # random rx frames with a valid header
+    def __init__(self, frame_size):
+        self.rand = random.Random(5)
+        self.frame_size = frame_size
+
+    def transfare(self, data):
+        return [0x61, 0x74, 0x61, 0x64] + [self.rand.randint(0, 255) for n in range(self.frame_size - 4)]
+
+
+def test_capture_replay(tmp_path):
+    path = str(tmp_path / "frames.riocap")
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    project.connection = Loopback(project.buffer_bytes)
+    project.capture_start(path)
+    values = []
+    txframes = []
+    for cycle_n in range(20):
+        project.signal_value_set("spindle-enable.bit", cycle_n & 1)
+        assert project.cycle() == project.buffer_bytes
+        txframes.append(bytes(project.codec.txbuffer))
+        values.append([data_config["value"] for size, plugin_instance, data_name, data_config in project.layout.inputs])
+    project.capture_stop()
+    assert isinstance(project.connection, Loopback)
+
+    capture = CaptureFile(path)
+    assert len(capture) == 20
+    assert capture.frame_size == project.buffer_bytes
+    assert capture.setup["buffer_size"] == project.buffer_size
+    assert len(capture.setup["layout"]) == len(project.get_interface_data())
+    times = [record[0] for record in capture]
+    assert times == sorted(times)
+    assert [bytes(record[4]) for record in capture] == txframes
+    assert bytes(capture[-1][5][0:4]) == b"atad"
+    setup = capture.setup
+    capture.close()
+
+    # replay into a project built from the embedded config
+    replay = riocore.Project(json.dumps(setup["config"]), "tests/unit/output")
+    replay.connect(f"replay:{path}:0")
+    for cycle_n in range(20):
+        assert replay.cycle() == replay.buffer_bytes
+        assert [data_config["value"] for size, plugin_instance, data_name, data_config in replay.layout.inputs] == values[cycle_n]
+    assert replay.cycle() == 0
+
+
+def test_capture_flush(tmp_path):
+    # the records reach the file without close (crash of a long running session)
+    path = str(tmp_path / "frames.riocap")
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    writer = CaptureWriter(path, project, flush_interval=0)
+    frame = bytes(project.buffer_bytes)
+    for record_n in range(3):
+        writer.write(frame, frame, len(frame), 1000)
+    capture = CaptureFile(path)
+    assert len(capture) == 3
+    capture.close()
+    writer.close()
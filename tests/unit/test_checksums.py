@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+#
+#
+
+import random
+import re
+
+from riocore.checksums import CRC16_TABLE, crc8, crc8_bulk, crc16, crc16_bulk
+
+
+def reference_crc16(data):
+    # the bit by bit implementation as it was before the table
+    crc = 0xFFFF
+    for i in range(len(data)):
+        crc ^= data[i]
+        for j in range(8):
+            if (crc & 0x1) == 1:
+                crc = int((crc / 2)) ^ 40961
+            else:
+                crc = int(crc / 2)
+    return crc & 0xFFFF
+
+
+def random_frames(count=200, seed=11):
+    rand = random.Random(seed)
+    return [bytes(rand.randint(0, 255) for n in range(rand.randint(0, 300))) for frame_n in range(count)]
+
+
+def test_crc16():
+    for frame in random_frames():
+        expected = reference_crc16(frame)
+        for data in (frame, bytearray(frame), memoryview(frame), list(frame), tuple(frame)):
+            csum = crc16()
+            csum.update(data)
+            assert csum.crc == expected
+            assert crc16().crc16(data) == expected
+
+        csum = crc16()
+        for byte in frame:
+            csum.update(byte)
+        assert csum.crc == expected
+
+        if len(frame) > 10:
+            assert crc16().crc16(frame, 3, len(frame) - 5) == reference_crc16(frame[3:-2])
+
+    csum = crc16()
+    csum.update([1, 3, 0, 0, 0, 10])
+    assert csum.intdigest() == [0xC5, 0xCD]
+
+
+def test_crc_bulk():
+    frames = random_frames()
+    assert crc16_bulk(frames) == [reference_crc16(frame) for frame in frames]
+    expected = []
+    for frame in frames:
+        csum = crc8()
+        csum.update(memoryview(frame))
+        expected.append(csum.intdigest()[0])
+    assert crc8_bulk(frames) == expected
+
+
+def test_crc16_c_table():
+    # realtime component uses the same table
+    source = open("riocore/files/hal_functions.c", "r").read()
+    table = source.split("crc16_table[256] = {")[1].split("};")[0]
+    assert [int(value, 16) for value in re.findall(r"0x[0-9A-F]{4}", table)] == CRC16_TABLE
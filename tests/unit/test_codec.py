@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import random
+from struct import pack, unpack
+
+import pytest
+import riocore
+
+
+def reference_txdata(project):
+    # the frame encoder as it was before the FrameCodec
+    txdata = [0] * project.buffer_bytes
+    txdata[0] = 0x74
+    txdata[1] = 0x69
+    txdata[2] = 0x72
+    txdata[3] = 0x77
+    output_pos = project.buffer_size - project.header_size
+
+    if project.multiplexed_output:
+        mpx_value = 0
+        mpxid = 0
+        for size, plugin_instance, data_name, data_config in project.get_interface_data():
+            if data_config.get("expansion", False):
+                continue
+            if not data_config.get("multiplexed", False):
+                continue
+            if data_config["direction"] in {"output"}:
+                if project.multiplexed_output_id == mpxid:
+                    mpx_value = data_config["value"]
+                mpxid += 1
+
+        variable_size = project.multiplexed_output_size
+        byte_start, byte_size, bit_offset = project.get_bype_pos(output_pos, variable_size)
+        byte_start = project.buffer_bytes - 1 - byte_start
+        txdata[byte_start - (byte_size - 1) : byte_start + 1] = list(pack("<i", int(mpx_value)))[0:byte_size]
+        output_pos -= variable_size
+        variable_size = 8
+        byte_start, byte_size, bit_offset = project.get_bype_pos(output_pos, variable_size)
+        byte_start = project.buffer_bytes - 1 - byte_start
+        txdata[byte_start - (byte_size - 1) : byte_start + 1] = list(pack("<i", int(project.multiplexed_output_id)))[0:byte_size]
+        output_pos -= variable_size
+        if project.multiplexed_output_id < project.multiplexed_output - 1:
+            project.multiplexed_output_id += 1
+        else:
+            project.multiplexed_output_id = 0
+
+    for size, plugin_instance, data_name, data_config in project.get_interface_data():
+        if data_config.get("expansion", False):
+            continue
+        if data_config.get("multiplexed", False):
+            continue
+        variable_size = data_config["size"]
+        value = data_config["value"]
+        if data_config["direction"] == "output" or data_config["direction"] == "inout":
+            byte_start, byte_size, bit_offset = project.get_bype_pos(output_pos, variable_size)
+            byte_start = project.buffer_bytes - 1 - byte_start
+            if plugin_instance.TYPE == "frameio":
+                if not value:
+                    value = [0] * byte_size
+                txdata[byte_start - (byte_size - 1) : byte_start + 1] = value[0:byte_size]
+            elif variable_size > 1:
+                txdata[byte_start - (byte_size - 1) : byte_start + 1] = list(pack("<i", int(value)))[0:byte_size]
+            else:
+                if value == 1:
+                    txdata[byte_start] |= 1 << bit_offset
+            output_pos -= variable_size
+    return txdata
+
+
+def reference_rxdata(project, rxdata):
+    # the frame decoder as it was before the FrameCodec, returns the decoded values
+    values = {}
+    input_pos = project.buffer_size - project.header_size
+
+    byte_start, byte_size, bit_offset = project.get_bype_pos(input_pos, project.timestamp_size)
+    byte_start = project.buffer_bytes - 1 - byte_start
+    values["timestamp"] = unpack("<I", bytes(rxdata[byte_start - (byte_size - 1) : byte_start + 1]))[0]
+    input_pos -= project.timestamp_size
+
+    if project.multiplexed_input:
+        variable_size = project.multiplexed_input_size
+        byte_start, byte_size, bit_offset = project.get_bype_pos(input_pos, variable_size)
+        byte_start = project.buffer_bytes - 1 - byte_start
+        byte_pack = rxdata[byte_start - (byte_size - 1) : byte_start + 1]
+        if len(byte_pack) < 4:
+            byte_pack += [0] * (4 - len(byte_pack))
+        if byte_size == 8:
+            mpx_value = unpack("<d", bytes(byte_pack))[0]
+        else:
+            mpx_value = unpack("<i", bytes(byte_pack))[0]
+        input_pos -= variable_size
+        byte_start, byte_size, bit_offset = project.get_bype_pos(input_pos, 8)
+        byte_start = project.buffer_bytes - 1 - byte_start
+        byte_pack = rxdata[byte_start - (byte_size - 1) : byte_start + 1]
+        if len(byte_pack) < 4:
+            byte_pack += [0] * (4 - len(byte_pack))
+        mpx_id = unpack("<i", bytes(byte_pack))[0]
+        input_pos -= 8
+
+        mpxid = 0
+        for size, plugin_instance, data_name, data_config in project.get_interface_data():
+            if not data_config.get("multiplexed", False):
+                continue
+            if data_config["direction"] == "input":
+                if mpx_id == mpxid:
+                    values[data_config["variable"]] = mpx_value
+                mpxid += 1
+
+    for size, plugin_instance, data_name, data_config in project.get_interface_data():
+        if data_config.get("expansion", False):
+            continue
+        if data_config.get("multiplexed", False):
+            continue
+        variable_size = data_config["size"]
+        if data_config["direction"] == "input":
+            byte_start, byte_size, bit_offset = project.get_bype_pos(input_pos, variable_size)
+            byte_start = project.buffer_bytes - 1 - byte_start
+            if plugin_instance.TYPE == "frameio":
+                value = rxdata[byte_start - (byte_size - 1) : byte_start + 1][0:byte_size]
+            elif variable_size > 1:
+                byte_pack = rxdata[byte_start - (byte_size - 1) : byte_start + 1]
+                if len(byte_pack) < 4:
+                    byte_pack += [0] * (4 - len(byte_pack))
+                value = unpack("<i", bytes(byte_pack))[0]
+            else:
+                value = 1 if rxdata[byte_start] & (1 << bit_offset) else 0
+            values[data_config["variable"]] = value
+            input_pos -= variable_size
+    return values
+
+
+def randomize_outputs(project, rand):
+    for size, plugin_instance, data_name, data_config in project.get_interface_data():
+        if data_config["direction"] == "input":
+            continue
+        if plugin_instance.TYPE == "frameio":
+            data_config["value"] = bytes([rand.randint(0, 255) for n in range((size + 7) // 8)])
+        elif size == 1:
+            data_config["value"] = rand.randint(0, 1)
+        elif size >= 32:
+            data_config["value"] = rand.randint(-(2**31), 2**31 - 1)
+        else:
+            data_config["value"] = rand.randint(0, 2**size - 1)
+
+
+def test_codec_identical(project_config):
+    try:
+        project = riocore.Project(project_config, "tests/unit/output")
+    except json.JSONDecodeError as error:
+        pytest.skip(f"broken json: {error}")
+    rand = random.Random(1234)
+
+    for frame_n in range(8):
+        randomize_outputs(project, rand)
+
+        mpx_id = project.multiplexed_output_id
+        expected = reference_txdata(project)
+        project.multiplexed_output_id = mpx_id
+        txdata = list(project.codec.encode())
+        assert txdata == expected
+        assert len(txdata) == project.buffer_bytes
+
+        rxdata = [rand.randint(0, 255) for n in range(project.buffer_bytes)]
+        expected = reference_rxdata(project, rxdata)
+        timestamp = project.codec.decode(rxdata)
+        assert timestamp == expected.pop("timestamp")
+        for size, plugin_instance, data_name, data_config in project.get_interface_data():
+            if data_config["variable"] in expected:
+                assert data_config["value"] == expected[data_config["variable"]]
+
+
+def test_codec_txdata_rxdata():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    txdata = project.txdata_get()
+    assert txdata[0:4] == [0x74, 0x69, 0x72, 0x77]
+    assert len(txdata) == project.buffer_bytes
+
+    rxdata = [0x61, 0x74, 0x61, 0x64] + [0] * (project.buffer_bytes - 4)
+    byte_start = project.buffer_bytes - 1 - (project.buffer_size - project.header_size) // 8
+    rxdata[byte_start + 1 : byte_start + 5] = list(pack("<I", project.config["speed"]))
+    project.rxdata_set(rxdata)
+    assert project.timestamp == 1.0
+
+
+class LoopbackList:
+    # answers every frame with a fixed rx frame, list api only
+    def __init__(self, rxdata):
+        self.rxdata = rxdata
+        self.txdata = None
+
+    def transfare(self, data):
+        self.txdata = list(data)
+        return list(self.rxdata)
+
+
+class LoopbackInto(LoopbackList):
+    def transfer_into(self, txdata, rxdata):
+        self.txdata = list(txdata)
+        rxdata[0 : len(self.rxdata)] = bytes(self.rxdata)
+        return len(self.rxdata)
+
+
+@pytest.mark.parametrize("connection_class", [LoopbackList, LoopbackInto])
+def test_cycle(connection_class):
+    rand = random.Random(42)
+    reference = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    randomize_outputs(reference, rand)
+    rand = random.Random(42)
+    randomize_outputs(project, rand)
+
+    rxdata = [0x61, 0x74, 0x61, 0x64] + [rand.randint(0, 255) for n in range(project.buffer_bytes - 4)]
+    project.connection = connection_class(rxdata)
+    assert project.cycle() == project.buffer_bytes
+    assert project.connection.txdata == reference.txdata_get()
+
+    reference.rxdata_set(rxdata)
+    assert project.timestamp == reference.timestamp
+    for entry, reference_entry in zip(project.get_interface_data(), reference.get_interface_data()):
+        assert entry[3]["value"] == reference_entry[3]["value"]
+
+
+def test_shm_transfer_into(tmp_path):
+    from riocore.interfaces.SHM.interface import Interface
+
+    shm = Interface(str(tmp_path / "rio"))
+    (tmp_path / "rio.rx").write_bytes(bytes(range(16)))
+    rxdata = bytearray(16)
+    assert shm.transfer_into(memoryview(b"tirw" + bytes(12)), rxdata) == 16
+    assert rxdata == bytes(range(16))
+    assert (tmp_path / "rio.tx").read_bytes() == b"tirw" + bytes(12)
+    assert shm.transfare([1, 2, 3, 4]) == [0, 1, 2, 3]
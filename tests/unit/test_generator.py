@@ -3,11 +3,13 @@
 #
 
 import glob
+import json
 import os
 import pytest
 import riocore
 import os.path
 import shutil
+import subprocess
 
 
 @pytest.mark.parametrize(
@@ -129,3 +131,84 @@ def test_generade_all():
 
         if not os.path.exists(f"tests/unit/output/{project.config['name']}/LinuxCNC/rio.ini"):
             assert False
+
+
+def test_generator_unchanged(tmp_path):
+    config = json.loads(open("tests/unit/data/config1.json", "r").read())
+    config_path = str(tmp_path / "config.json")
+    output_path = str(tmp_path / "output")
+    open(config_path, "w").write(json.dumps(config))
+    project = riocore.Project(config_path, output_path)
+    changed = project.generator(True)
+    assert os.path.join(output_path, "Tangoboard", "Gateware", "rio.v") in changed
+    rio_v_mtime = os.stat(os.path.join(output_path, "Tangoboard", "Gateware", "rio.v")).st_mtime_ns
+
+    # nothing changed, nothing written
+    project = riocore.Project(config_path, output_path)
+    assert project.generator(True) == []
+
+    # hal only change
+    config["plugins"][0]["signals"]["bit"]["net"] = "spindle.0.brake"
+    open(config_path, "w").write(json.dumps(config))
+    project = riocore.Project(config_path, output_path)
+    changed = [os.path.relpath(path, output_path) for path in project.generator(True)]
+    assert sorted(changed) == ["Tangoboard/.config.json", "Tangoboard/LinuxCNC/custom_postgui.hal", "Tangoboard/LinuxCNC/rio.hal"]
+    assert os.stat(os.path.join(output_path, "Tangoboard", "Gateware", "rio.v")).st_mtime_ns == rio_v_mtime
+
+
+SWEEP_TOOLS = {
+    "yosys": "#!/bin/sh\necho '{}' > rio.json\n",
+    # achieved frequency depends on the seed, best: seed 2
+    "nextpnr-ice40": """#!/bin/sh
+while [ $# -gt 0 ]; do
+    case $1 in
+        -l) log=$2; shift;;
+        --seed) seed=$2; shift;;
+        --asc) asc=$2; shift;;
+    esac
+    shift
+done
+mhz=$(( (seed * 7) % 5 + 10 ))
+echo "Info: Max frequency for clock 'sysclk': $(( mhz + 2 )).00 MHz (PASS at 12.00 MHz)" > $log
+echo "Info: Max frequency for clock 'sysclk': $mhz.50 MHz (PASS at 12.00 MHz)" >> $log
+echo "seed $seed" > $asc
+""",
+    "icepack": "#!/bin/sh\ncp $1 $2\n",
+}
+
+
+def test_seed_sweep(tmp_path):
+    tool_path = str(tmp_path / "bin")
+    os.makedirs(tool_path)
+    for name, script in SWEEP_TOOLS.items():
+        open(os.path.join(tool_path, name), "w").write(script)
+        os.chmod(os.path.join(tool_path, name), 0o755)
+
+    output_path = str(tmp_path / "output")
+    project = riocore.Project("riocore/configs/ICEBreakerV1.0e/config.json", output_path)
+    project.generator(True)
+    gateware_path = os.path.join(output_path, project.config["name"], "Gateware")
+    # no pll in preview mode
+    open(os.path.join(gateware_path, "pll.v"), "w").write("")
+    env = dict(os.environ, PATH=f"{tool_path}:{os.environ['PATH']}")
+    result = subprocess.run(["make", "sweep", "SEEDS=4", "SWEEP_JOBS=2"], cwd=gateware_path, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "best seed: 2" in result.stdout
+    assert open(os.path.join(gateware_path, "rio.bin"), "r").read() == "seed 2\n"
+    assert "14.50 MHz" in open(os.path.join(gateware_path, "nextpnr.log"), "r").read()
+
+
+def test_system_clock(tmp_path):
+    # the achieved pll frequency is the system clock of all generators
+    output_path = str(tmp_path / "output")
+    project = riocore.Project("riocore/configs/IceShield/config.json", output_path)
+    project.generator(True)
+    speed = project.config["speed"]
+    assert speed == project.config["pll_setup"]["fout"]
+    assert not os.path.isfile(os.path.join(output_path, project.config["name"], "Gateware", "pll.v"))
+    makefile = open(os.path.join(output_path, project.config["name"], "Gateware", "Makefile"), "r").read()
+    assert f"CLK_SPEED := {speed / 1000000}\n" in makefile
+    rio_v = open(os.path.join(output_path, project.config["name"], "Gateware", "rio.v"), "r").read()
+    assert f"Clock     : {speed / 1000000} Mhz\n" in rio_v
+    riocomp = open(os.path.join(output_path, project.config["name"], "LinuxCNC", "riocomp.c"), "r").read()
+    assert f"#define OSC_CLOCK {speed}\n" in riocomp
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import os
+
+from riocore.generator import batch, buildcache
+from test_buildcache import FAKESYNTH, gateware
+
+
+def test_batch_generate(tmp_path):
+    config = json.loads(open("tests/unit/data/config-ini1.json", "r").read())
+    config_path = str(tmp_path / "configs")
+    os.makedirs(config_path)
+    for name in ("Machine1", "Machine2", "Machine1"):
+        config["name"] = name
+        open(os.path.join(config_path, f"config-{len(os.listdir(config_path))}.json"), "w").write(json.dumps(config))
+    open(os.path.join(config_path, "config-3.json"), "w").write("{")
+    output_path = str(tmp_path / "output")
+
+    results = batch.batch(os.path.join(config_path, "*.json"), output_path, preview=True, workers=2)
+    assert [result["status"] for result in results[:3]] == ["ok", "ok", "ok"]
+    assert results[3]["status"] == "failed: please check your json syntax"
+    assert [result["name"] for result in results[:3]] == ["Machine1", "Machine2", "Machine1"]
+    # same name, own output folder
+    gateware_paths = [os.path.join(output_path, "Machine1", "Gateware"), os.path.join(output_path, "Machine2", "Gateware"), os.path.join(output_path, "config-2", "Machine1", "Gateware")]
+    assert [result["gateware_path"] for result in results[:3]] == gateware_paths
+    for result in results[:3]:
+        assert os.path.isfile(os.path.join(result["gateware_path"], "rio.v"))
+    assert batch.report(results) is False
+
+    # list file
+    open(str(tmp_path / "configs.txt"), "w").write(f"# machines\n{os.path.join(config_path, 'config-1.json')}\n\n{os.path.join(config_path, 'config-0.json')}\n")
+    assert batch.config_files(str(tmp_path / "configs.txt")) == [os.path.join(config_path, "config-1.json"), os.path.join(config_path, "config-0.json")]
+
+
+def test_batch_build(tmp_path):
+    tool_path = str(tmp_path / "bin")
+    os.makedirs(tool_path)
+    runs = str(tmp_path / "runs")
+    fakesynth = os.path.join(tool_path, "fakesynth")
+    open(fakesynth, "w").write(FAKESYNTH.format(runs=runs))
+    os.chmod(fakesynth, 0o755)
+
+    results = []
+    for name, verilog in (("Machine1", "module rio();\nendmodule\n"), ("Machine2", "module rio(input a);\nendmodule\n"), ("Machine3", "module rio();\nendmodule\n")):
+        gateware_path = gateware(str(tmp_path / name), tool_path, verilog=verilog)
+        results.append({"config": f"{name}.json", "name": name, "gateware_path": gateware_path, "generate": 0.1, "build": None, "status": "ok", "log": ""})
+    results.append({"config": "Firmware.json", "name": "Firmware", "gateware_path": None, "generate": 0.1, "build": None, "status": "ok", "log": ""})
+
+    cache = buildcache.BuildCache(str(tmp_path / "cache"))
+    # the folders are only hashed once
+    keys = []
+    cache_key = cache.key
+    cache.key = lambda gateware_path, target="all": keys.append(gateware_path) or cache_key(gateware_path, target)
+    batch.build_all(results, cache, make_jobs=2)
+    assert len(keys) == 3
+    assert [result["status"] for result in results] == ["built", "built", "cached", "ok"]
+    assert len(open(runs, "r").readlines()) == 2
+    assert os.path.isfile(str(tmp_path / "Machine3" / "rio.bin"))
+    assert "restored from build cache" in open(str(tmp_path / "Machine3" / "compile.log"), "r").read()
+    assert batch.report(results) is True
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import os
+import riocore
+from riocore.index import MetadataIndex
+
+
+def test_json_file(tmp_path):
+    path = str(tmp_path / "board.json")
+    index_path = str(tmp_path / "cache" / "index.json")
+    open(path, "w").write(json.dumps({"name": "Board", "pins": [1, 2, 3]}))
+
+    index = MetadataIndex(index_path)
+    assert index.json_file(path) == {"name": "Board", "pins": [1, 2, 3]}
+    index.save()
+    assert os.path.isfile(index_path)
+
+    # served from the index, a fresh copy on every call
+    index = MetadataIndex(index_path)
+    data = index.json_file(path)
+    assert data == {"name": "Board", "pins": [1, 2, 3]}
+    data["pins"].append(4)
+    assert index.json_file(path)["pins"] == [1, 2, 3]
+    assert not index.changed
+
+    # changed file
+    open(path, "w").write(json.dumps({"name": "Board2"}))
+    os.utime(path, ns=(0, 0))
+    assert index.json_file(path) == {"name": "Board2"}
+    assert index.changed
+
+
+def test_plugin_metadata(tmp_path):
+    index = MetadataIndex(str(tmp_path / "index.json"))
+    plugins = riocore.Plugins()
+    for plugin_name in ("bitin", "stepdir", "pwmout", "modbus"):
+        live = index.plugin(plugin_name)
+        index.save()
+        cached = MetadataIndex(index.path).plugin(plugin_name)
+        assert cached == live
+        assert cached["NAME"] == plugin_name
+        plugin_instance = plugins.load_plugin(0, {"type": plugin_name})
+        assert cached["OPTIONS"] == plugin_instance.OPTIONS
+        assert cached["PINDEFAULTS"] == plugin_instance.PINDEFAULTS
+    assert index.plugin("not_a_plugin") is None
+
+
+def test_plugin_files(tmp_path, monkeypatch):
+    # the metadata depends on all files of the plugin folder (i2cbus devices)
+    monkeypatch.setattr(riocore.index, "riocore_path", str(tmp_path))
+    os.makedirs(tmp_path / "plugins" / "i2cbus" / "devices" / "__pycache__")
+    open(tmp_path / "plugins" / "__init__.py", "w").write("")
+    open(tmp_path / "plugins" / "i2cbus" / "plugin.py", "w").write("")
+    open(tmp_path / "plugins" / "i2cbus" / "devices" / "lm75.py", "w").write("")
+    open(tmp_path / "plugins" / "i2cbus" / "devices" / "__pycache__" / "lm75.pyc", "w").write("")
+    assert [os.path.relpath(path, tmp_path) for path in riocore.index.plugin_files("i2cbus")] == [
+        "plugins/i2cbus/plugin.py",
+        "plugins/i2cbus/devices/lm75.py",
+        "plugins/__init__.py",
+    ]
+
+    builds = []
+    index = MetadataIndex(str(tmp_path / "index.json"))
+    assert index.entry("plugin:i2cbus", riocore.index.plugin_files("i2cbus"), lambda: builds.append(1) or len(builds)) == 1
+    assert index.entry("plugin:i2cbus", riocore.index.plugin_files("i2cbus"), lambda: builds.append(1) or len(builds)) == 1
+
+    # new device
+    open(tmp_path / "plugins" / "i2cbus" / "devices" / "as5600.py", "w").write("")
+    assert index.entry("plugin:i2cbus", riocore.index.plugin_files("i2cbus"), lambda: builds.append(1) or len(builds)) == 2
+
+
+def test_not_writable(tmp_path):
+    # the index is only a cache
+    path = str(tmp_path / "board.json")
+    open(path, "w").write("{}")
+    open(str(tmp_path / "cache"), "w").write("")
+    index = MetadataIndex(str(tmp_path / "cache" / "index.json"))
+    assert index.json_file(path) == {}
+    index.save()
+    assert MetadataIndex(index.path).json_file(path) == {}
+
+
+def test_project_modules():
+    project = riocore.Project("riocore/configs/TangPrimer25K/config.json", "tests/unit/output")
+    modules = {module["module"] for module in project.config["jdata"]["modules"]}
+    assert set(project.config["modules"]) == modules
+
+
+def test_prune(tmp_path):
+    index_path = str(tmp_path / "index.json")
+    keep = str(tmp_path / "keep.json")
+    remove = str(tmp_path / "remove.json")
+    for path in (keep, remove):
+        open(path, "w").write("{}")
+    index = MetadataIndex(index_path)
+    index.json_file(keep)
+    index.json_file(remove)
+    index.save()
+
+    # nothing rebuilt, nothing written
+    os.remove(remove)
+    index = MetadataIndex(index_path)
+    index.json_file(keep)
+    index.save()
+    assert len(json.loads(open(index_path, "r").read())["entries"]) == 2
+
+    # entries of removed files are dropped with the next save
+    open(str(tmp_path / "new.json"), "w").write("{}")
+    index.json_file(str(tmp_path / "new.json"))
+    index.save()
+    assert sorted(json.loads(open(index_path, "r").read())["entries"]) == [f"json:{keep}", f"json:{tmp_path / 'new.json'}"]
+
+
+def test_default_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert MetadataIndex().path == str(tmp_path / "riocore" / "index.json")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+#
+#
+
+import riocore
+
+
+def test_layout_cached():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    interface_data = project.get_interface_data()
+    assert interface_data is project.get_interface_data()
+
+    sizes = [entry[0] for entry in interface_data]
+    assert sizes == sorted(sizes, reverse=True)
+
+    layout = project.layout
+    for size, plugin_instance, data_name, data_config in layout.inputs:
+        assert data_config["direction"] == "input"
+    for size, plugin_instance, data_name, data_config in layout.outputs:
+        assert data_config["direction"] in {"output", "inout"}
+    assert len(layout.inputs) + len(layout.outputs) + len(layout.expansions) == len(layout)
+
+
+def test_layout_invalidate():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    buffer_size = project.buffer_size
+    assert not project.layout.multiplexed_outputs
+
+    plugin_instance = [entry[1] for entry in project.layout.outputs if entry[1].TYPE != "frameio"][0]
+    plugin_instance.plugin_setup["multiplexed"] = True
+    project.invalidate_layout()
+    assert project.layout.multiplexed_outputs
+    assert project.buffer_size != buffer_size
+    assert len(project.txdata_get()) == project.buffer_bytes
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+#
+#
+
+import threading
+
+from riocore.interfaces.MMAP.interface import Interface, Peer
+
+
+def test_mmap_transfer(tmp_path):
+    path = str(tmp_path / "rio")
+    peer = Peer(path, 16)
+    host = Interface(f"mmap:{path}:1000")
+    assert Interface.check(f"mmap:{path}")
+    assert not Interface.check("/dev/shm/rio")
+
+    def answer(frames):
+        for frame_n in range(frames):
+            txdata = peer.receive(None)
+            peer.transmit([0x61, 0x74, 0x61, 0x64] + list(reversed(txdata[4:])))
+
+    thread = threading.Thread(target=answer, args=(100,))
+    thread.start()
+    rxdata = bytearray(16)
+    for frame_n in range(100):
+        txdata = bytes([0x74, 0x69, 0x72, 0x77] + [(frame_n + n) & 0xFF for n in range(12)])
+        assert host.transfer_into(memoryview(txdata), rxdata) == 16
+        assert rxdata == b"atad" + bytes(reversed(txdata[4:]))
+    thread.join()
+    assert host.timeouts == 0
+
+
+def test_mmap_timeout(tmp_path):
+    path = str(tmp_path / "rio")
+    Peer(path, 8)
+    host = Interface(f"mmap:{path}:10")
+    assert host.transfare([1] * 8) == []
+    assert host.timeouts == 1
+
+
+def test_mmap_idle(tmp_path):
+    peer = Peer(str(tmp_path / "rio"), 8, timeout=0.01)
+    assert peer.receive(None) is None
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+#
+#
+
+import os
+
+from riocore import index
+from riocore.generator import pll
+
+
+def test_ice40():
+    # icepll -i 12 -o 48
+    setup = pll.ice40("ice40", "hx8k", 12000000, 48000000)
+    assert setup["fout"] == 48000000
+    assert setup["params"] == {"DIVR": 0, "DIVF": 63, "DIVQ": 4, "FILTER_RANGE": 1, "pad": False}
+    verilog = pll.verilog(setup)
+    assert "SB_PLL40_CORE #(" in verilog
+    assert ".DIVF(7'b0111111),\t// DIVF = 63" in verilog
+    assert ".REFERENCECLK(clock_in)" in verilog
+
+    # up5k with the pll at the clock pin
+    setup = pll.ice40("ice40", "up5k", 12000000, 30000000)
+    assert setup["fout"] == 30000000
+    assert "SB_PLL40_PAD #(" in pll.verilog(setup)
+
+    # not reachable, nearest frequency
+    setup = pll.ice40("ice40", "hx8k", 12000000, 100000000)
+    assert setup["fout"] == 100500000
+
+    # input out of range
+    assert pll.ice40("ice40", "hx8k", 5000000, 48000000) is None
+
+
+def test_ecp5():
+    # ecppll -i 25 -o 100
+    setup = pll.ecp5("ecp5", "25k", 25000000, 100000000)
+    assert setup["fout"] == 100000000
+    assert setup["params"]["CLKI_DIV"] == 1
+    assert setup["params"]["CLKFB_DIV"] == 4
+    assert setup["params"]["CLKOP_DIV"] == 6
+    assert "EHXPLLL #(" in pll.verilog(setup)
+
+
+def test_gowin():
+    setup = pll.gowin("GW1N-9C", "GW1NR-LV9QN88PC6/I5", 27000000, 100000000)
+    assert setup["fout"] == 100285714
+    assert setup["params"]["IDIV_SEL"] == 6
+    assert setup["params"]["FBDIV_SEL"] == 25
+    assert setup["params"]["ODIV_SEL"] == 4
+    assert "rPLL #(" in pll.verilog(setup)
+
+    # GW1NSR-4C (TangNano4K)
+    assert pll.gowin_device("GW1NSR-LV4CQN48PC7/I6") == "GW1NSR-4(C) C7/I6"
+    setup = pll.gowin("GW1NS-4", "GW1NSR-LV4CQN48PC7/I6", 27000000, 100000000)
+    assert setup["fout"] == 100285714
+    verilog = pll.verilog(setup)
+    assert "PLLVR #(" in verilog
+    assert ".VREN(1'b1)," in verilog
+
+    # unknown device
+    assert pll.gowin_device("GW2A-LV18PG256C8/I7") is None
+    assert pll.pll_type("GW2A-18C", "GW2A-LV18PG256C8/I7") is None
+
+
+def test_mmcm():
+    # the clocks of the Arty board
+    setup = pll.mmcm("xc7", "xc7a35ticsg324-1l", 100000000, 125000000)
+    assert setup["fout"] == 125000000
+    assert setup["params"]["DIVCLK_DIVIDE"] == 1
+    assert setup["params"]["CLKFBOUT_MULT_F"] == 10
+    assert setup["params"]["CLKOUT0_DIVIDE_F"] == 8
+    assert setup["params"]["CLKOUT1_DIVIDE"] == 40
+    verilog = pll.verilog(setup)
+    assert ".CLKFBOUT_MULT_F(10)," in verilog
+    assert ".CLKIN1_PERIOD(10.0)," in verilog
+
+    # fractional divider
+    setup = pll.mmcm("xc7", "xc7a35ticsg324-1l", 100000000, 80000000)
+    assert setup["fout"] == 80000000
+
+
+def test_altpll():
+    setup = pll.altpll("Cyclone 10 LP", "10CL025YU256C8G", 12000000, 100000000)
+    assert setup["fout"] == 100000000
+    assert setup["params"] == {"multiply_by": 25, "divide_by": 3, "period_ps": 83333}
+    assert "altpll #(" in pll.verilog(setup)
+
+
+def test_solve(tmp_path, monkeypatch):
+    metadata_index = index.MetadataIndex(str(tmp_path / "index.json"))
+    monkeypatch.setattr(pll, "metadata_index", metadata_index)
+    assert pll.solve("Trion", "T8F81", 33330000, 100000000) is None
+
+    setup = pll.solve("ice40", "up5k", 12000000, 30000000)
+    assert setup["fout"] == 30000000
+    assert "pll:ice40:up5k:12000000:30000000" in metadata_index.entries
+
+    # from the index
+    monkeypatch.setitem(pll.SOLVERS, "ice40", None)
+    assert pll.solve("ice40", "up5k", 12000000, 30000000) == setup
+
+
+def test_system_clock(tmp_path, monkeypatch):
+    monkeypatch.setattr(pll, "metadata_index", index.MetadataIndex(str(tmp_path / "index.json")))
+    config = {"jdata": {"family": "GW1N-9C", "type": "GW1NR-LV9QN88PC6/I5"}, "toolchain": "gowin", "osc_clock": 27000000, "speed": 100000000}
+    assert pll.system_clock(config) == config["pll_setup"]["fout"] == 100285714
+    assert os.path.isfile(tmp_path / "index.json")
+
+    # solved once
+    config["speed"] = 100285714
+    monkeypatch.setitem(pll.SOLVERS, "gowin", None)
+    assert pll.system_clock(config) == 100285714
+
+    setup = pll.generate(config, str(tmp_path), 27000000.0, 100285714.0)
+    assert setup == config["pll_setup"]
+    assert open(os.path.join(tmp_path, "pll.v"), "r").read() == pll.verilog(setup)
+
+    # interface designer pll
+    config = {"jdata": {"family": "Trion", "type": "T8F81"}, "toolchain": "efinity", "osc_clock": 33330000, "speed": 100000000}
+    assert pll.system_clock(config) == 100000000
+
+    # no pll, system clock from the oscillator
+    config = {"jdata": {"family": "Trion", "type": "T8F81"}, "toolchain": "efinity", "osc_clock": 33330000, "speed": 50000000}
+    assert pll.system_clock(config) == 33330000
+    assert pll.generate(config, str(tmp_path / "none"), 33330000.0, 50000000.0) is None
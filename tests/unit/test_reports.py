@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import os
+
+from riocore.generator import reports
+
+NEXTPNR_LOG = """Info: Packing constants..
+Info: Device utilisation:
+Info: 	         ICESTORM_LC:   645/ 5280    12%
+Info: 	        ICESTORM_RAM:     2/   30     6%
+Info: 	               SB_IO:    12/   96    12%
+Info: 	        ICESTORM_DSP:     0/    8     0%
+Info: 
+Info: Max frequency for clock 'sysclk_$glb_clk': 38.10 MHz (PASS at 30.00 MHz)
+Info: Routing..
+Info: Critical path report for clock 'sysclk_$glb_clk' (posedge -> posedge):
+Info: curr total
+Info:  0.5  0.5  Source rio.counter_SB_DFFE_Q_DFFLC.O
+Info:  1.2  1.7    Net counter[0] budget 4.1 ns (5,12) -> (6,12)
+Info:  0.4 27.3  Setup rio.pwm_SB_DFF_Q_DFFLC.I0
+Info: 9.5 ns logic, 17.8 ns routing
+Info: 
+Info: Max frequency for clock 'sysclk_$glb_clk': 36.63 MHz (PASS at 30.00 MHz)
+Info: Max frequency for clock 'uart1.clk': 9.20 MHz (FAIL at 10.00 MHz)
+"""
+
+VIVADO_TIMING = """Clock Summary
+-------------
+
+Clock        Waveform(ns)         Period(ns)      Frequency(MHz)
+-----        ------------         ----------      --------------
+sysclk       {0.000 5.000}        10.000          100.000
+
+
+Intra Clock Table
+-----------------
+
+Clock             WNS(ns)      TNS(ns)  TNS Failing Endpoints  TNS Total Endpoints
+-----             -------      -------  ---------------------  -------------------
+sysclk              2.000        0.000                      0                 1234
+
+
+Max Delay Paths
+--------------------------------------------------------------------------------------
+Slack (MET) :             2.000ns  (required time - arrival time)
+  Source:                 counter_reg[0]/C
+  Destination:            pwm_reg/D
+  Path Group:             sysclk
+  Data Path Delay:        7.800ns  (logic 2.100ns (26.923%)  route 5.700ns (73.077%))
+"""
+
+VIVADO_UTIL = """+----------------------------+------+-------+------------+-----------+-------+
+|          Site Type         | Used | Fixed | Prohibited | Available | Util% |
++----------------------------+------+-------+------------+-----------+-------+
+| Slice LUTs                 | 1234 |     0 |          0 |     20800 |  5.93 |
+|   LUT as Logic             | 1200 |     0 |          0 |     20800 |  5.77 |
+| Slice Registers            |  567 |     0 |          0 |     41600 |  1.36 |
+| Block RAM Tile             |    1 |     0 |          0 |        50 |  2.00 |
+| DSPs                       |    0 |     0 |          0 |        90 |  0.00 |
+| Bonded IOB                 |   40 |    40 |          0 |       210 | 19.05 |
+"""
+
+QUARTUS_STA = """+-------------------------------------------------+
+; Slow 1200mV 85C Model Fmax Summary             ;
++------------+-----------------+------------+------+
+; Fmax       ; Restricted Fmax ; Clock Name ; Note ;
++------------+-----------------+------------+------+
+; 123.44 MHz ; 123.44 MHz      ; sysclk     ;      ;
++------------+-----------------+------------+------+
+; Slow 1200mV 0C Model Fmax Summary              ;
+; 131.02 MHz ; 131.02 MHz      ; sysclk     ;      ;
+"""
+
+QUARTUS_FIT = """Fitter Status : Successful - Thu Jan  1 00:00:00 2024
+Family : MAX 10
+Total logic elements : 1,234 / 8,064 ( 15 % )
+Total registers : 567
+Total pins : 40 / 101 ( 40 % )
+Total memory bits : 0 / 387,072 ( 0 % )
+Embedded Multiplier 9-bit elements : 0 / 48 ( 0 % )
+"""
+
+GOWIN_RPT = """  ----------------------------------------------------------
+  Resources                   | Usage
+  ----------------------------------------------------------
+  Logic                       | 1234/8640  15%
+    --LUT,ALU,ROM16           | 1234(1100 LUT, 134 ALU, 0 ROM16)
+  Register                    | 567/6693  9%
+  CLS                         | 800/4320  19%
+  I/O Port                    | 20
+  BSRAM                       | 2 SDPB
+"""
+
+GOWIN_TR = """<table><tr><th>NO.</th><th>Clock Name</th><th>Constraint</th><th>Actual Fmax</th></tr>
+<tr><td>1</td><td>sysclk</td><td>27.000(MHz)</td><td>97.335(MHz)</td><td>5</td></tr>
+</table>"""
+
+
+def write_files(path, files):
+    for name, data in files.items():
+        os.makedirs(os.path.dirname(os.path.join(path, name)), exist_ok=True)
+        open(os.path.join(path, name), "w").write(data)
+    return str(path)
+
+
+def test_nextpnr(tmp_path):
+    timing = {"sysclk": 30000000, "constraints": {"uart1.clk": 8000000, "W5500_MCLK": 10000000}}
+    gateware_path = write_files(tmp_path, {"nextpnr.log": NEXTPNR_LOG, "timing.json": json.dumps(timing)})
+    report = reports.build_report(gateware_path)
+    assert report["tool"] == "nextpnr"
+    assert report["clocks"] == {"sysclk_$glb_clk": {"fmax": 36.63, "required": 30.0}, "uart1.clk": {"fmax": 9.2, "required": 10.0}}
+    assert report["utilization"] == {"lut": {"used": 645, "available": 5280}, "bram": {"used": 2, "available": 30}, "dsp": {"used": 0, "available": 8}, "io": {"used": 12, "available": 96}}
+    assert report["critical_paths"] == {"sysclk_$glb_clk": {"from": "rio.counter_SB_DFFE_Q_DFFLC.O", "to": "rio.pwm_SB_DFF_Q_DFFLC.I0", "delay_ns": 27.3}}
+    assert report["requirements"] == {"sysclk": 30.0, "uart1.clk": 8.0, "W5500_MCLK": 10.0}
+    assert report["warnings"] == ["clock not found in the timing report: W5500_MCLK"]
+    # uart1.clk meets the plugin constraint, but not the one of the toolchain
+    assert report["errors"] == ["uart1.clk: 9.20 MHz, required: 10.00 MHz"]
+    assert not report["pass"]
+    assert json.loads(open(os.path.join(gateware_path, "build_report.json"), "r").read()) == report
+    assert reports.result(gateware_path) == 1
+
+    # system clock too slow
+    timing["sysclk"] = 48000000
+    timing["constraints"] = {}
+    open(os.path.join(gateware_path, "nextpnr.log"), "w").write(NEXTPNR_LOG.replace("FAIL at 10.00", "PASS at 9.00"))
+    open(os.path.join(gateware_path, "timing.json"), "w").write(json.dumps(timing))
+    report = reports.build_report(gateware_path)
+    assert report["errors"] == ["sysclk_$glb_clk: 36.63 MHz, required: 48.00 MHz (sysclk)"]
+
+
+def test_vivado(tmp_path):
+    gateware_path = write_files(tmp_path, {"build/post_route_timing_summary.rpt": VIVADO_TIMING, "build/post_place_util.rpt": VIVADO_UTIL, "timing.json": json.dumps({"sysclk": 100000000})})
+    report = reports.build_report(gateware_path)
+    assert report["tool"] == "vivado"
+    assert report["clocks"] == {"sysclk": {"fmax": 125.0, "required": 100.0}}
+    assert report["critical_paths"] == {"sysclk": {"from": "counter_reg[0]/C", "to": "pwm_reg/D", "delay_ns": 7.8}}
+    assert report["utilization"] == {
+        "lut": {"used": 1234, "available": 20800},
+        "ff": {"used": 567, "available": 41600},
+        "bram": {"used": 1, "available": 50},
+        "dsp": {"used": 0, "available": 90},
+        "io": {"used": 40, "available": 210},
+    }
+    assert report["pass"]
+    assert reports.result(gateware_path) == 0
+
+
+def test_quartus(tmp_path):
+    gateware_path = write_files(tmp_path, {"rio.sta.rpt": QUARTUS_STA, "rio.fit.summary": QUARTUS_FIT, "timing.json": json.dumps({"sysclk": 125000000})})
+    report = reports.build_report(gateware_path)
+    assert report["clocks"] == {"sysclk": {"fmax": 123.44, "required": None}}
+    assert report["utilization"]["lut"] == {"used": 1234, "available": 8064}
+    assert report["utilization"]["ff"] == {"used": 567, "available": None}
+    assert report["utilization"]["dsp"] == {"used": 0, "available": 48}
+    assert report["errors"] == ["sysclk: 123.44 MHz, required: 125.00 MHz (sysclk)"]
+
+
+def test_gowin(tmp_path):
+    gateware_path = write_files(tmp_path, {"impl/pnr/project.rpt.txt": GOWIN_RPT, "impl/pnr/project.tr.html": GOWIN_TR, "timing.json": json.dumps({"sysclk": 27000000})})
+    report = reports.build_report(gateware_path)
+    assert report["clocks"] == {"sysclk": {"fmax": 97.335, "required": 27.0}}
+    assert report["utilization"] == {"lut": {"used": 1234, "available": 8640}, "ff": {"used": 567, "available": 6693}, "bram": {"used": 2, "available": None}, "io": {"used": 20, "available": None}}
+    assert report["pass"]
+
+
+def test_no_report(tmp_path):
+    assert reports.build_report(str(tmp_path)) is None
+    assert reports.result(str(tmp_path)) == 0
+
+
+def test_build_fails(tmp_path):
+    from riocore.generator import buildcache
+
+    gateware_path = str(tmp_path / "Gateware")
+    os.makedirs(gateware_path)
+    makefile = "all:\n\techo \"Info: Max frequency for clock 'sysclk': 20.00 MHz (PASS at 20.00 MHz)\" > nextpnr.log\n\nclean:\n\trm -f nextpnr.log\n"
+    open(os.path.join(gateware_path, "Makefile"), "w").write(makefile)
+    open(os.path.join(gateware_path, "timing.json"), "w").write(json.dumps({"sysclk": 25000000}))
+    cache = buildcache.BuildCache(str(tmp_path / "cache"))
+    assert buildcache.build(gateware_path, cache) == 1
+    assert json.loads(open(os.path.join(gateware_path, "build_report.json"), "r").read())["errors"] == ["sysclk: 20.00 MHz, required: 25.00 MHz (sysclk)"]
+    # the report comes with the cached build
+    os.remove(os.path.join(gateware_path, "build_report.json"))
+    assert buildcache.build(gateware_path, cache) == 1
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import random
+
+import pytest
+import riocore
+
+np = pytest.importorskip("numpy")
+from riocore.capture import CaptureFile  # noqa: E402
+from riocore.rxdecode import capture_frames, decode_frames  # noqa: E402
+
+
+def test_decode_frames(project_config):
+    try:
+        project = riocore.Project(project_config, "tests/unit/output")
+    except json.JSONDecodeError as error:
+        pytest.skip(f"broken json: {error}")
+    rand = random.Random(99)
+    frames = np.array([[rand.randint(0, 255) for n in range(project.buffer_bytes)] for frame_n in range(64)], dtype=np.uint8)
+    # multiplexed ids in range
+    for name, offset, byte_size, code in project.codec.rx_columns:
+        if name == "multiplexed_id":
+            frames[:, offset] %= len(project.codec.rx_mpx) + 1
+
+    columns = decode_frames(project, frames)
+    variables = [data_config["variable"] for data_config in project.codec.rx_mpx]
+    variables += [data_config["variable"] for size, plugin_instance, data_name, data_config in project.layout.inputs]
+    for frame_n, frame in enumerate(frames):
+        timestamp = project.codec.decode(bytes(frame))
+        assert columns["timestamp"][frame_n] == timestamp
+        for size, plugin_instance, data_name, data_config in project.get_interface_data():
+            if data_config["variable"] in variables:
+                value = columns[data_config["variable"]][frame_n]
+                if plugin_instance.TYPE == "frameio":
+                    value = value.tolist()
+                assert value == data_config["value"]
+
+
+def test_decode_capture_signals(tmp_path):
+    path = str(tmp_path / "frames.riocap")
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    rand = random.Random(3)
+
+    class Random:
+        def transfare(self, data):
+            return [0x61, 0x74, 0x61, 0x64] + [rand.randint(0, 255) for n in range(project.buffer_bytes - 4)]
+
+    project.connection = Random()
+    project.capture_start(path)
+    expected = []
+    for cycle_n in range(50):
+        project.cycle()
+        expected.append({signal_setup["halname"]: signal_setup["value"] for signal_name, signal_setup, interface_setup, convert in project.convert_rx_plan})
+    project.capture_stop()
+
+    capture = CaptureFile(path)
+    analysis = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    columns = decode_frames(analysis, capture_frames(capture), signals=True)
+    for frame_n, values in enumerate(expected):
+        for halname, value in values.items():
+            assert columns[halname][frame_n] == pytest.approx(value)
+    capture.close()
+
+
+def test_decode_frames_shape():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    with pytest.raises(ValueError):
+        decode_frames(project, np.zeros((3, project.buffer_bytes + 1), dtype=np.uint8))
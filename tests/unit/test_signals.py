@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+#
+#
+
+import riocore
+
+
+def test_signal_value_set():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    signals = {}
+    for plugin_instance in project.plugin_instances:
+        for signal_name, signal_config in plugin_instance.signals().items():
+            signals[signal_config["halname"]] = signal_config
+
+    project.signal_value_set("spindle-enable.bit", 1)
+    assert signals["spindle-enable.bit"]["value"] == 1
+
+    # inputs can not be set from the host
+    inputs = [halname for halname, signal_config in signals.items() if project.host_direction(signal_config) == "input"]
+    project.signal_value_set(inputs[0], 123)
+    assert signals[inputs[0]]["value"] != 123
+
+    outputs = [halname for halname, signal_config in signals.items() if project.host_direction(signal_config) == "output"]
+    project.signal_values_set({halname: num for num, halname in enumerate(outputs)})
+    for num, halname in enumerate(outputs):
+        assert signals[halname]["value"] == num
+
+
+def test_interface_value_set():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    size, plugin_instance, data_name, data_config = project.layout.outputs[-1]
+    project.interface_value_set(data_config["variable"], 1)
+    assert data_config["value"] == 1
+
+
+def test_signals_cached():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    plugin_instance = project.plugin_instances[0]
+    signals = plugin_instance.signals()
+    assert signals is plugin_instance.signals()
+    assert plugin_instance.interface_data() is plugin_instance.interface_data()
+    assert plugin_instance.pins() == plugin_instance.pins()
+
+    plugin_instance.plugin_setup["name"] = "renamed"
+    plugin_instance.invalidate()
+    for signal_name, signal_config in plugin_instance.signals().items():
+        assert signal_config["halname"] == f"renamed.{signal_name}"
+    assert plugin_instance.title == "renamed"
+
+
+def test_conversion_plan():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    for num, (halname, signal_configs) in enumerate(project.signal_index.items()):
+        project.signal_value_set(halname, num + 1)
+
+    for plugin_instance in project.plugin_instances:
+        plugin_instance.convert2interface()
+    expected = [data_config["value"] for size, plugin_instance, data_name, data_config in project.layout.outputs]
+    for size, plugin_instance, data_name, data_config in project.layout.outputs:
+        if plugin_instance.TYPE != "frameio":
+            data_config["value"] = None
+    project.convert2interface()
+    assert [data_config["value"] for size, plugin_instance, data_name, data_config in project.layout.outputs] == expected
+
+    for num, (size, plugin_instance, data_name, data_config) in enumerate(project.layout.inputs):
+        if plugin_instance.TYPE == "frameio":
+            data_config["value"] = [0] * ((size + 7) // 8)
+        else:
+            data_config["value"] = num + 1
+    project.convert2signals()
+    for size, plugin_instance, data_name, data_config in project.layout.inputs:
+        signal_config = plugin_instance.signals().get(data_name)
+        if plugin_instance.TYPE != "frameio" and signal_config:
+            assert signal_config["value"] == plugin_instance.convert(data_name, signal_config, data_config["value"])
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import subprocess
+import sys
+
+import riocore
+
+# seconds, about 5x of a slow machine
+IMPORT_BUDGET = 0.5
+PROJECT_BUDGET = 0.5
+
+STARTUP = """
+import contextlib
+import json
+import os
+import sys
+import time
+
+start = time.perf_counter()
+import riocore
+
+imported = time.perf_counter()
+with contextlib.redirect_stdout(open(os.devnull, "w")):
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    project.txdata_get()
+loaded = time.perf_counter()
+print(json.dumps({"import": imported - start, "project": loaded - imported, "modules": sorted(sys.modules)}))
+"""
+
+
+def startup():
+    return json.loads(subprocess.check_output([sys.executable, "-c", STARTUP]))
+
+
+def test_startup_runtime_only():
+    result = startup()
+    for module in result["modules"]:
+        assert not module.startswith("riocore.generator")
+        assert module.split(".")[0] not in {"asyncio", "lxml", "PyQt5"}
+    assert result["import"] < IMPORT_BUDGET
+    assert result["project"] < PROJECT_BUDGET
+
+
+def test_generator_lazy():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    assert project.generators == {}
+    linuxcnc = project.generator_linuxcnc
+    assert project.generator_linuxcnc is linuxcnc
+    assert list(project.generators) == ["LinuxCNC"]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+#
+#
+
+import json
+import random
+
+import riocore
+from riocore.stats import Histogram
+
+
+def test_histogram():
+    histogram = Histogram()
+    rand = random.Random(7)
+    values = sorted(rand.randint(0, 10000000) for n in range(10000))
+    for value in values:
+        histogram.record(value)
+    assert histogram.count == len(values)
+    assert histogram.min == values[0]
+    assert histogram.max == values[-1]
+    for percent in (50, 90, 99):
+        exact = values[int(len(values) * percent / 100) - 1]
+        assert abs(histogram.percentile(percent) - exact) <= exact / 16
+    for value in (0, 1, 63, 64, 65, 127, 128, 1000, 123456789):
+        index = histogram.index(value)
+        assert histogram.value(index) >= value
+        assert histogram.index(histogram.value(index)) == index
+
+
+class Link:
+    # replies from a list, [] for a timeout
+    def __init__(self, replies):
+        self.replies = replies
+
+    def transfare(self, data):
+        return self.replies.pop(0)
+
+
+def test_link_stats(tmp_path):
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    stats = project.stats_enable(0.001)
+    frame = [0x61, 0x74, 0x61, 0x64] + [0] * (project.buffer_bytes - 4)
+    project.connection = Link([frame, [], frame[0:-1], [0] * project.buffer_bytes, frame])
+    for cycle_n in range(5):
+        project.cycle()
+    assert (stats.cycles, stats.timeouts, stats.wrong_size, stats.bad_header) == (5, 1, 1, 1)
+    assert stats.cycle.count == 5
+    assert stats.jitter.count == 4
+    assert stats.cpu is None
+
+    path = tmp_path / "stats.json"
+    stats.dump(str(path))
+    data = json.loads(path.read_text())
+    assert data["cycles"] == 5
+    assert data["latency_us"]["transfer"]["count"] == 5
+
+    stats = project.stats_enable(cpu=True)
+    project.connection = Link([frame] * 10)
+    for cycle_n in range(10):
+        project.cycle()
+    assert set(stats.cpu) == {"encode", "transfer", "decode"}
+    assert stats.cpu["encode"] > 0
+
+
+def test_link_drift():
+    project = riocore.Project("tests/unit/data/config1.json", "tests/unit/output")
+    stats = project.stats_enable()
+    speed = project.config["speed"]
+    # fpga clock 100ppm fast, the 32bit timestamp wraps during the test
+    for step in range(2000):
+        host = step * 0.05
+        ticks = int(host * speed * 1.0001) & 0xFFFFFFFF
+        stats.clock(int(host * 1000000000), ticks / speed)
+    assert abs(stats.drift_ppm() - 100.0) < 1.0
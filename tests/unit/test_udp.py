@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+#
+#
+
+import socket
+import threading
+
+from riocore.interfaces.UDP.interface import Interface
+
+
+def free_port():
+    sock = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+    sock.bind(("127.0.0.1", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def test_udp_sequence():
+    port = free_port()
+    peer = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", port))
+    assert Interface.check(f"127.0.0.1:{port}:20000:seq")
+    host = Interface(f"127.0.0.1:{port}:20000:seq")
+
+    # actions per request: reply, reply twice, no reply (answered late with the next request)
+    actions = ["reply", "duplicate", "reply", "drop", "reply", "reply"]
+
+    def answer():
+        late = None
+        for action in actions:
+            data, address = peer.recvfrom(1000)
+            reply = b"at" + data[2:4] + bytes(reversed(data[4:]))
+            if late:
+                peer.sendto(late, address)
+                late = None
+            if action == "drop":
+                late = reply
+                continue
+            peer.sendto(reply, address)
+            if action == "duplicate":
+                peer.sendto(reply, address)
+
+    thread = threading.Thread(target=answer)
+    thread.start()
+    results = []
+    for frame_n in range(len(actions)):
+        txdata = bytes([0x74, 0x69, 0x72, 0x77, frame_n, 1, 2, 3])
+        rxdata = bytearray(8)
+        length = host.transfer_into(txdata, rxdata)
+        results.append(length)
+        if length:
+            assert rxdata == b"atad" + bytes([3, 2, 1, frame_n])
+    thread.join()
+    peer.close()
+
+    assert results == [8, 8, 8, 0, 8, 8]
+    assert (host.lost, host.late, host.duplicate) == (1, 1, 1)
+    assert (host.pkg_out, host.pkg_in) == (6, 5)
+
+
+def test_udp_plain():
+    port = free_port()
+    peer = socket.socket(family=socket.AF_INET, type=socket.SOCK_DGRAM)
+    peer.bind(("127.0.0.1", port))
+    host = Interface(f"127.0.0.1:{port}:20000")
+
+    def answer():
+        data, address = peer.recvfrom(1000)
+        peer.sendto(b"atad" + data[4:], address)
+
+    thread = threading.Thread(target=answer)
+    thread.start()
+    assert host.transfare([0x74, 0x69, 0x72, 0x77, 1, 2]) == [0x61, 0x74, 0x61, 0x64, 1, 2]
+    thread.join()
+    assert host.transfare([0x74, 0x69, 0x72, 0x77, 1, 2]) == []
+    assert host.lost == 1
+    peer.close()